@@ -4,6 +4,7 @@ in pkgs.mkShell {
   packages = [
     (pkgs.python3.withPackages (python-pkgs: [
       python-pkgs.tkinter
+      python-pkgs.numpy
     ]))
   ];
 }
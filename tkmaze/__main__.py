@@ -8,19 +8,27 @@ Um das Program zu starten, führe dieses Modul mit python3 aus.
 https://github.com/estr4/tkmaze
 """
 
+import argparse
 import os
+import sys
 import tkinter as tk
 from threading import Thread
-from .cell import Cell
 from .maze import Maze
 from .render import Raycaster
+from .export import write_grid, export_maze
+from . import storage
+from .maze import GENERATORS
+from .solve import Solver
+from .backend import BACKENDS
+from .world import ChunkedWorld
+from .regenerate import Regenerator
 
-def console(maze):
+def console(regenerator):
     """
     console erzeugt Python-Shell Output.
 
     Args:
-        maze (Maze): Das Labyrinth.
+        regenerator (Regenerator): kennt das angezeigte Labyrinth und generiert neue.
     """
     print("Wilkommen zu tkMaze, einem 3d Labyrinth Generator!")
     while True:
@@ -30,45 +38,142 @@ def console(maze):
                      |  [1] Gebe das Labyrinth as ASCII-Bild an
                      |  [2] Gebe das Labyrinth als liste an
                      |  [3] Beende das Program
+                     |  [4] Exportiere das Labyrinth in eine Datei (.txt, .csv, .grid, .tkmz)
+                     |  [5] Löse das Labyrinth vom Start (2) zum Ende (3)
+                     |  [6] Generiere ein neues Labyrinth im Hintergrund
                      ╰–> """))
+        # das Fenster kann das Labyrinth inzwischen ausgetauscht haben
+        maze = regenerator.maze
         match user:
             case 1:
                 print(maze)
             case 2:
-                for row in list(maze):
-                    print(row)
+                # schreibt Reihe für Reihe, ohne das Labyrinth als Liste aufzubauen
+                write_grid(maze.iter_rows(), maze.grid_width, sys.stdout)
             case 3:
                 os._exit(0) # schließt alle prozesse
+            case 4:
+                path = input("Dateiname: ")
+                try:
+                    export_maze(maze, path)
+                except (ValueError, OSError) as error:
+                    print(f"Export fehlgeschlagen: {error}")
+            case 5:
+                path = Solver(maze).path()
+                print(f"Lösungsweg mit {len(path)} Zellen:")
+                print(" -> ".join(f"({x}, {y})" for x, y in path))
+            case 6:
+                size = input("Größe als 'x y' (leer für die gleiche Größe): ").split()
+                algorithm = input("Algorithmus (leer für den gleichen): ").strip()
+                try:
+                    width, height = map(int, size) if size else (None, None)
+                    regenerator.request(width, height, algorithm or None)
+                except ValueError as error:
+                    print(f"Generierung nicht möglich: {error}")
+                    continue
+                print("Das neue Labyrinth erscheint im Fenster, sobald es fertig ist.")
             case _:
                 print("Ungültige Eingabe!")
 
-def window(maze):
+def window(maze, options=None, animation=None):
     """
     window erzeugt tkinter Output.
 
     Args:
         maze (Maze): Das Labyrinth.
+        options (dict): weitere Argumente für den Raycaster, z.B. engine oder backend.
+        animation (tuple(generator, int)): Schritte einer Generierung und Schritte pro Bild.
     """
     # initialisiert tkinter
     root = tk.Tk()
     root.title("tkmaze")
 
     # initialisiert den Raycaster
-    r = Raycaster(maze, root)
+    r = Raycaster(maze, root, **(options or {}))
+    if animation is not None:
+        r.animate(*animation)
     r.run()
 
 if __name__ == "__main__":
     # dieser codeblock wird ausgefürt, wenn das programm gestartet wird
-    m = Maze(5,6) # initialisiert ein labyrinth mit x * y zellen
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze", description="3d Labyrinth in tkinter")
+    parser.add_argument("--size", type=int, nargs=2, default=(5, 6), metavar=("X", "Y"),
+                        help="Anzahl der Zellen des Labyrinths")
+    parser.add_argument("--algorithm", choices=GENERATORS, default="dfs")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--load", metavar="DATEI", help="lädt ein gespeichertes .tkmz Labyrinth")
+    parser.add_argument("--save", metavar="DATEI", help="speichert das Labyrinth als .tkmz")
+    parser.add_argument("--engine", choices=("python", "numpy", "parallel"), default="python")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Anzahl der Prozesse für --engine parallel")
+    parser.add_argument("--backend", choices=BACKENDS, default="line")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--hud", action="store_true", help="zeigt Bildzeiten im Fenster an")
+    parser.add_argument("--stats", metavar="DATEI", help="speichert Bildzeiten beim Schließen")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="senkt die Auflösung, damit --fps gehalten wird")
+    parser.add_argument("--min-scale", type=float, default=0.25,
+                        help="kleinster Anteil der Spalten mit eigenem Strahl")
+    parser.add_argument("--skip", action="store_true",
+                        help="überspringt leere Bereiche beim Raycasting")
+    parser.add_argument("--max-distance", type=float, default=None,
+                        help="Sichtweite in Feldern, dahinter liegt Nebel")
+    parser.add_argument("--minimap", action="store_true",
+                        help="zeigt eine Übersichtskarte mit Nebel über unbekannten Feldern")
+    parser.add_argument("--animate", type=int, metavar="SCHRITTE",
+                        help="zeigt die Generierung mit SCHRITTE Schritten pro Bild an")
+    parser.add_argument("--world", type=int, metavar="KACHEL",
+                        help="unendliche Welt aus Kacheln mit KACHEL * KACHEL Zellen")
+    args = parser.parse_args()
+
+    if args.skip and args.engine != "python":
+        parser.error("--skip gibt es nur mit --engine python")
+
+    window_options = {
+        "engine": args.engine,
+        "backend": args.backend,
+        "fps": args.fps,
+        "hud": args.hud,
+        "stats_file": args.stats,
+        "adaptive": args.adaptive,
+        "min_scale": args.min_scale,
+        "skip": args.skip,
+        "max_distance": args.max_distance,
+        "workers": args.workers,
+        "minimap": args.minimap,
+    }
+    if args.world:
+        if args.minimap:
+            parser.error("--minimap braucht ein endliches Labyrinth, nicht --world")
+        # die unendliche Welt hat keine Konsole, weil sie nicht als Ganzes existiert
+        seed = 0 if args.seed is None else args.seed
+        window(ChunkedWorld(args.world, seed, algorithm=args.algorithm), window_options)
+        sys.exit(0)
 
-    # generiert das Labyrinth (rekursiv oder iterativ)
-    m.generate_dfs_iterative(m.grid[0][0])
-    #m.generate_dfs_recursive(m.grid[0][0])
+    animation = None
+    if args.animate:
+        if args.load or args.save:
+            parser.error("--animate kann nicht mit --load oder --save benutzt werden")
+        m = Maze(*args.size)
+        # die Generierung läuft im Fenster, ein Bild nach dem anderen
+        animation = (m.generate_steps(args.algorithm, args.seed), args.animate)
+    elif args.load:
+        # öffnet das Labyrinth mit mmap, die Wände werden erst beim Zugriff gelesen
+        m = storage.load(args.load)
+    else:
+        m = Maze(*args.size) # initialisiert ein labyrinth mit x * y zellen
+        # generiert das Labyrinth (rekursiv, iterativ oder mit Ellers Algorithmus)
+        m.generate(args.algorithm, args.seed)
+    if args.save:
+        storage.save(m, args.save)
 
+    # Konsole und Taste "n" generieren neue Labyrinthe in einem Worker-Prozess
+    regenerator = Regenerator(m, args.algorithm, args.skip)
+    window_options["regenerator"] = regenerator
 
     # initialisiert 2 threads, damit die shell und das fenster voneinander unabhängig sind
-    c = Thread(target=console, args=(m,))
-    w = Thread(target=window, args=(m,))
+    c = Thread(target=console, args=(regenerator,))
+    w = Thread(target=window, args=(m, window_options, animation))
 
     # startet die threads
     c.start()
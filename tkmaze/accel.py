@@ -0,0 +1,218 @@
+"""src/accel.py
+
+Enthält die SkipMap Class, mit der ein Strahl leere Gänge von map_data überspringt.
+
+Für jedes Feld wird in alle 4 Richtungen gespeichert, wie viele leere Felder bis zur
+nächsten Wand folgen. Ein Strahl, der mehrere Schritte entlang einer Achse macht, bevor er
+die andere Achse kreuzt, kann diese Schritte damit auf einmal machen.
+
+Mit NumPy werden die Längen für das ganze Gitter auf einmal berechnet, ohne NumPy Reihe
+für Reihe in Python. Ändert sich ein Feld, wird nur der Abschnitt seiner Reihe und seiner
+Spalte zwischen den nächsten Wänden neu berechnet.
+
+Ein Quadrat um das Feld (Schachbrett-Abstand zur nächsten Wand) hilft hier nicht, weil
+in map_data an jeder Ecke zwischen 4 Zellen eine Wand steht und kein Quadrat größer als
+ein Feld leer ist. Gänge dagegen sind oft lang.
+"""
+
+# größte gespeicherte Länge, damit eine Länge in ein Byte passt
+MAX_RUN = 255
+
+# ungefähre Anzahl Felder, die NumPy auf einmal bearbeitet, begrenzt den Speicher großer Gitter
+BLOCK_FIELDS = 1 << 22
+
+def runs_forward(values) -> bytearray:
+    """
+    runs_forward zählt für jedes Feld die leeren Felder, die danach bis zur nächsten Wand folgen.
+
+    Args:
+        values ([int]): eine Reihe oder Spalte von map_data, > 0 ist eine Wand.
+
+    Returns:
+        bytearray: Anzahl leerer Felder nach jedem Feld, höchstens MAX_RUN.
+    """
+    runs = bytearray(len(values))
+    run = 0
+    for i in range(len(values) - 1, 0, -1):
+        run = 0 if values[i] > 0 else min(run + 1, MAX_RUN)
+        runs[i - 1] = run
+    return runs
+
+def line_runs(walls) -> tuple:
+    """
+    line_runs zählt mit NumPy die leeren Felder bis zur nächsten Wand, entlang jeder Reihe.
+
+    Args:
+        walls (ndarray): 2d bool Array, True ist eine Wand.
+
+    Returns:
+        tuple(ndarray, ndarray): Anzahl leerer Felder vor und nach jedem Feld als uint8,
+        höchstens MAX_RUN.
+    """
+    import numpy as np # wird nur beim Bauen gebraucht
+    length = walls.shape[1]
+    index = np.arange(length, dtype=np.int32)
+    # erste Wand ab jedem Feld, length wenn keine mehr folgt
+    after = np.where(walls, index, length)
+    after = np.minimum.accumulate(after[:, ::-1], axis=1)[:, ::-1]
+    forward = np.zeros(walls.shape, dtype=np.int32)
+    forward[:, :-1] = after[:, 1:] - index[:-1] - 1
+    # letzte Wand bis zu jedem Feld, -1 wenn keine davor liegt
+    before = np.where(walls, index, -1)
+    np.maximum.accumulate(before, axis=1, out=before)
+    backward = np.zeros(walls.shape, dtype=np.int32)
+    backward[:, 1:] = index[1:] - before[:, :-1] - 1
+    return (np.minimum(backward, MAX_RUN).astype(np.uint8),
+            np.minimum(forward, MAX_RUN).astype(np.uint8))
+
+def refill(values, backward, forward, pos):
+    """
+    refill berechnet die Längen im Abschnitt um ein geändertes Feld bis zu den nächsten Wänden neu.
+
+    Felder hinter diesen Wänden sehen das geänderte Feld nicht und bleiben, wie sie sind.
+
+    Args:
+        values ([int]): eine Reihe oder Spalte von map_data, > 0 ist eine Wand.
+        backward ([int]): Längen in Richtung kleinerer Indizes, werden geändert.
+        forward ([int]): Längen in Richtung größerer Indizes, werden geändert.
+        pos (int): Index des geänderten Feldes.
+    """
+    length = len(values)
+    low = pos - 1
+    while low >= 0 and values[low] == 0:
+        low -= 1
+    high = pos + 1
+    while high < length and values[high] == 0:
+        high += 1
+    # low und high sind die nächsten Wände, oder -1 und length am Rand
+    run = 0
+    for i in range(high - 1, max(low, 0) - 1, -1):
+        forward[i] = run
+        run = 0 if values[i] > 0 else min(run + 1, MAX_RUN)
+    run = 0
+    for i in range(low + 1, min(high, length - 1) + 1):
+        backward[i] = run
+        run = 0 if values[i] > 0 else min(run + 1, MAX_RUN)
+
+class Column:
+    """
+    Class, die eine Spalte aus Reihen wie eine Liste liest und schreibt.
+
+    Attributes:
+        rows ([[int]]): die Reihen.
+        col (int): Index der Spalte.
+    """
+    def __init__(self, rows, col):
+        """
+        __init__ wird aufgerufen, wenn eine Column Initialisiert wird.
+
+        Args:
+            rows ([[int]]): die Reihen.
+            col (int): Index der Spalte.
+        """
+        self.rows = rows
+        self.col = col
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, row) -> int:
+        return self.rows[row][self.col]
+
+    def __setitem__(self, row, value):
+        self.rows[row][self.col] = value
+
+class SkipMap:
+    """
+    Class, die für jedes Feld von map_data die Länge der leeren Gänge in alle 4 Richtungen speichert.
+
+    Attributes:
+        runs ([[[bytearray]]]): runs[achse][richtung][reihe][spalte], Achse 0 für Reihen-Index
+            und 1 für Spalten-Index von map_data, Richtung 0 für kleinere und 1 für größere Indizes.
+    """
+    def __init__(self, map_data):
+        """
+        __init__ wird aufgerufen, wenn eine SkipMap Initialisiert wird.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen
+                oder eine zweidimensionale memoryview wie Maze.raster_view().
+        """
+        self.runs = None
+        self.update(map_data)
+
+    def update(self, map_data):
+        """
+        update berechnet die Längen neu, z.B. nachdem sich map_data geändert hat.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen
+                oder eine zweidimensionale memoryview wie Maze.raster_view().
+        """
+        try:
+            import numpy as np # optional, ohne NumPy wird in Python gezählt
+        except ImportError:
+            self.update_python(map_data)
+            return
+        if isinstance(map_data, memoryview):
+            grid = np.asarray(map_data, dtype=np.uint8)
+        else:
+            rows = [bytes(row) for row in map_data]
+            grid = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), -1)
+        height, width = grid.shape
+        up, down, left, right = (np.empty(grid.shape, dtype=np.uint8) for _ in range(4))
+
+        # in Blöcken, damit die int32 Zwischenwerte großer Gitter nicht den Speicher füllen
+        block = max(1, BLOCK_FIELDS // max(width, 1))
+        for top in range(0, height, block):
+            left[top:top + block], right[top:top + block] = line_runs(grid[top:top + block] > 0)
+        block = max(1, BLOCK_FIELDS // max(height, 1))
+        for first in range(0, width, block):
+            # eine Spalte ist eine Reihe des transponierten Gitters
+            backward, forward = line_runs((grid[:, first:first + block] > 0).T)
+            up[:, first:first + block] = backward.T
+            down[:, first:first + block] = forward.T
+
+        # Reihen als bytearray, weil perform_dda_skip einzelne Felder schneller daraus liest
+        self.runs = [[[bytearray(row) for row in up], [bytearray(row) for row in down]],
+                     [[bytearray(row) for row in left], [bytearray(row) for row in right]]]
+
+    def update_python(self, map_data):
+        """
+        update_python berechnet die Längen ohne NumPy, Reihe für Reihe und Spalte für Spalte.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen.
+        """
+        rows = [list(row) for row in map_data]
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+
+        # entlang einer Reihe (Achse 1), nach rechts und nach links
+        right = [runs_forward(row) for row in rows]
+        left = [runs_forward(row[::-1])[::-1] for row in rows]
+
+        # entlang einer Spalte (Achse 0), nach unten und nach oben
+        down = [bytearray(width) for _ in range(height)]
+        up = [bytearray(width) for _ in range(height)]
+        for c in range(width):
+            column = [row[c] for row in rows]
+            for r, run in enumerate(runs_forward(column)):
+                down[r][c] = run
+            for r, run in enumerate(runs_forward(column[::-1])[::-1]):
+                up[r][c] = run
+
+        self.runs = [[up, down], [left, right]]
+
+    def update_cell(self, map_data, row, col):
+        """
+        update_cell berechnet nur die Abschnitte der Reihe und Spalte eines geänderten Feldes neu.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen.
+            row (int): Reihe des geänderten Feldes.
+            col (int): Spalte des geänderten Feldes.
+        """
+        (up, down), (left, right) = self.runs
+        refill(map_data[row], left[row], right[row], col)
+        refill(Column(map_data, col), Column(up, col), Column(down, col), row)
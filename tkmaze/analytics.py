@@ -0,0 +1,731 @@
+"""src/analytics.py
+
+Enthält die Auswertung eines Labyrinths: Durchmesser, Sackgassen, Kreuzungen, Gänge und Lösungsweg.
+
+Die Wand-Masken werden in einem Durchgang in eine CSR-Struktur umgewandelt, für jede Zelle
+liegen ihre Nachbarn in indices[indptr[i]:indptr[i + 1]], in der Reihenfolge Norden,
+Süden, Osten, Westen. Jeder Eintrag ist eine Kante in eine Richtung (Halbkante).
+
+Ein perfektes Labyrinth ist ein Baum. Dann hat jede Halbkante eine Nachfolgerin in der
+Euler-Tour (der Weg einer Tiefensuche, jeder Durchgang hin und zurück), und die Stelle jeder
+Halbkante in der Tour wird mit Linealen bestimmt, ohne Python-Schleife über die Zellen.
+Über die Tour sind Tiefen, Lösungsweg, Durchmesser und Gänge nur noch Summen, Vergleiche und
+cumsum über Arrays.
+
+Hat das Labyrinth Schleifen oder getrennte Teile, werden die Zellen mit genau 2 offenen
+Seiten (Gänge) gleichzeitig abgelaufen und jeder Gang zu einer gewichteten Kante zwischen
+Sackgassen, Kreuzungen, Start und Ziel zusammengefasst. Die Breitensuchen laufen dann über
+diese Knoten, breite Fronten mit NumPy, schmale Fronten mit einer Python-Schleife.
+
+NumPy wird nur von diesem Modul gebraucht, wie von engine.py und simulate.py.
+`python3 -m tkmaze.analytics labyrinthe/ --workers 4`
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+import numpy as np
+from .cell import NORTH, SOUTH, EAST, WEST
+from .maze import Maze, GENERATORS
+from . import storage
+
+# Bit jeder Richtung in der Reihenfolge der Nachbarn
+BITS = (NORTH, SOUTH, EAST, WEST)
+
+# Wand-Maske -> 4 Bytes, eines pro Richtung, 1 wenn die Seite offen ist
+OPEN_SIDES = np.array([sum(1 << 8 * d for d, bit in enumerate(BITS) if not mask & bit)
+                       for mask in range(256)], dtype="<u4")
+
+# Wand-Maske -> Anzahl offener Seiten
+DEGREES = np.array([sum(not mask & bit for bit in BITS) for mask in range(256)], dtype=np.uint8)
+
+OPPOSITE = (1, 0, 3, 2)
+
+def arrival_tables() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    arrival_tables bestimmt für eine Halbkante, die in Richtung d in eine Zelle mit Wand-Maske m
+    führt, wo die Gegen-Halbkante und die nächste Halbkante unter den Halbkanten der Zelle liegen.
+
+    Returns:
+        tuple(ndarray, ndarray, ndarray): Stelle der Gegen-Halbkante, Stelle der nächsten
+        Halbkante danach (im Kreis) und ob es die Gegen-Seite gibt, Index ist m * 4 + d.
+    """
+    twin = np.zeros(1024, dtype=np.int32)
+    following = np.zeros(1024, dtype=np.int32)
+    present = np.zeros(1024, dtype=bool)
+    for mask in range(256):
+        sides = [side for side, bit in enumerate(BITS) if not mask & bit]
+        for direction in range(4):
+            back = OPPOSITE[direction]
+            if back in sides:
+                rank = sides.index(back)
+                twin[mask * 4 + direction] = rank
+                following[mask * 4 + direction] = (rank + 1) % len(sides)
+                present[mask * 4 + direction] = True
+    return twin, following, present
+
+TWIN_RANK, NEXT_RANK, HAS_TWIN = arrival_tables()
+
+# jede so vielte Halbkante ist ein Lineal, an dem die Läufer der Tour anhalten
+RULER_SPACING = 256
+
+# ab so vielen Knoten wird ein Eimer der Distanz-Suche mit NumPy statt in Python abgearbeitet
+WIDE_FRONT = 64
+
+def wall_array(maze) -> np.ndarray:
+    """
+    wall_array gibt die Wand-Masken eines Labyrinths als uint8 Array wieder.
+
+    Args:
+        maze (Maze): Das Labyrinth.
+
+    Returns:
+        ndarray: 4-Bit Wand-Maske jeder Zelle mit geschlossenem Rand, Index ist
+            y * grid_width + x.
+    """
+    # offene Außenwände würden Halbkanten zu -1 oder in die nächste Reihe ergeben
+    return np.frombuffer(maze.closed_walls(), dtype=np.uint8)
+
+class MazeGraph:
+    """
+    Class, die die Durchgänge eines Labyrinths als CSR-Struktur speichert.
+
+    Attributes:
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        degree (ndarray): Anzahl offener Seiten jeder Zelle.
+        indptr (ndarray): erste Halbkante jeder Zelle, indptr[-1] ist die Anzahl der Halbkanten.
+        indices (ndarray): Ziel-Zelle jeder Halbkante.
+        sides (ndarray): Richtung jeder Halbkante, Index in BITS.
+        walls (ndarray): Wand-Maske jeder Zelle.
+    """
+    def __init__(self, maze):
+        """
+        __init__ wird aufgerufen, wenn ein MazeGraph Initialisiert wird.
+
+        Args:
+            maze (Maze): Das Labyrinth.
+        """
+        self.width = maze.grid_width
+        self.height = maze.grid_height
+        walls = self.walls = wall_array(maze)
+        self.degree = DEGREES[walls]
+        self.indptr = np.zeros(len(walls) + 1, dtype=np.int64)
+        np.cumsum(self.degree, out=self.indptr[1:])
+
+        # die offenen Seiten aller Zellen hintereinander sind die Halbkanten in CSR-Reihenfolge
+        slots = np.flatnonzero(OPEN_SIDES[walls].view(np.uint8))
+        if len(slots) and slots[-1] < 1 << 31:
+            # int32 halbiert den Speicher, den jeder weitere Schritt liest
+            slots = slots.astype(np.int32)
+        self.sides = (slots & 3).astype(np.uint8)
+        slots >>= 2
+        slots += np.array((-self.width, self.width, 1, -1), dtype=slots.dtype)[self.sides]
+        self.indices = slots.astype(np.int32, copy=False)
+
+    @property
+    def cells(self) -> int:
+        """
+        cells gibt die Anzahl der Zellen wieder.
+
+        Returns:
+            int: grid_width * grid_height.
+        """
+        return len(self.degree)
+
+    def position(self, index) -> tuple[int, int]:
+        """
+        position wandelt einen Index in maze.walls in x und y einer Zelle um.
+
+        Args:
+            index (int): Index der Zelle.
+
+        Returns:
+            tuple(int, int): x und y koordinate der Zelle.
+        """
+        return int(index) % self.width, int(index) // self.width
+
+def expand(indptr, nodes) -> np.ndarray:
+    """
+    expand gibt alle Halbkanten mehrerer Knoten einer CSR-Struktur auf einmal wieder.
+
+    Args:
+        indptr (ndarray): erste Halbkante jedes Knotens.
+        nodes (ndarray): Knoten, deren Halbkanten gebraucht werden.
+
+    Returns:
+        ndarray: Halbkanten, Knoten für Knoten in der Reihenfolge von nodes.
+    """
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    ends = np.cumsum(counts)
+    # jede Halbkante = Beginn ihres Knotens + Abstand zum Beginn seines Blocks
+    return np.repeat(starts - ends + counts, counts) + np.arange(ends[-1] if len(ends) else 0)
+
+def rank(successor, first, spacing=RULER_SPACING) -> tuple[np.ndarray, int]:
+    """
+    rank bestimmt die Stelle jedes Elements in der Kette first, successor[first], ...
+
+    Jedes spacing-te Element ab first ist ein Lineal. Von allen Linealen läuft gleichzeitig
+    ein Läufer los, bis er das nächste Lineal erreicht. Jede Runde merkt sich, wo die Läufer
+    stehen und welche weiterlaufen. Danach werden nur die Lineale in Python
+    aneinandergereiht und jede Runde trägt ihre Stellen ein. Jedes Element wird einmal besucht, die Anzahl der Runden ist der größte
+    Abstand zwischen zwei Linealen.
+
+    Args:
+        successor (ndarray): nächstes Element jedes Elements, eine Permutation.
+        first (int): erstes Element, bekommt die Stelle 0.
+        spacing (int): Abstand der Lineale in successor.
+
+    Returns:
+        tuple(ndarray, int): Stelle jedes Elements und Länge der Kette bis zurück zu first.
+        Die Stellen sind nur gültig, wenn die Länge len(successor) ist.
+    """
+    count = len(successor)
+    # die Lineale liegen im Abstand spacing ab first, ihre Nummer ist element // spacing
+    phase = first % spacing
+    rulers = np.arange(phase, count, spacing, dtype=np.int32)
+    next_ruler = np.empty(len(rulers), dtype=np.int32)
+    gap = np.empty(len(rulers), dtype=np.int32)
+
+    walkers = np.arange(len(rulers), dtype=np.int32)
+    current = rulers
+    rounds = []
+    while walkers.size:
+        current = successor[current]
+        stop = current % spacing == phase
+        walking = None
+        if stop.any():
+            done = walkers[stop]
+            next_ruler[done] = current[stop] // spacing
+            gap[done] = len(rounds) + 1
+            walking = ~stop
+            walkers, current = walkers[walking], current[walking]
+        # die Maske braucht ein Byte pro Läufer, die Nummern der Läufer vier
+        rounds.append((current, walking))
+
+    # es gibt nur count / spacing Lineale, die Python-Schleife ist kurz
+    next_list, gap_list = next_ruler.tolist(), gap.tolist()
+    ruler_pos = [0] * len(rulers)
+    ruler = start = first // spacing
+    length = 0
+    while True:
+        ruler_pos[ruler] = length
+        length += gap_list[ruler]
+        ruler = next_list[ruler]
+        if ruler == start:
+            break
+    ruler_pos = np.array(ruler_pos, dtype=np.int32)
+    positions = np.empty(count, dtype=np.int32)
+    positions[rulers] = ruler_pos
+    # die Läufer bleiben beim Aussortieren in derselben Reihenfolge wie beim Laufen
+    owners = ruler_pos
+    for step, (elements, walking) in enumerate(rounds, 1):
+        if walking is not None:
+            owners = owners[walking]
+        positions[elements] = owners + step
+    return positions, length
+
+class EulerTour:
+    """
+    Class, die die Euler-Tour eines MazeGraph von einer Zelle aus berechnet.
+
+    Die Nachfolgerin der Halbkante u -> v ist die Halbkante von v, die in der Reihenfolge der
+    Seiten von v nach v -> u kommt. In einem Baum ergibt das eine einzige Kette durch alle
+    Halbkanten, wie eine Tiefensuche: jede Halbkante nach unten kommt vor ihrer Gegen-Halbkante.
+
+    Attributes:
+        graph (MazeGraph): Der ganze Graph.
+        root (int): Zelle, an der die Tour beginnt.
+        complete (bool): True, wenn die Tour alle Halbkanten erreicht, also der Graph ein Baum ist.
+        pos (ndarray): Stelle jeder Halbkante in der Tour, None wenn complete False ist.
+        twin_pos (ndarray): Stelle der Gegen-Halbkante jeder Halbkante.
+    """
+    def __init__(self, graph, root):
+        """
+        __init__ wird aufgerufen, wenn eine EulerTour Initialisiert wird.
+
+        Args:
+            graph (MazeGraph): Der ganze Graph.
+            root (int): Zelle, an der die Tour beginnt.
+        """
+        self.graph = graph
+        self.root = root
+        self.complete = False
+        self.pos = None
+        self.twin_pos = None
+        count = len(graph.indices)
+        # ein Baum hat eine Kante weniger als Zellen, also 2 * (Zellen - 1) Halbkanten
+        if count != 2 * (graph.cells - 1) or (count and not graph.degree[root]):
+            return
+        if count == 0:
+            self.complete = True
+            self.pos = self.twin_pos = np.zeros(0, dtype=np.int32)
+            return
+        key = graph.walls[graph.indices].astype(np.uint16)
+        key <<= 2
+        key |= graph.sides
+        # Wände, die nur von einer Seite da sind, ergeben keine Tour
+        if not HAS_TWIN[key].all():
+            return
+        # erste Halbkante der Ziel-Zelle, die Tour hat weniger als 2**31 Halbkanten
+        base = graph.indptr.astype(np.int32)[graph.indices]
+        successor = base + NEXT_RANK[key]
+        self.pos, length = rank(successor, int(graph.indptr[root]))
+        del successor
+        if length != count:
+            self.pos = None
+            return
+        base += TWIN_RANK[key]
+        self.twin_pos = self.pos[base]
+        self.complete = True
+
+    def up_edge(self, cell) -> int:
+        """
+        up_edge gibt die Halbkante wieder, über die die Tour eine Zelle endgültig verlässt.
+
+        Args:
+            cell (int): Index der Zelle, nicht root.
+
+        Returns:
+            int: Halbkante zum Eltern-Knoten.
+        """
+        edges = np.arange(self.graph.indptr[cell], self.graph.indptr[cell + 1])
+        return int(edges[np.argmax(self.pos[edges] > self.twin_pos[edges])])
+
+    def ancestors(self, down, cell) -> np.ndarray:
+        """
+        ancestors markiert die Halbkanten nach unten auf dem Weg von root zu einer Zelle.
+
+        Args:
+            down (ndarray): True für jede Halbkante nach unten.
+            cell (int): Index der Zelle.
+
+        Returns:
+            ndarray: True für jede Halbkante auf dem Weg.
+        """
+        if cell == self.root:
+            return np.zeros(len(self.pos), dtype=bool)
+        up = self.up_edge(cell)
+        # der Teilbaum unter der Halbkante enthält die Zelle, wenn seine Tour ihre umschließt
+        return down & (self.pos <= self.twin_pos[up]) & (self.twin_pos >= self.pos[up])
+
+def tree_metrics(graph, tour, goal) -> dict:
+    """
+    tree_metrics wertet ein perfektes Labyrinth über seine Euler-Tour aus.
+
+    Eine Halbkante nach unten zählt +1, nach oben -1, die cumsum in der Reihenfolge der Tour
+    ist die Tiefe. Für die zweite Suche ändern nur die Halbkanten auf dem Weg zur neuen Wurzel
+    ihre Richtung, danach beginnt die Tour an der neuen Wurzel.
+
+    Args:
+        graph (MazeGraph): Der ganze Graph.
+        tour (EulerTour): vollständige Tour ab der Startzelle.
+        goal (int): Index der Zielzelle.
+
+    Returns:
+        dict: Lösungsweg, Länge der Gänge, Durchmesser und seine Enden wie analyze.
+    """
+    start = tour.root
+    pos, twin_pos = tour.pos, tour.twin_pos
+    length = len(pos)
+    if not length:
+        return {"solution": 0, "path": np.array([start]), "corridors": np.zeros(0, np.int64),
+                "diameter": 0, "ends": (start, start)}
+    down = pos < twin_pos
+    is_node = graph.degree != 2
+    is_node[[start, goal]] = True
+    # Bit 0: Schritt nach unten, Bit 1: Schritt beginnt an einem Knoten, in Reihenfolge der Tour
+    code = np.repeat(is_node, graph.degree).view(np.uint8) << 1
+    code |= down
+    order = np.empty(length, dtype=np.uint8)
+    order[pos] = code
+    del code
+
+    # jeder Gang ist eine Folge von Schritten nach unten, die an einem Knoten beginnt
+    starts = order[order & 1 == 1] >> 1
+    corridors = np.bincount(np.cumsum(starts, dtype=np.int32))[1:]
+    del starts
+
+    # aus Bit 0 wird +1 oder -1, im selben Speicher
+    steps = order
+    steps &= 1
+    steps <<= 1
+    steps -= 1
+    steps = steps.view(np.int8)
+    depth = np.cumsum(steps, dtype=np.int32)
+    farthest = int(np.argmax(depth))
+    far_cell = int(graph.indices[np.flatnonzero(pos == farthest)[0]])
+
+    path = np.flatnonzero(tour.ancestors(down, goal))
+    path = path[np.argsort(pos[path])]
+    cells = np.concatenate(([start], graph.indices[path]))
+
+    # zweite Suche: die Tour ab der entferntesten Zelle, der Weg dorthin dreht sich um
+    flipped = np.flatnonzero(tour.ancestors(down, far_cell))
+    steps[pos[flipped]] = -1
+    steps[twin_pos[flipped]] = 1
+    first = int(pos[graph.indptr[far_cell]])
+    # die gedrehte Tour wird in den Speicher von depth summiert
+    far_depth = depth
+    rest = length - first
+    np.cumsum(steps[first:], dtype=np.int32, out=far_depth[:rest])
+    if first:
+        np.cumsum(steps[:first], dtype=np.int32, out=far_depth[rest:])
+        far_depth[rest:] += far_depth[rest - 1]
+    other = int(np.argmax(far_depth))
+    edge = np.flatnonzero(pos == (first + other) % length)[0]
+    return {"solution": len(path), "path": cells, "corridors": corridors,
+            "diameter": int(far_depth[other]), "ends": (far_cell, int(graph.indices[edge]))}
+
+class CorridorGraph:
+    """
+    Class, die jeden Gang eines MazeGraph zu einer gewichteten Kante zusammenfasst.
+
+    Knoten sind alle Zellen, die nicht genau 2 offene Seiten haben, dazu Start und Ziel.
+
+    Attributes:
+        graph (MazeGraph): Der ganze Graph.
+        nodes (ndarray): Index der Zelle jedes Knotens.
+        node_of (ndarray): Nummer des Knotens jeder Zelle, -1 für Zellen in einem Gang.
+        indptr (ndarray): erste Kante jedes Knotens.
+        indices (ndarray): Ziel-Knoten jeder Kante.
+        weights (ndarray): Länge jeder Kante in Schritten.
+        corridors (ndarray): Länge jedes Gangs in Schritten, jeder Gang einmal.
+        rings (bool): True, wenn es Ringe nur aus Gängen ohne einen Knoten gibt.
+    """
+    def __init__(self, graph, keep=()):
+        """
+        __init__ wird aufgerufen, wenn ein CorridorGraph Initialisiert wird.
+
+        Args:
+            graph (MazeGraph): Der ganze Graph.
+            keep ([int]): Zellen, die immer Knoten sind, z.B. Start und Ziel.
+        """
+        self.graph = graph
+        is_node = graph.degree != 2
+        is_node[list(keep)] = True
+        self.nodes = np.flatnonzero(is_node)
+        self.node_of = np.full(graph.cells, -1, dtype=np.int32)
+        self.node_of[self.nodes] = np.arange(len(self.nodes), dtype=np.int32)
+
+        # die Kanten jedes Knotens sind seine Halbkanten im ganzen Graphen
+        degree = graph.degree[self.nodes].astype(np.int64)
+        self.indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        np.cumsum(degree, out=self.indptr[1:])
+        tails = np.repeat(self.nodes, degree)
+        second = graph.indices[expand(graph.indptr, self.nodes)]
+        targets, self.weights, before = self.walk(tails, second, is_node)
+        self.indices = self.node_of[targets]
+        # jeder Gang einmal, von dem Ende aus, das die kleinere Zelle ist
+        once = (tails < targets) | ((tails == targets) & (second < before))
+        self.corridors = self.weights[once]
+        # Zellen in Gängen, die von keinem Knoten aus erreicht werden, liegen auf Ringen
+        self.rings = int((self.corridors - 1).sum()) < graph.cells - len(self.nodes)
+        # dieselben Kanten als array für die Python-Schleife der Breitensuche
+        self._lists = (array("q", self.indptr.tobytes()), array("i", self.indices.tobytes()),
+                       array("i", self.weights.tobytes()))
+
+    def walk(self, tails, second, is_node) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        walk läuft alle Gänge gleichzeitig Schritt für Schritt ab, von jedem Knoten aus.
+
+        In jeder Runde geht jeder Läufer eine Zelle weiter, wer einen Knoten erreicht, fällt
+        heraus. In einer Zelle mit 2 Seiten ist die nächste Zelle die Summe beider Nachbarn
+        minus der vorherigen Zelle, dafür reicht ein Zugriff pro Schritt. Jede Zelle eines
+        Gangs wird von beiden Enden aus einmal betreten, die Anzahl der Runden ist der
+        längste Gang.
+
+        Args:
+            tails (ndarray): Knoten-Zelle, an der jeder Läufer beginnt.
+            second (ndarray): erste Zelle jedes Läufers nach seinem Knoten.
+            is_node (ndarray): True für jede Zelle, die ein Knoten ist.
+
+        Returns:
+            tuple(ndarray, ndarray, ndarray): erreichte Knoten-Zelle, Anzahl der Schritte
+            und Zelle vor dem erreichten Knoten, für jeden Läufer.
+        """
+        graph = self.graph
+        # Summe beider Nachbarn jeder Zelle im Gang, -1 für Knoten
+        follow = np.full(graph.cells, -1, dtype=np.int64)
+        inner = np.flatnonzero(~is_node)
+        first_edge = graph.indptr[inner]
+        follow[inner] = graph.indices[first_edge].astype(np.int64) + graph.indices[first_edge + 1]
+
+        targets = second.astype(np.int64)
+        steps = np.ones(len(tails), dtype=np.int32)
+        before = tails.copy()
+        running = np.flatnonzero(follow[targets] >= 0)
+        previous, current = before[running], targets[running]
+        length = 1
+        while running.size:
+            current, previous = follow[current] - previous, current
+            length += 1
+            arrived = follow[current] < 0
+            done = running[arrived]
+            targets[done] = current[arrived]
+            before[done] = previous[arrived]
+            steps[done] = length
+            walking = ~arrived
+            running, previous, current = running[walking], previous[walking], current[walking]
+        return targets, steps, before
+
+    def distances(self, source) -> tuple[np.ndarray, np.ndarray]:
+        """
+        distances berechnet die Distanz jedes Knotens zu einem Quell-Knoten.
+
+        Dijkstra mit einer Eimer-Warteschlange: jede Distanz ist ein Eimer, die Eimer werden
+        der Größe nach abgearbeitet und jeder Knoten wird genau einmal abgeschlossen, mit der
+        Distanz seines Eimers. Das braucht O(Knoten + Kanten + K log K) für K verschiedene
+        Distanzen. Kleine Eimer laufen in einer Python-Schleife, große mit NumPy.
+
+        Args:
+            source (int): Nummer des Quell-Knotens.
+
+        Returns:
+            tuple(ndarray, ndarray): Distanz in Schritten und vorheriger Knoten jedes Knotens,
+            -1 für unerreichbare Knoten.
+        """
+        count = len(self.nodes)
+        # array und ndarray teilen sich den Speicher, Python liest array schneller
+        dist_list = array("q", [-1]) * count
+        parent_list = array("q", [-1]) * count
+        done_list = bytearray(count)
+        dist = np.frombuffer(dist_list, dtype=np.int64)
+        parent = np.frombuffer(parent_list, dtype=np.int64)
+        done = np.frombuffer(done_list, dtype=np.uint8)
+        indptr_list, indices_list, weights_list = self._lists
+
+        # Distanz -> (Knoten als Python-Liste, Knoten als ndarrays)
+        buckets = {0: ([source], [])}
+        keys = [0]
+        dist[source] = 0
+        while keys:
+            key = heapq.heappop(keys)
+            singles, blocks = buckets.pop(key)
+            if not blocks and len(singles) < WIDE_FRONT:
+                # kleiner Eimer: eine Python-Schleife ist schneller als mehrere NumPy Aufrufe
+                for node in singles:
+                    if done_list[node] or dist_list[node] != key:
+                        continue # schon abgeschlossen oder später verkürzt
+                    done_list[node] = 1
+                    for edge in range(indptr_list[node], indptr_list[node + 1]):
+                        neighbor = indices_list[edge]
+                        new_dist = key + weights_list[edge]
+                        old = dist_list[neighbor]
+                        if old < 0 or new_dist < old:
+                            dist_list[neighbor] = new_dist
+                            parent_list[neighbor] = node
+                            bucket = buckets.get(new_dist)
+                            if bucket is None:
+                                buckets[new_dist] = ([neighbor], [])
+                                heapq.heappush(keys, new_dist)
+                            else:
+                                bucket[0].append(neighbor)
+                continue
+
+            front = np.concatenate(blocks + [np.array(singles, dtype=np.int64)])
+            front = np.unique(front[(dist[front] == key) & (done[front] == 0)])
+            done[front] = 1
+            edges = expand(self.indptr, front)
+            sources = np.repeat(front, self.indptr[front + 1] - self.indptr[front])
+            neighbors = self.indices[edges].astype(np.int64)
+            new_dist = key + self.weights[edges].astype(np.int64)
+            old = dist[neighbors]
+            better = (old < 0) | (new_dist < old)
+            # mehrere Wege zum selben Knoten: absteigend sortiert gewinnt der kürzeste
+            order = np.argsort(-new_dist[better], kind="stable")
+            neighbors = neighbors[better][order]
+            new_dist = new_dist[better][order]
+            dist[neighbors] = new_dist
+            parent[neighbors] = sources[better][order]
+            kept = dist[neighbors] == new_dist
+            neighbors, new_dist = neighbors[kept][::-1], new_dist[kept][::-1]
+            if not len(neighbors):
+                continue
+            values, firsts = np.unique(new_dist, return_index=True)
+            for value, block in zip(values.tolist(), np.split(neighbors, firsts[1:])):
+                bucket = buckets.get(value)
+                if bucket is None:
+                    buckets[value] = ([], [block])
+                    heapq.heappush(keys, value)
+                else:
+                    bucket[1].append(block)
+        return dist, parent
+
+def histogram(values, minlength=0) -> list[int]:
+    """
+    histogram zählt, wie oft jede ganze Zahl vorkommt.
+
+    Args:
+        values (ndarray): nicht negative ganze Zahlen.
+        minlength (int): kleinste Länge des Ergebnisses.
+
+    Returns:
+        [int]: Anzahl für jede Zahl von 0 bis zur größten.
+    """
+    return np.bincount(values, minlength=minlength).tolist()
+
+def analyze(maze) -> dict:
+    """
+    analyze wertet ein Labyrinth aus, alle Schritte brauchen O(Zellen).
+
+    Der Durchmesser wird mit zwei Suchen bestimmt: von der Startzelle zur entferntesten
+    Zelle a und von a zur entferntesten Zelle b. In einem perfekten Labyrinth laufen beide
+    über die Euler-Tour und ergeben den längsten Weg, mit Schleifen sind es Breitensuchen
+    und eine untere Schranke.
+
+    Args:
+        maze (Maze): Das Labyrinth.
+
+    Returns:
+        dict: Größe, ob das Labyrinth perfekt ist, Sackgassen, Kreuzungen, Histogramme der
+            offenen Seiten jeder Zelle, der Seitenwege entlang des Lösungswegs und der
+            Gang-Längen, Länge und Umweg-Faktor des Lösungswegs und der Durchmesser.
+    """
+    graph = MazeGraph(maze)
+    start, goal = 0, graph.cells - 1
+    degree_counts = histogram(graph.degree, 5)
+    tour = EulerTour(graph, start)
+    if tour.complete:
+        tree = tree_metrics(graph, tour, goal)
+        perfect = True
+        solution, lengths, diameter = tree["solution"], tree["corridors"], tree["diameter"]
+        ends = tree["ends"]
+        path_cells = tree["path"]
+    else:
+        corridors = CorridorGraph(graph, (start, goal))
+
+        # erste Breitensuche vom Start: Lösungsweg und ein Ende des Durchmessers
+        source = corridors.node_of[start]
+        dist, parent = corridors.distances(source)
+        solution = int(dist[corridors.node_of[goal]])
+        farthest = int(np.argmax(dist))
+
+        # zweite Breitensuche vom entferntesten Knoten
+        far_dist, _ = corridors.distances(farthest)
+        other = int(np.argmax(far_dist))
+        diameter = int(far_dist[other])
+        ends = (corridors.nodes[farthest], corridors.nodes[other])
+
+        perfect = (len(graph.indices) == 2 * (graph.cells - 1) and not corridors.rings
+                   and bool((dist >= 0).all()))
+        lengths = corridors.corridors
+        path_cells = None
+        if solution >= 0:
+            path = [corridors.node_of[goal]]
+            while path[-1] != source:
+                path.append(parent[path[-1]])
+            path_cells = corridors.nodes[path]
+
+    # Seitenwege entlang des Lösungswegs, Zellen im Gang haben keine
+    branching = None
+    if path_cells is not None:
+        # Start und Ziel haben nur einen Nachbarn auf dem Weg, alle anderen Zellen zwei
+        branches = graph.degree[path_cells].astype(np.int64) - 2
+        branches[0] += 1
+        branches[-1] += 1
+        if len(path_cells) == 1:
+            branches[0] = 0
+        branching = histogram(branches, 4)
+        branching[0] += solution + 1 - len(path_cells)
+
+    manhattan = graph.width - 1 + graph.height - 1
+    return {
+        "width": graph.width,
+        "height": graph.height,
+        "algorithm": maze.algorithm,
+        "seed": maze.seed,
+        "perfect": perfect,
+        "dead_ends": degree_counts[1],
+        "junctions": degree_counts[3] + degree_counts[4],
+        "degree_histogram": degree_counts,
+        "branching_histogram": branching,
+        "corridors": len(lengths),
+        "corridor_histogram": histogram(lengths),
+        "mean_corridor": float(lengths.mean()) if len(lengths) else 0.0,
+        "solution_length": solution,
+        "tortuosity": (solution / manhattan if manhattan else 1.0) if solution >= 0 else None,
+        "diameter": diameter,
+        "diameter_ends": [graph.position(ends[0]), graph.position(ends[1])],
+    }
+
+def maze_files(paths) -> list[str]:
+    """
+    maze_files sucht die .tkmz Dateien in Ordnern, Dateien werden direkt übernommen.
+
+    Args:
+        paths ([str]): Ordner und Dateien.
+
+    Returns:
+        [str]: Pfade der Dateien, sortiert je Ordner.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.endswith(".tkmz"))
+        else:
+            files.append(path)
+    return files
+
+def analyze_file(path) -> dict:
+    """
+    analyze_file lädt ein gespeichertes Labyrinth und wertet es aus, in einem Arbeits-Prozess.
+
+    Args:
+        path (str): Pfad der .tkmz Datei.
+
+    Returns:
+        dict: Pfad, Dauer und Kennzahlen oder Pfad und Fehlermeldung.
+    """
+    start = time.perf_counter()
+    try:
+        # ganz einlesen, ausgewertet wird sowieso jede Zelle
+        result = analyze(storage.load(path, use_mmap=False))
+    except (ValueError, OSError) as error:
+        return {"path": path, "error": str(error)}
+    return {"path": path, "seconds": time.perf_counter() - start, **result}
+
+def main(argv=None):
+    """
+    main wertet gespeicherte oder neu generierte Labyrinthe aus, ein JSON-Objekt pro Zeile.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.analytics",
+                                     description="Wertet Labyrinthe aus.")
+    parser.add_argument("paths", nargs="*", metavar="PFAD",
+                        help=".tkmz Dateien oder Ordner, ohne Pfad wird eines generiert")
+    parser.add_argument("--maze", type=int, nargs=2, default=(50, 50), metavar=("X", "Y"))
+    parser.add_argument("--algorithm", choices=GENERATORS, default="dfs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Anzahl der Prozesse")
+    args = parser.parse_args(argv)
+
+    if not args.paths:
+        maze = Maze(*args.maze)
+        maze.generate(args.algorithm, args.seed)
+        start = time.perf_counter()
+        result = analyze(maze)
+        print(json.dumps({"seconds": time.perf_counter() - start, **result}))
+        return
+
+    files = maze_files(args.paths)
+    workers = min(args.workers or os.cpu_count() or 1, max(1, len(files)))
+    start = time.perf_counter()
+    with Pool(workers) as pool:
+        # die Reihenfolge der Dateien bleibt erhalten
+        for result in pool.imap(analyze_file, files):
+            print(json.dumps(result))
+    print(f"{len(files)} Labyrinthe in {time.perf_counter() - start:.1f} s ausgewertet",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
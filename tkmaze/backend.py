@@ -0,0 +1,268 @@
+"""src/backend.py
+
+Enthält die Zeichen-Backends, mit denen der Raycaster ein Bild auf den Canvas bringt.
+
+Jedes Backend bekommt pro Bild eine Liste von Strahlen (line_height, side, map_pos),
+einen Strahl pro raycaster.ray_step Spalten, und entscheidet selbst, wie diese gezeichnet werden.
+"""
+
+import tkinter as tk
+from .framebuffer import Framebuffer
+
+class LineBackend:
+    """
+    Class, die jedes Bild neu mit einer Linie pro Spalte zeichnet (Referenz-Backend).
+
+    Attributes:
+        raycaster (Raycaster): Der Raycaster, dessen Canvas benutzt wird.
+    """
+    def __init__(self, raycaster):
+        """
+        __init__ wird aufgerufen, wenn ein Backend Initialisiert wird.
+
+        Args:
+            raycaster (Raycaster): Der Raycaster, dessen Canvas benutzt wird.
+        """
+        self.raycaster = raycaster
+
+    def draw(self, rays):
+        """
+        draw löscht die Linien des letzten Bildes und zeichnet alle Spalten mit Raycaster.draw_line.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+        """
+        self.raycaster.canvas.delete("wall")
+        step = self.raycaster.ray_step
+        for x, (line_height, side, map_pos) in enumerate(rays):
+            self.raycaster.draw_line(line_height, side, map_pos, x * step, step)
+
+class PoolBackend(LineBackend):
+    """
+    Class, die einen festen Vorrat an Linien auf dem Canvas behält und nur verschiebt.
+
+    Attributes:
+        raycaster (Raycaster): Der Raycaster, dessen Canvas benutzt wird.
+        items ([int]): Canvas-IDs der Linien, eine pro Strahl.
+        state ([tuple]): zuletzt gesetzte Koordinaten und Farbe jeder Linie.
+        step (int): Anzahl der Spalten pro Linie im letzten Bild.
+    """
+    def __init__(self, raycaster):
+        super().__init__(raycaster)
+        self.items = []
+        self.state = []
+        self.step = 1
+
+    def draw(self, rays):
+        """
+        draw passt nur die Linien an, deren Koordinaten oder Farbe sich geändert haben.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+        """
+        canvas = self.raycaster.canvas
+        step = self.raycaster.ray_step
+        if step != self.step:
+            # alle Linien bekommen die neue Breite und werden neu positioniert
+            for item in self.items:
+                canvas.itemconfig(item, width=step)
+            self.state = [None] * len(self.items)
+            self.step = step
+        # Vorrat an die Anzahl der Strahlen anpassen
+        while len(self.items) < len(rays):
+            self.items.append(canvas.create_line(0, 0, 0, 0, width=step))
+            self.state.append(None)
+        while len(self.items) > len(rays):
+            canvas.delete(self.items.pop())
+            self.state.pop()
+
+        # tkinter zentriert breite Linien um ihre Koordinaten
+        offset = step / 2 if step > 1 else 0
+        for i, (line_height, side, map_pos) in enumerate(rays):
+            draw_start, draw_end = self.raycaster.column_span(line_height)
+            color = self.raycaster.wall_color(side, map_pos, line_height)
+            new_state = (draw_start, draw_end, color)
+            old_state = self.state[i]
+            if new_state == old_state:
+                continue
+            item = self.items[i]
+            if old_state is None or old_state[:2] != new_state[:2]:
+                x = i * step + offset
+                canvas.coords(item, x, draw_start, x, draw_end)
+            if old_state is None or old_state[2] != color:
+                canvas.itemconfig(item, fill=color)
+            self.state[i] = new_state
+
+class SpanBackend(LineBackend):
+    """
+    Class, die benachbarte Spalten mit gleicher Höhe und Farbe zu einem Rechteck zusammenfasst.
+
+    Attributes:
+        raycaster (Raycaster): Der Raycaster, dessen Canvas benutzt wird.
+        items ([int]): Canvas-IDs der Rechtecke, werden von Bild zu Bild wiederverwendet.
+        state ([tuple]): zuletzt gezeichneter Bereich jedes Rechtecks.
+        used (int): Anzahl der Rechtecke, die im letzten Bild sichtbar waren.
+        step (int): Anzahl der Spalten pro Strahl im letzten Bild.
+    """
+    def __init__(self, raycaster):
+        super().__init__(raycaster)
+        self.items = []
+        self.state = []
+        self.used = 0
+        self.step = 1
+
+    def spans(self, rays) -> list[tuple[int, int, int, int, str]]:
+        """
+        spans fasst gleiche benachbarte Spalten zusammen.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+
+        Returns:
+            [tuple(int, int, int, int, str)]: erster und letzter Strahl, Start, Ende und Farbe.
+        """
+        spans = []
+        current = None
+        for x, (line_height, side, map_pos) in enumerate(rays):
+            draw_start, draw_end = self.raycaster.column_span(line_height)
+            color = self.raycaster.wall_color(side, map_pos, line_height)
+            if current and current[2:] == [draw_start, draw_end, color]:
+                current[1] = x
+            else:
+                if current:
+                    spans.append(tuple(current))
+                current = [x, x, draw_start, draw_end, color]
+        if current:
+            spans.append(tuple(current))
+        return spans
+
+    def draw(self, rays):
+        """
+        draw zeichnet ein Rechteck pro zusammengefasstem Bereich und versteckt übrige Rechtecke.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+        """
+        canvas = self.raycaster.canvas
+        step = self.raycaster.ray_step
+        spans = self.spans(rays)
+        # der Bereich hängt auch von der Breite eines Strahls ab
+        if step != self.step:
+            self.used = 0
+            self.step = step
+        while len(self.items) < len(spans):
+            self.items.append(canvas.create_rectangle(0, 0, 0, 0, width=0))
+            self.state.append(None)
+        for i, span in enumerate(spans):
+            if i < self.used and self.state[i] == span:
+                continue
+            first, last, draw_start, draw_end, color = span
+            canvas.coords(self.items[i], first * step, draw_start, (last + 1) * step, draw_end)
+            canvas.itemconfig(self.items[i], fill=color, state="normal")
+            self.state[i] = span
+        for item in self.items[len(spans):self.used]:
+            canvas.itemconfig(item, state="hidden")
+        self.used = len(spans)
+
+def canvas_rgb(canvas) -> tuple[int, int, int]:
+    """
+    canvas_rgb gibt die Hintergrundfarbe eines Canvas als RGB Werte wieder.
+
+    Args:
+        canvas (Canvas): der Canvas.
+
+    Returns:
+        tuple(int, int, int): Farbe mit 8 Bit pro Kanal.
+    """
+    # winfo_rgb liefert 16 Bit pro Kanal, auch für Namen wie "SystemButtonFace"
+    return tuple(value >> 8 for value in canvas.winfo_rgb(canvas.cget("background")))
+
+class PhotoImageBackend(LineBackend):
+    """
+    Class, die jedes Bild in einen RGB Framebuffer schreibt und als ein PhotoImage anzeigt.
+
+    Attributes:
+        raycaster (Raycaster): Der Raycaster, dessen Canvas benutzt wird.
+        background (tuple(int, int, int)): Farbe von Decke und Boden, wie der Canvas.
+        frame (Framebuffer): Framebuffer mit einem Pixel pro Strahl und Reihe.
+        image (PhotoImage): das Bild mit einem Pixel pro Strahl.
+        display (PhotoImage): das angezeigte Bild, image um step in die Breite gezogen.
+        step (int): Anzahl der Spalten pro Strahl.
+        item (int): Canvas-ID des Bildes.
+        worker_frames (int): Anzahl der Bilder, die fertig aus den Workern einer StripEngine kamen.
+    """
+    def __init__(self, raycaster, background=None):
+        """
+        __init__ wird aufgerufen, wenn ein PhotoImageBackend Initialisiert wird.
+
+        Args:
+            raycaster (Raycaster): Der Raycaster, dessen Canvas benutzt wird.
+            background (tuple(int, int, int)): Farbe von Decke und Boden, standardmäßig
+                die Hintergrundfarbe des Canvas, auf dem die anderen Backends zeichnen.
+        """
+        super().__init__(raycaster)
+        self.background = tuple(background or canvas_rgb(raycaster.canvas))
+        self.frame = None
+        self.image = None
+        self.display = None
+        self.step = 1
+        self.item = None
+        self.worker_frames = 0
+        # eine StripEngine zeichnet die Spalten gleich in ihren Workern, die Höhe setzt render
+        if hasattr(raycaster.engine, "frame_height"):
+            raycaster.engine.frame_height = raycaster.height
+            raycaster.engine.background = self.background
+
+    def resize(self, width, height, step=1):
+        """
+        resize legt Framebuffer und PhotoImage in einer neuen Größe an.
+
+        Args:
+            width (int): Länge des Bildes in Strahlen.
+            height (int): Höhe des Bildes.
+            step (int): Anzahl der Spalten pro Strahl.
+        """
+        self.frame = Framebuffer(width, height, self.background)
+        self.image = tk.PhotoImage(width=width, height=height)
+        self.step = step
+        # bei einem Strahl pro Spalte wird das Bild direkt angezeigt
+        self.display = self.image if step == 1 else tk.PhotoImage(width=width * step,
+                                                                   height=height)
+        if self.item is None:
+            self.item = self.raycaster.canvas.create_image(0, 0, image=self.display, anchor="nw")
+        else:
+            self.raycaster.canvas.itemconfig(self.item, image=self.display)
+
+    def draw(self, rays):
+        """
+        draw schreibt jede Spalte in den Framebuffer und übergibt ihn als PPM an das PhotoImage.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+        """
+        width, height = len(rays), self.raycaster.height
+        step = self.raycaster.ray_step
+        if width <= 0 or height <= 0:
+            return
+        if (self.frame is None or (self.frame.width, self.frame.height) != (width, height)
+                or self.step != step):
+            self.resize(width, height, step)
+
+        engine_frame = getattr(self.raycaster.engine, "frame", None)
+        if engine_frame is not None and (engine_frame.width, engine_frame.height) == (width, height):
+            self.image.configure(data=engine_frame.ppm(), format="PPM")
+            self.worker_frames += 1
+        else:
+            self.frame.draw_rays(rays, self.raycaster)
+            self.image.configure(data=self.frame.ppm(), format="PPM")
+        if step > 1:
+            # tk zieht das kleine Bild selbst in die Breite, ohne Python-Schleife
+            self.display.tk.call(self.display, "copy", self.image, "-zoom", step, 1)
+
+# Name eines Backends -> Backend Class
+BACKENDS = {
+        "line": LineBackend,
+        "pool": PoolBackend,
+        "span": SpanBackend,
+        "photo": PhotoImageBackend,
+}
@@ -0,0 +1,187 @@
+"""src/batch.py
+
+Enthält die Stapel-Generierung vieler Labyrinthe auf allen Prozessor-Kernen.
+
+Jedes Labyrinth bekommt einen eigenen Seed, der nur vom Basis-Seed und seiner Nummer
+abhängt, deshalb ist das Ergebnis unabhängig von der Anzahl der Prozesse reproduzierbar.
+`python3 -m tkmaze.batch 10000 --sizes 10 50 --seed 1 --out labyrinthe.zip`
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import tarfile
+import time
+import zipfile
+from multiprocessing import Pool
+from .maze import Maze, GENERATORS
+from . import storage
+
+def task(base_seed, number, min_size, max_size) -> tuple[int, int, int, int]:
+    """
+    task bestimmt Seed und Größe eines Labyrinths aus dem Basis-Seed und seiner Nummer.
+
+    Args:
+        base_seed (int): Basis-Seed des ganzen Stapels.
+        number (int): Nummer des Labyrinths im Stapel.
+        min_size (int): kleinste Länge und Höhe in Zellen.
+        max_size (int): größte Länge und Höhe in Zellen.
+
+    Returns:
+        tuple(int, int, int, int): Nummer, Seed, Länge und Höhe.
+    """
+    # ein String-Seed ist in jeder Python Version und jedem Prozess gleich
+    rng = random.Random(f"{base_seed}:{number}")
+    seed = rng.getrandbits(63)
+    return number, seed, rng.randint(min_size, max_size), rng.randint(min_size, max_size)
+
+def build(job) -> tuple[int, str, bytes, int]:
+    """
+    build generiert ein Labyrinth in einem Arbeits-Prozess und gibt es als .tkmz Daten wieder.
+
+    Args:
+        job (tuple): Nummer, Seed, Länge, Höhe und Algorithmus.
+
+    Returns:
+        tuple(int, str, bytes, int): Nummer, Dateiname, .tkmz Daten und Anzahl der Zellen.
+    """
+    number, seed, width, height, algorithm = job
+    maze = Maze(width, height)
+    maze.generate(algorithm, seed)
+    data = io.BytesIO()
+    storage.write(maze, data)
+    name = f"maze_{number:07d}_{width}x{height}.tkmz"
+    return number, name, data.getvalue(), width * height
+
+class Output:
+    """
+    Class, die generierte Labyrinthe in einen Ordner, ein .zip oder ein .tar Archiv schreibt.
+
+    Attributes:
+        path (str): Ordner oder Pfad des Archivs.
+        archive (ZipFile | TarFile): geöffnetes Archiv, None für einen Ordner.
+    """
+    def __init__(self, path):
+        """
+        __init__ wird aufgerufen, wenn eine Ausgabe Initialisiert wird.
+
+        Args:
+            path (str): Ordner oder Pfad eines .zip, .tar oder .tar.gz Archivs.
+        """
+        self.path = path
+        if path.endswith(".zip"):
+            self.archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        elif path.endswith((".tar", ".tar.gz", ".tgz")):
+            self.archive = tarfile.open(path, "w:gz" if path.endswith("gz") else "w")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.archive = None
+
+    def add(self, name, data):
+        """
+        add schreibt eine Datei in die Ausgabe.
+
+        Args:
+            name (str): Dateiname.
+            data (bytes): Inhalt der Datei.
+        """
+        if self.archive is None:
+            with open(os.path.join(self.path, name), "wb") as file:
+                file.write(data)
+        elif isinstance(self.archive, zipfile.ZipFile):
+            self.archive.writestr(name, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self.archive.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        """
+        close schließt das Archiv, falls eines geöffnet ist.
+        """
+        if self.archive is not None:
+            self.archive.close()
+
+def run_batch(count, min_size, max_size, algorithm, base_seed, out, workers=None,
+              report=sys.stderr) -> dict:
+    """
+    run_batch generiert count Labyrinthe parallel und schreibt sie nach out.
+
+    Args:
+        count (int): Anzahl der Labyrinthe.
+        min_size (int): kleinste Länge und Höhe in Zellen.
+        max_size (int): größte Länge und Höhe in Zellen.
+        algorithm (str): Name des Algorithmus aus GENERATORS.
+        base_seed (int): Basis-Seed des Stapels.
+        out (str): Ordner oder Pfad eines Archivs.
+        workers (int): Anzahl der Prozesse, standardmäßig alle Kerne.
+        report (file): Ziel für den Fortschritt, None für keine Ausgabe.
+
+    Returns:
+        dict: Anzahl der Labyrinthe und Zellen, Dauer und Durchsatz.
+    """
+    if algorithm not in GENERATORS:
+        raise ValueError(f"Unbekannter Algorithmus: {algorithm}")
+    workers = workers or os.cpu_count() or 1
+    jobs = (task(base_seed, number, min_size, max_size) + (algorithm,)
+            for number in range(count))
+
+    output = Output(out)
+    start = last_report = time.perf_counter()
+    done = cells = 0
+    try:
+        with Pool(workers) as pool:
+            # kleine Pakete, damit alle Prozesse gleichmäßig ausgelastet sind,
+            # fertige Labyrinthe werden sofort geschrieben, egal in welcher Reihenfolge
+            chunksize = max(1, min(64, count // (workers * 8)))
+            for _, name, data, maze_cells in pool.imap_unordered(build, jobs, chunksize):
+                output.add(name, data)
+                done += 1
+                cells += maze_cells
+                now = time.perf_counter()
+                if report is not None and (now - last_report >= 1.0 or done == count):
+                    elapsed = now - start
+                    print(f"{done}/{count} Labyrinthe, {done / elapsed:.1f} Labyrinthe/s, "
+                          f"{cells / elapsed:.0f} Zellen/s", file=report)
+                    last_report = now
+    finally:
+        output.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "mazes": done,
+        "cells": cells,
+        "seconds": elapsed,
+        "mazes_per_second": done / elapsed if elapsed else 0.0,
+        "cells_per_second": cells / elapsed if elapsed else 0.0,
+        "workers": workers,
+    }
+
+def main(argv=None):
+    """
+    main liest die Kommandozeilen-Argumente und startet die Stapel-Generierung.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.batch",
+                                     description="Generiert viele Labyrinthe parallel.")
+    parser.add_argument("count", type=int, help="Anzahl der Labyrinthe")
+    parser.add_argument("--sizes", type=int, nargs=2, default=(5, 50), metavar=("MIN", "MAX"),
+                        help="kleinste und größte Länge und Höhe in Zellen")
+    parser.add_argument("--algorithm", choices=GENERATORS, default="dfs")
+    parser.add_argument("--seed", type=int, default=0, help="Basis-Seed des Stapels")
+    parser.add_argument("--workers", type=int, default=None, help="Anzahl der Prozesse")
+    parser.add_argument("--out", default="labyrinthe",
+                        help="Ordner oder Archiv (.zip, .tar, .tar.gz)")
+    args = parser.parse_args(argv)
+
+    result = run_batch(args.count, *args.sizes, args.algorithm, args.seed, args.out, args.workers)
+    print(f"{result['mazes']} Labyrinthe in {result['seconds']:.1f} s mit {result['workers']} "
+          f"Prozessen ({result['mazes_per_second']:.1f} Labyrinthe/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""src/bench.py
+
+Enthält die Benchmarks für die zeitkritischen Teile von tkMaze.
+
+Gemessen werden Maze(w, h), generate_dfs_iterative, jeder Algorithmus aus GENERATORS in
+Zellen pro Sekunde, list(maze), str(maze) und für jede Größe das Berechnen eines Bildes
+ohne Fenster (Caster.cast) sowie das Berechnen und Zeichnen in einen Framebuffer
+(HeadlessRenderer.render) entlang des Lösungsweges.
+Die Ergebnisse werden als JSON gespeichert und können mit früheren Läufen verglichen werden.
+`python3 -m tkmaze.bench --out neu.json --compare alt.json`
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+from .maze import Maze, GENERATORS
+from .caster import Caster
+from .headless import HeadlessRenderer
+from .solve import Solver
+
+# Standard-Werte für die Messreihen
+SIZES = (16, 64, 256)
+WIDTHS = (320, 640, 1280)
+RENDER_SIZE = 64
+HEIGHT = 480
+# höchstens so viele Bilder pro Kamera-Weg, sonst dauern große Labyrinthe zu lange
+FRAMES = 100
+
+# die rekursive Tiefensuche stößt bei großen Labyrinthen an die Grenze des C-Stacks
+SKIPPED_ALGORITHMS = ("dfs-recursive",)
+
+def measure(function, repeat) -> dict:
+    """
+    measure führt eine Funktion mehrmals aus und misst die Zeit jedes Laufs.
+
+    Args:
+        function (callable): Funktion ohne Argumente.
+        repeat (int): Anzahl der Läufe.
+
+    Returns:
+        dict: beste und mittlere Zeit in Sekunden und Anzahl der Läufe.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "mean": sum(times) / len(times), "repeat": repeat}
+
+def generated_maze(size, seed=0) -> Maze:
+    """
+    generated_maze erzeugt ein reproduzierbares Labyrinth für die Messungen.
+
+    Args:
+        size (int): Länge und Höhe des Labyrinths in Zellen.
+        seed (int): Seed für generate_dfs_iterative.
+
+    Returns:
+        Maze: das generierte Labyrinth.
+    """
+    maze = Maze(size, size)
+    maze.generate_dfs_iterative(maze.grid[0][0], random.Random(seed))
+    return maze
+
+def camera_path(maze, steps=4, frames=None) -> list[list[list[float]]]:
+    """
+    camera_path zeichnet einen Kamera-Weg vom Start zum Ende des Labyrinths auf.
+
+    Die Kamera läuft den Lösungsweg ab, mit steps Bildern pro Zelle, und schaut dabei
+    immer in Richtung der nächsten Zelle.
+
+    Args:
+        maze (Maze): Das Labyrinth.
+        steps (int): Anzahl der Bilder pro Zelle.
+        frames (int): höchstens so viele Bilder, gleichmäßig über den Weg verteilt,
+            None für alle.
+
+    Returns:
+        [[[float]]]: pos, dir und plane für jedes Bild.
+    """
+    # Zelle x, y liegt in map_data bei Reihe 2y+1 und Spalte 2x+1
+    points = [(2 * y + 1.5, 2 * x + 1.5) for x, y in Solver(maze).path()]
+    poses = []
+    for (row, col), (next_row, next_col) in zip(points, points[1:]):
+        length = math.hypot(next_row - row, next_col - col)
+        direction = [(next_row - row) / length, (next_col - col) / length]
+        plane = [-direction[1] * 0.66, direction[0] * 0.66]
+        for step in range(steps):
+            part = step / steps
+            pos = [row + (next_row - row) * part, col + (next_col - col) * part]
+            poses.append([pos, direction, plane])
+    if frames is not None and len(poses) > frames:
+        poses = poses[::math.ceil(len(poses) / frames)]
+    return poses
+
+def replay(caster, poses, draw=False):
+    """
+    replay berechnet für jede Kamera-Position ein Bild.
+
+    Args:
+        caster (Caster): der Caster ohne Fenster.
+        poses ([[[float]]]): pos, dir und plane für jedes Bild.
+        draw (bool): zeichnet jedes Bild mit HeadlessRenderer.render, statt nur cast aufzurufen.
+    """
+    for pos, direction, plane in poses:
+        caster.pos = list(pos)
+        caster.dir = list(direction)
+        caster.plane = list(plane)
+        if draw:
+            caster.render()
+        else:
+            caster.cast()
+
+def run_benchmarks(sizes=SIZES, widths=WIDTHS, repeat=3, render_size=RENDER_SIZE,
+                   poses=None, engine="python", skip=False, workers=None) -> list[dict]:
+    """
+    run_benchmarks führt alle Messreihen aus.
+
+    Args:
+        sizes ([int]): Größen der Labyrinthe in Zellen.
+        widths ([int]): Anzahl der Spalten für die Bild-Messungen.
+        repeat (int): Anzahl der Läufe pro Messung.
+        render_size (int): Größe des Labyrinths, zu dem poses gehört.
+        poses ([[[float]]]): Kamera-Weg, dann wird nur render_size gemessen, standardmäßig
+            höchstens FRAMES Bilder entlang des Lösungsweges jeder Größe aus sizes.
+        engine (str): Engine des Casters, "python", "numpy" oder "parallel".
+        skip (bool): lässt den Caster leere Bereiche mit einer SkipMap überspringen.
+        workers (int): Anzahl der Prozesse für die Engine "parallel".
+
+    Returns:
+        [dict]: ein Ergebnis pro Messung mit Name, Parametern und Zeiten.
+    """
+    results = []
+
+    def record(name, params, function, cells=None):
+        result = {"name": name, "params": params, **measure(function, repeat)}
+        if cells is not None:
+            result["cells_per_second"] = cells / result["best"] if result["best"] else 0.0
+        results.append(result)
+        print(f"{name:<10} {json.dumps(params):<32} {result['best'] * 1000:10.3f} ms",
+              file=sys.stderr)
+
+    for size in sizes:
+        params = {"size": size}
+        record("construct", params, lambda: Maze(size, size))
+        record("generate", params, lambda: generated_maze(size))
+        for algorithm in GENERATORS:
+            if algorithm in SKIPPED_ALGORITHMS:
+                continue
+            record("algorithm", {"size": size, "algorithm": algorithm},
+                   lambda: Maze(size, size).generate(algorithm, 0), size * size)
+        maze = generated_maze(size)
+        record("list", params, lambda: list(maze))
+        record("str", params, lambda: str(maze))
+
+    # ein aufgezeichneter Kamera-Weg passt nur zu dem Labyrinth, in dem er aufgezeichnet wurde
+    for size in sizes if poses is None else (render_size,):
+        maze = generated_maze(size)
+        path = camera_path(maze, frames=FRAMES) if poses is None else poses
+        for width in widths:
+            params = {"size": size, "width": width, "frames": len(path), "engine": engine}
+            if skip:
+                params["skip"] = True
+            if workers:
+                params["workers"] = workers
+            caster = Caster(maze, width, HEIGHT, engine, skip, workers=workers)
+            record("render", params, lambda: replay(caster, path))
+            caster.close()
+            # dieselben Bilder, zusätzlich in einen Framebuffer gezeichnet
+            renderer = HeadlessRenderer(maze, width, HEIGHT, engine, skip=skip, workers=workers)
+            record("draw", params, lambda: replay(renderer, path, draw=True))
+            renderer.close()
+    return results
+
+def metadata() -> dict:
+    """
+    metadata sammelt Informationen über die Umgebung, in der gemessen wurde.
+
+    Returns:
+        dict: Python Version, Plattform, Zeitpunkt und git commit, falls vorhanden.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+    }
+
+def compare(old, new, threshold=1.1) -> list[str]:
+    """
+    compare vergleicht zwei Läufe und markiert Messungen, die langsamer geworden sind.
+
+    Args:
+        old (dict): früherer Lauf, wie von main gespeichert.
+        new (dict): aktueller Lauf.
+        threshold (float): ab diesem Verhältnis gilt eine Messung als langsamer.
+
+    Returns:
+        [str]: eine Zeile pro Messung, die in beiden Läufen vorkommt.
+    """
+    def key(result):
+        return result["name"], json.dumps(result["params"], sort_keys=True)
+
+    previous = {key(result): result for result in old["results"]}
+    lines = []
+    for result in new["results"]:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        ratio = result["best"] / before["best"] if before["best"] else float("inf")
+        flag = "LANGSAMER" if ratio > threshold else ""
+        lines.append(f"{result['name']:<10} {key(result)[1]:<32} {ratio:6.2f}x {flag}")
+    return lines
+
+def main(argv=None):
+    """
+    main führt die Benchmarks aus und speichert oder vergleicht die Ergebnisse.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.bench",
+                                     description="Misst Generierung, Export und Bildberechnung.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--widths", type=int, nargs="+", default=WIDTHS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--render-size", type=int, default=RENDER_SIZE,
+                        help="Größe des Labyrinths für --camera und --record-camera")
+    parser.add_argument("--engine", choices=("python", "numpy", "parallel"), default="python")
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse für --engine parallel")
+    parser.add_argument("--skip", action="store_true", help="Bild-Messungen mit SkipMap")
+    parser.add_argument("--camera", metavar="DATEI", help="JSON Kamera-Weg zum Abspielen")
+    parser.add_argument("--record-camera", metavar="DATEI",
+                        help="speichert den Standard Kamera-Weg als JSON")
+    parser.add_argument("--out", metavar="DATEI", help="speichert die Ergebnisse als JSON")
+    parser.add_argument("--compare", metavar="DATEI", help="früherer Lauf zum Vergleichen")
+    args = parser.parse_args(argv)
+    if args.skip and args.engine != "python":
+        parser.error("--skip gibt es nur mit --engine python")
+
+    poses = None
+    if args.camera:
+        with open(args.camera, encoding="utf-8") as file:
+            poses = json.load(file)
+    if args.record_camera:
+        with open(args.record_camera, "w", encoding="utf-8") as file:
+            json.dump(camera_path(generated_maze(args.render_size)), file)
+
+    results = run_benchmarks(args.sizes, args.widths, args.repeat, args.render_size,
+                             poses, args.engine, args.skip, args.workers)
+    run = {"meta": metadata(), "results": results}
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as file:
+            json.dump(run, file, indent=2)
+    else:
+        json.dump(run, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            old = json.load(file)
+        for line in compare(old, run):
+            print(line, file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
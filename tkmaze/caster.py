@@ -0,0 +1,597 @@
+"""src/caster.py
+
+Enthält die Caster Class, die die Strahlen des Raycasters ohne tkinter berechnet.
+
+Dieses Modul importiert kein tkinter, damit Bilder auch auf Rechnern ohne Bildschirm
+berechnet werden können (siehe headless.py).
+"""
+
+import math
+from .accel import SkipMap
+from .cell import NORTH, SOUTH, EAST, WEST
+from .world import ChunkedWorld
+
+# Wandfarben je nach Zahl in map_data, für x-Seiten (0) und verdunkelt für y-Seiten (1)
+WALL_RGB = [
+    [(150,150,150), (50,50,50), (50,150,50), (0,0,150)],
+    [(125,125,125), (41,41,41), (41,125,41), (0,0,125)],
+]
+WALL_HEX = [[f"#{r:02x}{g:02x}{b:02x}" for r, g, b in colors] for colors in WALL_RGB]
+
+# Bit einer Wand -> Verschiebung von Reihe und Spalte in map_data, ausgehend von der Zelle
+WALL_OFFSETS = {
+    NORTH: (-1, 0),
+    SOUTH: (1, 0),
+    EAST: (0, 1),
+    WEST: (0, -1),
+}
+
+# Anzahl der Nebel-Stufen zwischen voller Wandfarbe und Nebelfarbe
+FOG_LEVELS = 16
+
+# längster Teilschritt einer Bewegung in Feldern, kürzer als eine Wand dick ist
+MAX_SUBSTEP = 0.25
+
+def fog_tables(fog_rgb) -> tuple[list, list]:
+    """
+    fog_tables mischt jede Wandfarbe in FOG_LEVELS + 1 Stufen mit der Nebelfarbe.
+
+    Args:
+        fog_rgb (tuple(int, int, int)): Farbe des Nebels.
+
+    Returns:
+        tuple([[[tuple]]], [[[str]]]): RGB Werte und Hex-Werte nach Stufe, Seite und Zahl in map_data.
+    """
+    rgb = []
+    for level in range(FOG_LEVELS + 1):
+        fog = level / FOG_LEVELS
+        rgb.append([[tuple(int(c + (f - c) * fog) for c, f in zip(color, fog_rgb))
+                     for color in colors] for colors in WALL_RGB])
+    hex_colors = [[[f"#{r:02x}{g:02x}{b:02x}" for r, g, b in colors] for colors in sides]
+                  for sides in rgb]
+    return rgb, hex_colors
+
+class Caster:
+    """
+    Class, die ohne tkinter für jede Spalte eines Bildes einen Strahl durch das Labyrinth schickt.
+
+    Attributes:
+        cell_data (Maze): Das Labyrinth bestehend aus Reihen von Zellen. 
+        map_data ([memoryview]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen,
+            Sichten auf Maze.raster().
+        raster (memoryview): map_data als zweidimensionale Sicht, None für mmap und Welt.
+        world (ChunkedWorld): die unendliche Welt, wenn cell_data eine ist, sonst None.
+        width (int): Anzahl der Spalten des Bildes.
+        height (int): Höhe des Bildes in Pixeln.
+        ray_step (int): Anzahl der Spalten pro Strahl, 1 für einen Strahl pro Spalte.
+        mov_speed (float): Strecke eines einzelnen Schritts mit up_press und down_press.
+        rot_speed (float): Winkel einer einzelnen Drehung mit left_press und right_press.
+        move_rate (float): Geschwindigkeit des Spielers in Feldern pro Sekunde.
+        turn_rate (float): Drehgeschwindigkeit des Spielers im Bogenmaß pro Sekunde.
+        pos ([float]): initiale x und y position des Spielers.
+        dir ([float]): initiale x und y ausrichtung des Spielers
+        plane ([float]): x und y ausrichtung der Kamera
+        engine (NumpyEngine): berechnet alle Strahlen gleichzeitig (oder StripEngine in Streifen),
+            None für die Python-Schleife.
+        skip_map (SkipMap): Abstände zur nächsten Wand, None wenn nicht übersprungen wird.
+        max_distance (float): größte Sichtweite, None für unbegrenzt.
+        fog_rgb ([[[tuple]]]): Wandfarben nach Nebel-Stufe, None ohne max_distance.
+        fog_hex ([[[str]]]): Wandfarben als Hex-Wert nach Nebel-Stufe, None ohne max_distance.
+    """
+    def __init__(self, cell_data, width, height, engine="python", skip=False, max_distance=None,
+                 fog=(0, 0, 0), workers=None, background=None):
+        """
+        __init__ wird aufgerufen, wenn ein Caster Initialisiert wird.
+
+        Attributes:
+            cell_data ([[Cell]]): das Labyrinth bestehend aus Reihen von Zellen
+                oder eine ChunkedWorld.
+            width (int): Anzahl der Spalten, für die ein Strahl berechnet wird.
+            height (int): Höhe des Bildes in Pixeln.
+            engine (str): "python" für die Schleife über alle Spalten, "numpy" für NumpyEngine,
+                "parallel" für StripEngine.
+            skip (bool): überspringt leere Bereiche mit einer SkipMap (nur "python").
+            max_distance (float): größte Sichtweite, Wände dahinter verschwinden im Nebel.
+            fog (tuple(int, int, int)): Farbe des Nebels.
+            workers (int): Anzahl der Prozesse für "parallel", standardmäßig alle Kerne.
+            background (tuple(int, int, int)): Farbe von Decke und Boden, wenn die Worker von
+                "parallel" das Bild selbst zeichnen, standardmäßig die Farbe des Nebels.
+        """
+        # Standardt Variablen
+        self.cell_data = cell_data
+        self.world = cell_data if isinstance(cell_data, ChunkedWorld) else None
+        self.raster = None
+        if self.world is not None:
+            # die Welt erzeugt ihre Kacheln selbst, wenn sie gelesen werden
+            self.map_data = self.world
+        elif cell_data.mapped:
+            # gespeicherte Labyrinthe aus einer mmap werden erst beim Zugriff umgewandelt
+            self.map_data = cell_data.lazy_raster()
+        else:
+            # Sichten auf einen gemeinsamen Speicher statt einer Liste von Listen
+            self.map_data = cell_data.raster_rows()
+            self.raster = cell_data.raster_view()
+        self.width = width
+        self.height = height
+        self.ray_step = 1
+
+        # Kamera Variablen
+        self.mov_speed = 0.2
+        self.rot_speed = 0.06
+        self.move_rate = 3.0
+        self.turn_rate = 2.5
+        self.pos = self.find_start()
+        self.dir = [1.0, 0.0]
+        self.plane = [0.0, 0.66]
+
+        # Beschleunigung und Sichtweite
+        if skip and self.world is not None:
+            raise ValueError("Die SkipMap braucht ein endliches Labyrinth")
+        # die Engines rechnen ohne SkipMap, sie wäre nur Speicher und Zeit beim Start
+        if skip and engine != "python":
+            raise ValueError(f"Die SkipMap gibt es nur für die Engine python, nicht {engine}")
+        if skip:
+            # das Raster am Stück ist schneller gelesen als Reihe für Reihe
+            self.skip_map = SkipMap(self.map_data if self.raster is None else self.raster)
+        else:
+            self.skip_map = None
+        if max_distance is not None and max_distance <= 0:
+            raise ValueError("max_distance muss größer als 0 sein")
+        self.max_distance = max_distance
+        self.fog_rgb, self.fog_hex = fog_tables(fog) if max_distance is not None else (None, None)
+
+        # Raycasting Engine
+        if engine != "python" and self.world is not None:
+            raise ValueError(f"Die Engine {engine} braucht ein endliches Labyrinth")
+        match engine:
+            case "python":
+                self.engine = None
+            case "numpy":
+                from .engine import NumpyEngine # braucht numpy, deshalb erst hier
+                # numpy übernimmt das Raster ohne Kopie
+                self.engine = NumpyEngine(self.map_data if self.raster is None else self.raster)
+            case "parallel":
+                from .parallel import StripEngine # startet Prozesse, deshalb erst hier
+                self.engine = StripEngine(self.map_data, workers, fog,
+                                          fog if background is None else background)
+            case _:
+                raise ValueError(f"Unbekannte Engine: {engine}")
+
+    def cast(self) -> list[tuple[int, int, list[int]]]:
+        """
+        cast führt den DDA-Algorithmus für jede ray_step-te Spalte des Fensters aus.
+
+        Returns:
+            [tuple(int, int, [int])]: Linienhöhe, getroffene Seite und map_pos jedes Strahls,
+            ein Strahl gilt für ray_step Spalten.
+        """
+        if self.engine is not None:
+            return self.cast_engine()
+
+        rays = []
+        if self.world is not None:
+            # Kacheln werden zwischen den Bildern erzeugt, siehe ChunkedWorld.prefetch
+            self.world.blocking = False
+        try:
+            for x in range(0, self.width, self.ray_step):
+                side, perp_wall_dist, map_pos = self.cast_ray(x)
+                line_height = int(self.height / perp_wall_dist) if perp_wall_dist > 0 else self.height
+                rays.append((line_height, side, map_pos))
+        finally:
+            if self.world is not None:
+                self.world.blocking = True
+        return rays
+
+    def cast_ray(self, x) -> tuple[int, float, list[int]]:
+        """
+        cast_ray führt den DDA-Algorithmus für eine Spalte aus.
+
+        Args:
+            x (int): Spalte des Bildes.
+
+        Returns:
+            tuple(int, float, [int]): getroffene Seite, Distanz und map_pos der Wand.
+        """
+        # Kamera x-Position
+        cam_x = 2 * x / self.width - 1
+        # x und y Richtung des Strahls
+        ray_dir = self.calculate_ray_direction(cam_x)
+        # Position als Index in Map-data, abgerundet, weil die Welt negativ sein kann
+        map_pos = [math.floor(self.pos[0]), math.floor(self.pos[1])]
+        side_dist, delta_dist = self.calculate_delta_distances(ray_dir, map_pos)
+        step = self.calculate_step(ray_dir)
+        side, perp_wall_dist = self.perform_dda(map_pos, side_dist, delta_dist, step)
+        return side, perp_wall_dist, map_pos
+
+    def close(self):
+        """
+        close beendet die Prozesse einer Engine, falls sie welche hat.
+        """
+        if hasattr(self.engine, "close"):
+            self.engine.close()
+
+    def cast_engine(self) -> list[tuple[int, int, list[int]]]:
+        """
+        cast_engine lässt die Engine alle Strahlen auf einmal berechnen.
+
+        Returns:
+            [tuple(int, int, [int])]: Linienhöhe, getroffene Seite und map_pos jeder Spalte.
+        """
+        dist, sides, map_x, map_y = self.engine.cast(self.pos, self.dir, self.plane, self.width,
+                                                     self.ray_step, self.max_distance)
+        rays = []
+        for perp_wall_dist, side, hit_x, hit_y in zip(dist.tolist(), sides.tolist(),
+                                                      map_x.tolist(), map_y.tolist()):
+            line_height = int(self.height / perp_wall_dist) if perp_wall_dist > 0 else self.height
+            rays.append((line_height, side, [hit_x, hit_y]))
+        return rays
+
+    def patch_walls(self, changes) -> list[tuple[int, int]]:
+        """
+        patch_walls überträgt entfernte Wände in map_data, ohne map_data neu zu bauen.
+
+        Args:
+            changes ([tuple(int, int)]): Index der Zelle und Bit der entfernten Wand,
+                wie von Maze.generate_steps geliefert.
+
+        Returns:
+            [tuple(int, int)]: Reihe und Spalte jedes geänderten Feldes in map_data.
+        """
+        if not isinstance(self.map_data, list):
+            raise ValueError("Nur ein Labyrinth im Speicher kann verändert werden")
+        width = self.cell_data.grid_width
+        fields = []
+        for index, bit in changes:
+            # Zelle x, y liegt in map_data bei Reihe 2y+1 und Spalte 2x+1
+            d_row, d_col = WALL_OFFSETS[bit]
+            row = 2 * (index // width) + 1 + d_row
+            col = 2 * (index % width) + 1 + d_col
+            self.map_data[row][col] = 0
+            if self.engine is not None:
+                self.engine.patch(row, col, 0)
+            if self.skip_map is not None:
+                self.skip_map.update_cell(self.map_data, row, col)
+            fields.append((row, col))
+        return fields
+
+    def set_maze(self, cell_data, skip_map=None):
+        """
+        set_maze tauscht das Labyrinth zwischen zwei Bildern aus und setzt den Spieler an den Start.
+
+        Args:
+            cell_data (Maze): das neue Labyrinth, sein Raster ist am besten schon gebaut.
+            skip_map (SkipMap): fertige SkipMap des neuen Labyrinths, wird sonst hier berechnet.
+        """
+        if self.world is not None or cell_data.mapped:
+            raise ValueError("Nur ein Labyrinth im Speicher kann ausgetauscht werden")
+        map_data = cell_data.raster_rows()
+        raster = cell_data.raster_view()
+        if self.skip_map is not None and skip_map is None:
+            skip_map = SkipMap(raster)
+        if self.engine is not None:
+            self.engine.update(raster)
+
+        # erst wenn alles fertig ist, zeigt der Caster auf das neue Labyrinth
+        self.cell_data = cell_data
+        self.map_data = map_data
+        self.raster = raster
+        if self.skip_map is not None:
+            self.skip_map = skip_map
+        self.pos = self.find_start()
+        self.dir = [1.0, 0.0]
+        self.plane = [0.0, 0.66]
+
+    def column_span(self, line_height) -> tuple[int, int]:
+        """
+        column_span gibt an, von welchem bis zu welchem Pixel eine Wand gezeichnet wird.
+
+        Args:
+            line_height (int): Höhe der Wand.
+
+        Returns:
+            tuple(int, int): erster und letzter Pixel der Linie.
+        """
+        draw_start = max(-line_height // 2 + self.height // 2, 0)
+        draw_end = min(line_height // 2 + self.height // 2, self.height)
+        return draw_start, draw_end
+
+    def fog_level(self, line_height) -> int:
+        """
+        fog_level bestimmt die Nebel-Stufe einer Wand aus ihrer Linienhöhe.
+
+        Args:
+            line_height (int): Höhe der Wand.
+
+        Returns:
+            int: 0 für volle Wandfarbe bis FOG_LEVELS für reine Nebelfarbe.
+        """
+        if line_height <= 0:
+            return FOG_LEVELS
+        distance = self.height / line_height
+        return min(FOG_LEVELS, int(distance / self.max_distance * FOG_LEVELS))
+
+    def wall_rgb(self, side, map_pos, line_height=None) -> tuple[int, int, int]:
+        """
+        wall_rgb gibt die Farbe einer Wand als RGB Werte wieder.
+
+        Args:
+            side (int): Gibt an, ob die Seite nach x oder y ausgerichtet ist.
+            map_pos ([int]): Position der Wand als x und y Index in map_data.
+            line_height (int): Höhe der Wand, mit max_distance für den Nebel.
+
+        Returns:
+            tuple(int, int, int): RGB Werte der Wand.
+        """
+        value = self.map_data[map_pos[0]][map_pos[1]]
+        if self.fog_rgb is None or line_height is None:
+            return WALL_RGB[side][value]
+        return self.fog_rgb[self.fog_level(line_height)][side][value]
+
+    def wall_color(self, side, map_pos, line_height=None) -> str:
+        """
+        wall_color gibt die Farbe einer Wand als Hex-Wert für tkinter wieder.
+
+        Args:
+            side (int): Gibt an, ob die Seite nach x oder y ausgerichtet ist.
+            map_pos ([int]): Position der Wand als x und y Index in map_data.
+            line_height (int): Höhe der Wand, mit max_distance für den Nebel.
+
+        Returns:
+            str: Farbe als "#rrggbb".
+        """
+        value = self.map_data[map_pos[0]][map_pos[1]]
+        if self.fog_hex is None or line_height is None:
+            return WALL_HEX[side][value]
+        return self.fog_hex[self.fog_level(line_height)][side][value]
+
+    def calculate_ray_direction(self, camera_x) -> list[float]:
+        """
+        calculate_ray_direction Berechnet die Richtung des Strahls basierend auf der Kameraposition.
+
+        Args:
+            camera_x (float): x-Koordinate in Kamera-Raum.
+
+        Returns:
+            [float]: x und y Richtung des Strahls.
+        """
+        ray_dir_x = self.dir[0] + self.plane[0] * camera_x
+        ray_dir_y = self.dir[1] + self.plane[1] * camera_x
+        return [ray_dir_x, ray_dir_y]
+
+    def calculate_delta_distances(self, ray_dir, map_pos) -> tuple[list[float], list[float]]:
+        """
+        calculate_delta_distances Berechnet die Seiten- und Delta-Distanzen für den DDA-Algorithmus.
+
+        Args:
+            ray_dir ([float]): x und y Richtung des Strahls.
+            map_pos ([int]): Position der Kamera als x und y Index in map_data.
+
+        Returns:
+            tuple([float], [float]): Seiten-Distanzen und Delta-Distanzen 
+        """
+        delta_dist_x = abs(1 / ray_dir[0]) if ray_dir[0] != 0 else float('inf')
+        delta_dist_y = abs(1 / ray_dir[1]) if ray_dir[1] != 0 else float('inf')
+        if ray_dir[0] < 0:
+            side_dist_x = (self.pos[0] - map_pos[0]) * delta_dist_x
+        else:
+            side_dist_x = (map_pos[0] + 1.0 - self.pos[0]) * delta_dist_x
+        if ray_dir[1] < 0:
+            side_dist_y = (self.pos[1] - map_pos[1]) * delta_dist_y
+        else:
+            side_dist_y = (map_pos[1] + 1.0 - self.pos[1]) * delta_dist_y
+        return [side_dist_x, side_dist_y], [delta_dist_x, delta_dist_y]
+
+    def calculate_step(self, ray_dir) -> list[int]:
+        """
+        calculate_step Bestimmt die Schrittwerte für den DDA-Algorithmus.
+
+        Args:
+            ray_dir ([float]): x und y Richtung des Strahls.
+
+        Returns:
+            [int]: x und y Schrittwerte
+        """
+        # negativ, wenn x/y kleiner 0, sonst positiv
+        step_x = -1 if ray_dir[0] < 0 else 1
+        step_y = -1 if ray_dir[1] < 0 else 1
+        return [step_x, step_y]
+
+    def perform_dda(self, map_pos, side_dist, delta_dist, step) -> tuple[int, float]:
+        """
+        Führt den DDA-Algorithmus aus, um die Wand zu finden.
+
+        Args:
+            map_pos ([int]): Position der Kamera als x und y Index in map_data.
+            side_dist ([float]): Länge des Strahls, um die 1. x/y Seite tu treffen.
+            delta_dist ([float]): Länge des Strahls, um von einer x/y-Seite die nächste zu treffen.
+            step (int): Inkrement-Wert um map_pos auf den Strahl zu Richten.
+
+        Returns:
+            tuple(int, float): die Getroffene Seite (x oder y zugewendet) und Distanz zu dieser.
+        """
+        if self.skip_map is not None or self.max_distance is not None:
+            return self.perform_dda_skip(map_pos, side_dist, delta_dist, step)
+        hit = False
+        side = 0
+        # während noch keine Seite getroffen wurde
+        while not hit: # Seite noch nicht getroffen, gehe zur nächsten Seite
+            if side_dist[0] < side_dist[1]: # X-Seite, nicht getroffen
+                side_dist[0] += delta_dist[0]
+                map_pos[0] += step[0]
+                side = 0
+            else:                           # Y-Seite, nicht getroffen
+                side_dist[1] += delta_dist[1]
+                map_pos[1] += step[1]
+                side = 1
+            if self.map_data[map_pos[0]][map_pos[1]] > 0: # Seite getroffen
+                hit = True
+        if side == 0: # X-Seite
+            perp_wall_dist = side_dist[0] - delta_dist[0]
+        else:         # Y-Seite
+            perp_wall_dist = side_dist[1] - delta_dist[1]
+        return side, perp_wall_dist
+
+    def perform_dda_skip(self, map_pos, side_dist, delta_dist, step) -> tuple[int, float]:
+        """
+        perform_dda_skip führt den DDA-Algorithmus mit SkipMap und Sichtweite aus.
+
+        Macht der Strahl mehrere Schritte entlang einer Achse, bevor er die andere kreuzt,
+        werden sie auf einmal gemacht, soweit der Gang laut SkipMap leer ist. Der letzte
+        dieser Schritte wird normal gemacht, damit Rundungsfehler keine Ecke überspringen.
+        Mit inf als Seiten-Distanz (Strahl parallel zur Achse) ist ceil unendlich groß,
+        deshalb wird dort nur die Länge des Ganges benutzt.
+        Erreicht der Strahl max_distance, wird er ohne Treffer beendet.
+
+        Args:
+            map_pos ([int]): Position der Kamera als x und y Index in map_data.
+            side_dist ([float]): Länge des Strahls, um die 1. x/y Seite tu treffen.
+            delta_dist ([float]): Länge des Strahls, um von einer x/y-Seite die nächste zu treffen.
+            step (int): Inkrement-Wert um map_pos auf den Strahl zu Richten.
+
+        Returns:
+            tuple(int, float): die Getroffene Seite und Distanz zu dieser, inf ohne Treffer.
+        """
+        map_data = self.map_data
+        skip_map = self.skip_map
+        max_distance = math.inf if self.max_distance is None else self.max_distance
+        # lokale Variablen, weil diese Schleife für jede Spalte läuft
+        side_x, side_y = side_dist
+        delta_x, delta_y = delta_dist
+        step_x, step_y = step
+        map_x, map_y = map_pos
+        if skip_map is not None:
+            # Längen der Gänge in Richtung des Strahls, eine Tabelle pro Achse
+            runs_x = skip_map.runs[0][step_x > 0]
+            runs_y = skip_map.runs[1][step_y > 0]
+        while True:
+            if side_x < side_y: # X-Seite
+                if side_x > max_distance:
+                    break
+                # erst ab 3 Schritten entlang x vor der nächsten y-Seite lohnt die SkipMap
+                if skip_map is not None and side_y - side_x > 2 * delta_x:
+                    count = runs_x[map_x][map_y] - 1
+                    if side_y != math.inf:
+                        count = min(count, math.ceil((side_y - side_x) / delta_x) - 1)
+                    if count > 0:
+                        side_x += count * delta_x
+                        map_x += count * step_x
+                side_x += delta_x
+                map_x += step_x
+                side = 0
+            else:               # Y-Seite
+                if side_y > max_distance:
+                    break
+                if skip_map is not None and side_x - side_y > 2 * delta_y:
+                    count = runs_y[map_x][map_y] - 1
+                    if side_x != math.inf:
+                        count = min(count, math.ceil((side_x - side_y) / delta_y) - 1)
+                    if count > 0:
+                        side_y += count * delta_y
+                        map_y += count * step_y
+                side_y += delta_y
+                map_y += step_y
+                side = 1
+            if map_data[map_x][map_y] > 0: # Seite getroffen
+                map_pos[0], map_pos[1] = map_x, map_y
+                return side, (side_x - delta_x if side == 0 else side_y - delta_y)
+        # alle weiteren Felder liegen hinter der Sichtweite
+        map_pos[0], map_pos[1] = map_x, map_y
+        return 0, math.inf
+
+    def rotate(self, angle):
+        """
+        rotate dreht Ausrichtung und Kamera-Ebene des Spielers.
+
+        Args:
+            angle (float): Winkel im Bogenmaß, positiv dreht nach rechts.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        self.dir = [self.dir[0] * cos - self.dir[1] * sin, self.dir[0] * sin + self.dir[1] * cos]
+        self.plane = [self.plane[0] * cos - self.plane[1] * sin,
+                      self.plane[0] * sin + self.plane[1] * cos]
+
+    def move(self, distance):
+        """
+        move bewegt den Spieler entlang seiner Ausrichtung, Wände halten ihn auf.
+
+        Die Strecke wird in Teilschritte von höchstens MAX_SUBSTEP Feldern zerlegt und jeder
+        Teilschritt einzeln geprüft. So läuft der Spieler auch bei einem langen Bild nicht
+        durch eine Wand, die nur ein Feld dick ist.
+
+        Args:
+            distance (float): Strecke in Feldern, negativ läuft nach hinten.
+        """
+        floor = math.floor
+        map_data = self.map_data
+        steps = max(1, math.ceil(abs(distance) / MAX_SUBSTEP))
+        dx = self.dir[0] * distance / steps
+        dy = self.dir[1] * distance / steps
+        x, y = self.pos
+        for _ in range(steps):
+            # jede Achse einzeln, damit der Spieler an Wänden entlang gleitet
+            if not map_data[floor(x + dx)][floor(y)]:
+                x += dx
+            if not map_data[floor(x)][floor(y + dy)]:
+                y += dy
+        self.pos = [x, y]
+
+    def left_press(self, event):
+        """
+        left_press wird aufgerufen, wenn 'a' gedrückt wird, Spieler dreht sich nach links.
+
+        Args:
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        self.rotate(-self.rot_speed)
+
+    def right_press(self, event):
+        """
+        right_press wird aufgerufen, wenn 'd' gedrückt wird, Spieler dreht sich nach rechts.
+
+        Args:
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        self.rotate(self.rot_speed)
+
+    def up_press(self, event):
+        """
+        up_press wird aufgerufen, wenn 'w' gedrückt wird, Spieler läuft nach vorne.
+
+        Args:
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        self.move(self.mov_speed)
+
+    def down_press(self, event):
+        """
+        down_press wird aufgerufen, wenn 's' gedrückt wird, Spieler läuft nach hinten.
+
+        Args:
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        self.move(-self.mov_speed)
+
+    def find_start(self) -> list[float]:
+        """
+        Findet den Start des Labyrinths, damit der Spieler nicht in eine Wand platziert wird.
+
+        Returns:
+                [float]: x und y Start-Werte
+        """
+        if self.world is not None:
+            return self.world.find_start()
+        start_x = 2.5
+        start_y = 1.5
+        for x, row in enumerate(self.cell_data):
+            for y, cell in enumerate(row):
+                if cell == 2:
+                    nb_cells = self.cell_data.get_connected_neighbors((x-1,y-1))
+                    if not nb_cells:
+                        # noch nicht generiert, der Spieler steht in der Start-Zelle
+                        return [1.5, 1.5]
+                    start_y = float(x / 2.0 + nb_cells[0].pos_x + 1.0) # wtf
+                    start_x = float(y / 2.0 + nb_cells[0].pos_y + 1.0)
+                    return [start_x, start_y]
+
+        start = [ start_x, start_y ]
+        return start
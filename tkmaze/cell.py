@@ -1,59 +1,189 @@
 """src/cell.py
 
 Enthält Die Cell class, aus der das Labyrinth Besteht.
+
+Die Wände aller Zellen liegen als 4-Bit Masken in einem flachen bytearray im Labyrinth,
+eine Cell ist nur noch eine leichte Sicht auf einen Eintrag darin.
 """
 
+# Bits der Wand-Masken
+NORTH = 1
+SOUTH = 2
+EAST = 4
+WEST = 8
+ALL_WALLS = NORTH | SOUTH | EAST | WEST
+
+# Name einer Wand -> Bit
+WALL_BITS = {
+        "north": NORTH,
+        "south": SOUTH,
+        "east": EAST,
+        "west": WEST,
+}
+
+# Bit einer Wand -> Bit der gegenüberliegenden Wand
+OPPOSITE = {
+        NORTH: SOUTH,
+        SOUTH: NORTH,
+        EAST: WEST,
+        WEST: EAST,
+}
+
+class Walls:
+    """
+    Class, die die 4 Wände einer Zelle wie ein dict darstellt.
+
+    Attributes:
+        maze (Maze): Das Labyrinth, in dem die Wände gespeichert sind.
+        index (int): Index der Zelle in maze.walls.
+    """
+    __slots__ = ("maze", "index")
+
+    def __init__(self, maze, index):
+        """
+        __init__ wird aufgerufen, wenn eine Wand-Sicht Initialisiert wird.
+
+        Args:
+            maze (Maze): Das Labyrinth, in dem die Wände gespeichert sind.
+            index (int): Index der Zelle in maze.walls.
+        """
+        self.maze = maze
+        self.index = index
+
+    def __getitem__(self, name) -> bool:
+        """
+        __getitem__ gibt an, ob eine Wand an oder aus ist.
+
+        Args:
+            name (str): "north", "south", "east" oder "west".
+
+        Returns:
+            bool: True, wenn es die Wand gibt, sonst False.
+        """
+        return bool(self.maze.walls[self.index] & WALL_BITS[name])
+
+    def __setitem__(self, name, value):
+        """
+        __setitem__ schaltet eine Wand an oder aus.
+
+        Args:
+            name (str): "north", "south", "east" oder "west".
+            value (bool): True, wenn es die Wand geben soll, sonst False.
+        """
+        if value:
+            self.maze.walls[self.index] |= WALL_BITS[name]
+        else:
+            self.maze.walls[self.index] &= ~WALL_BITS[name]
+        self.maze.revision += 1
+
+    def __iter__(self):
+        """
+        __iter__ gibt die Namen der Wände wie bei einem dict wieder.
+
+        Yields:
+            str: Name einer Wand.
+        """
+        yield from WALL_BITS
+
+    def __len__(self) -> int:
+        return len(WALL_BITS)
+
+    def items(self):
+        """
+        items gibt alle Wände als (Name, an/aus) Paare wieder.
+
+        Returns:
+            [(str, bool)]: Name und Zustand jeder Wand.
+        """
+        return [(name, self[name]) for name in WALL_BITS]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
 class Cell:
     """
     Class, die eine Zelle darstellt.
 
     Attributes:
+        maze (Maze): Das Labyrinth, in dem die Zelle liegt.
         pos_x (int): x-Position der Zelle im Labyrinth.
         pos_y (int): y-Position der Zelle im Labyrinth.
+        index (int): Index der Zelle in maze.walls und maze.visited.
         visited (bool): markiert die Zelle as besucht oder unbesucht.
-        walls (dict): Enthält die 4 Wände um die Zelle, diese können an oder aus sein.
+        walls (Walls): Enthält die 4 Wände um die Zelle, diese können an oder aus sein.
     """
-    def __init__(self, pos_x , pos_y, visited = False):
+    __slots__ = ("maze", "pos_x", "pos_y", "index")
+
+    def __init__(self, maze, pos_x, pos_y):
         """
         __init__ wird aufgerufen, wenn eine Zelle Initialisiert wird.
-        
+
         Args:
+            maze (Maze): Das Labyrinth, in dem die Zelle liegt.
             pos_x (int): x-Position der Zelle im Labyrinth.
             pos_y (int): y-Position der Zelle im Labyrinth.
-            visited (bool): markiert die Zelle as besucht oder unbesucht.
         """
+        self.maze = maze
         self.pos_x = pos_x
         self.pos_y = pos_y
-        self.visited = visited
-        self.walls = {
-                "north": True,
-                "south": True,
-                "east": True,
-                "west": True,
-        }
+        self.index = pos_y * maze.grid_width + pos_x
 
-    def is_wall_between(self, nb_cell) -> bool:
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return self.maze is other.maze and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.maze), self.index))
+
+    def __repr__(self) -> str:
+        return f"Cell({self.pos_x}, {self.pos_y})"
+
+    @property
+    def visited(self) -> bool:
+        return bool(self.maze.visited[self.index])
+
+    @visited.setter
+    def visited(self, value):
+        self.maze.visited[self.index] = 1 if value else 0
+
+    @property
+    def walls(self) -> Walls:
+        return Walls(self.maze, self.index)
+
+    def wall_bit(self, nb_cell) -> int:
         """
-        is_wall_between gibt an, ob die Wand zu einem Nachbar an oder aus ist.
+        wall_bit gibt das Bit der Wand zu einem Nachbar an.
 
         Args:
             nb_cell (Cell): die Nachbarzelle.
 
         Returns:
-            bool: True, wenn es die Wand gibt, sonst False.
+            int: Bit der Wand, 0 wenn die Zellen keine Nachbarn sind.
         """
         if self.pos_x == nb_cell.pos_x:   # Gleiche X
             if self.pos_y - nb_cell.pos_y == 1:  # Nachbar ist oben
-                return self.walls["north"]
+                return NORTH
             if self.pos_y - nb_cell.pos_y == -1: # Nachbar ist unten
-                return self.walls["south"]
+                return SOUTH
         elif self.pos_y == nb_cell.pos_y: # Gleiche Y
             if self.pos_x - nb_cell.pos_x == 1:  # Nachbar ist links
-                return self.walls["west"]
+                return WEST
             if self.pos_x - nb_cell.pos_x == -1: # Nachbar ist rechts
-                return self.walls["east"]
+                return EAST
+        return 0
+
+    def is_wall_between(self, nb_cell) -> bool:
+        """
+        is_wall_between gibt an, ob die Wand zu einem Nachbar an oder aus ist.
 
-        return False
+        Args:
+            nb_cell (Cell): die Nachbarzelle.
+
+        Returns:
+            bool: True, wenn es die Wand gibt, sonst False.
+        """
+        return bool(self.maze.walls[self.index] & self.wall_bit(nb_cell))
 
     def remove_wall_between(self, nb_cell):
         """
@@ -62,17 +192,6 @@ class Cell:
         Args:
             nb_cell (Cell): die Nachbarzelle.
         """
-        if self.pos_x == nb_cell.pos_x:  # Gleiche X
-            if self.pos_y - nb_cell.pos_y == 1: # Nachbar ist oben
-                self.walls["north"] = False
-                nb_cell.walls["south"] = False
-            if self.pos_y - nb_cell.pos_y == -1: # Nachbar ist unten
-                self.walls["south"] = False
-                nb_cell.walls["north"] = False
-        elif self.pos_y == nb_cell.pos_y: # Gleiche Y
-            if self.pos_x - nb_cell.pos_x == 1:  # Nachbar ist links
-                self.walls["west"] = False
-                nb_cell.walls["east"] = False
-            if self.pos_x - nb_cell.pos_x == -1: # Nachbar ist rechts
-                self.walls["east"] = False
-                nb_cell.walls["west"] = False
+        bit = self.wall_bit(nb_cell)
+        if bit:
+            self.maze.remove_wall(self.index, bit)
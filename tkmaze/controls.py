@@ -0,0 +1,107 @@
+"""src/controls.py
+
+Enthält die Controls Class, die gedrückte Tasten merkt und den Spieler einmal pro Bild bewegt.
+
+Die Tasten werden nicht mehr direkt mit einer Bewegung verbunden, sonst hängt die
+Geschwindigkeit von der Tastenwiederholung des Betriebssystems ab. Stattdessen merkt sich
+Controls beim Drücken und Loslassen, welche Tasten gehalten werden, und der Raycaster
+bewegt den Spieler in jedem tick um Geschwindigkeit mal vergangene Zeit.
+"""
+
+# Taste -> (Richtung der Bewegung, Richtung der Drehung)
+KEYS = {
+        "w": (1, 0),
+        "s": (-1, 0),
+        "a": (0, -1),
+        "d": (0, 1),
+        "up": (1, 0),
+        "down": (-1, 0),
+        "left": (0, -1),
+        "right": (0, 1),
+}
+
+# längste Zeit, die ein Bild zählt, damit der Spieler nach einer Pause nicht springt
+MAX_FRAME_TIME = 0.1
+
+class Controls:
+    """
+    Class, die gehaltene Tasten verfolgt und daraus die Bewegung eines Bildes berechnet.
+
+    Attributes:
+        caster (Caster): Der Caster, dessen Spieler bewegt wird.
+        held (set): Namen der Tasten, die gerade gehalten werden.
+    """
+    def __init__(self, caster):
+        """
+        __init__ wird aufgerufen, wenn Controls Initialisiert werden.
+
+        Args:
+            caster (Caster): Der Caster, dessen Spieler bewegt wird.
+        """
+        self.caster = caster
+        self.held = set()
+
+    def bind(self, root):
+        """
+        bind verbindet Drücken und Loslassen der Tasten des tkinter Fensters mit Controls.
+
+        Args:
+            root (Tk): das tkinter Fenster.
+        """
+        root.bind("<KeyPress>", self.key_press)
+        root.bind("<KeyRelease>", self.key_release)
+        # ohne Fokus kommt kein Loslassen an, die Taste bliebe sonst gedrückt
+        root.bind("<FocusOut>", self.release_all)
+
+    def key_press(self, event):
+        """
+        key_press wird aufgerufen, wenn eine Taste gedrückt wird.
+
+        Args:
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        key = event.keysym.lower()
+        if key in KEYS:
+            self.held.add(key)
+
+    def key_release(self, event):
+        """
+        key_release wird aufgerufen, wenn eine Taste losgelassen wird.
+
+        Args:
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        self.held.discard(event.keysym.lower())
+
+    def release_all(self, event=None):
+        """
+        release_all lässt alle Tasten los, z.B. wenn das Fenster den Fokus verliert.
+
+        Args:
+            event (event): von tkinter genutzt, um ein Ereignis mit der Funktion zu verbinden.
+        """
+        self.held.clear()
+
+    def update(self, dt) -> bool:
+        """
+        update bewegt und dreht den Spieler um die Strecke, die er in dt Sekunden zurücklegt.
+
+        Args:
+            dt (float): vergangene Zeit seit dem letzten Bild in Sekunden.
+
+        Returns:
+            bool: True, wenn eine Taste gehalten wird.
+        """
+        if not self.held:
+            return False
+        dt = min(dt, MAX_FRAME_TIME)
+        forward = sum(KEYS[key][0] for key in self.held)
+        turn = sum(KEYS[key][1] for key in self.held)
+        # "w" und "up" zusammen laufen nicht doppelt so schnell
+        forward = max(-1, min(1, forward))
+        turn = max(-1, min(1, turn))
+        if turn:
+            self.caster.rotate(turn * self.caster.turn_rate * dt)
+        if forward:
+            self.caster.move(forward * self.caster.move_rate * dt)
+        return True
@@ -0,0 +1,114 @@
+"""src/engine.py
+
+Enthält die NumpyEngine Class, die alle Strahlen eines Bildes gleichzeitig mit NumPy berechnet.
+
+NumPy wird nur von diesem Modul gebraucht, der normale Raycaster funktioniert auch ohne.
+"""
+
+import numpy as np
+
+class NumpyEngine:
+    """
+    Class, die den DDA-Algorithmus für alle Bildschirm-Spalten gleichzeitig ausführt.
+
+    Attributes:
+        grid (ndarray): Das Labyrinth als 2d uint8 Array, > 0 ist eine Wand.
+    """
+    def __init__(self, map_data):
+        """
+        __init__ wird aufgerufen, wenn eine NumpyEngine Initialisiert wird.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen.
+        """
+        self.grid = None
+        self.update(map_data)
+
+    def update(self, map_data):
+        """
+        update baut das Belegungs-Gitter neu aus map_data.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen
+                oder eine zweidimensionale memoryview, die ohne Kopie übernommen wird.
+        """
+        self.grid = np.asarray(map_data, dtype=np.uint8)
+
+    def patch(self, row, col, value):
+        """
+        patch ändert ein einzelnes Feld des Gitters, ohne es neu zu bauen.
+
+        Args:
+            row (int): Reihe in map_data.
+            col (int): Spalte in map_data.
+            value (int): neuer Wert, > 0 ist eine Wand.
+        """
+        self.grid[row, col] = value
+
+    def cast(self, pos, direction, plane, width, step=1, max_distance=None) -> tuple:
+        """
+        cast schickt für jede Spalte einen Strahl los und lässt alle gleichzeitig laufen.
+
+        Args:
+            pos ([float]): x und y Position der Kamera.
+            direction ([float]): x und y Ausrichtung der Kamera.
+            plane ([float]): x und y Ausrichtung der Kamera-Ebene.
+            width (int): Anzahl der Spalten.
+            step (int): Anzahl der Spalten pro Strahl, ein Strahl an jeder step-ten Spalte.
+            max_distance (float): größte Sichtweite, Strahlen dahinter haben die Distanz inf.
+
+        Returns:
+            tuple(ndarray, ndarray, ndarray, ndarray): Distanz, getroffene Seite
+            und x und y Index der getroffenen Zelle für jede Spalte.
+        """
+        # Kamera x-Position und Richtung aller Strahlen
+        cam_x = 2.0 * np.arange(0, width, step) / width - 1.0
+        count = cam_x.size
+        ray_x = direction[0] + plane[0] * cam_x
+        ray_y = direction[1] + plane[1] * cam_x
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta_x = np.abs(1.0 / ray_x)
+            delta_y = np.abs(1.0 / ray_y)
+
+            # Position als Index im Gitter
+            map_x = np.full(count, int(pos[0]), dtype=np.intp)
+            map_y = np.full(count, int(pos[1]), dtype=np.intp)
+
+            # Schrittwerte und Seiten-Distanzen
+            step_x = np.where(ray_x < 0, -1, 1)
+            step_y = np.where(ray_y < 0, -1, 1)
+            side_x = np.where(ray_x < 0, pos[0] - map_x, map_x + 1.0 - pos[0]) * delta_x
+            side_y = np.where(ray_y < 0, pos[1] - map_y, map_y + 1.0 - pos[1]) * delta_y
+
+        side = np.zeros(count, dtype=np.uint8)
+        missed = np.zeros(count, dtype=bool)
+        # Indizes der Strahlen, die noch keine Wand getroffen haben
+        active = np.arange(count)
+        grid = self.grid
+
+        while active.size:
+            # alle aktiven Strahlen gehen einen Schritt weiter
+            use_x = side_x[active] < side_y[active]
+            ix = active[use_x]
+            iy = active[~use_x]
+            side_x[ix] += delta_x[ix]
+            map_x[ix] += step_x[ix]
+            side[ix] = 0
+            side_y[iy] += delta_y[iy]
+            map_y[iy] += step_y[iy]
+            side[iy] = 1
+
+            # Strahlen, die eine Wand getroffen haben, sind fertig
+            hit = grid[map_x[active], map_y[active]] > 0
+            active = active[~hit]
+            if max_distance is not None and active.size:
+                # Strahlen hinter der Sichtweite sind ohne Treffer fertig
+                far = np.minimum(side_x[active], side_y[active]) > max_distance
+                missed[active[far]] = True
+                active = active[~far]
+
+        with np.errstate(invalid="ignore"):
+            dist = np.where(side == 0, side_x - delta_x, side_y - delta_y)
+        dist[missed] = np.inf
+        return dist, side, map_x, map_y
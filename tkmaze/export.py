@@ -0,0 +1,118 @@
+"""src/export.py
+
+Enthält Funktionen, die ein Labyrinth Reihe für Reihe in eine Datei schreiben.
+
+Alle Funktionen nehmen Reihen von Wand-Masken, wie sie Maze.iter_rows oder
+stream.generate_eller liefern, und schreiben sie in Blöcken in ein file-ähnliches Objekt,
+ohne das ganze Labyrinth vorher im Speicher aufzubauen.
+"""
+
+from .stream import ascii_lines, grid_lines
+from . import storage
+
+# ungefähre Anzahl Zeichen, die gesammelt werden, bevor in die Datei geschrieben wird
+CHUNK_SIZE = 1 << 16
+
+def write_lines(lines, file, chunk_size=CHUNK_SIZE) -> int:
+    """
+    write_lines sammelt Zeilen und schreibt sie in Blöcken in eine Datei.
+
+    Args:
+        lines (iterable(str)): Zeilen mit Zeilenumbruch.
+        file (file): Datei oder anderes Objekt mit einer write Methode.
+        chunk_size (int): ungefähre Größe eines Blocks in Zeichen.
+
+    Returns:
+        int: Anzahl geschriebener Zeichen.
+    """
+    written = 0
+    chunk = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            file.write("".join(chunk))
+            written += size
+            chunk = []
+            size = 0
+    if chunk:
+        file.write("".join(chunk))
+        written += size
+    return written
+
+def write_ascii(rows, grid_width, file, chunk_size=CHUNK_SIZE) -> int:
+    """
+    write_ascii schreibt das Labyrinth als ASCII-Bild, wie Maze.__str__.
+
+    Args:
+        rows (iterable(bytearray)): Wand-Masken jeder Reihe.
+        grid_width (int): länge des Labyrinths in Zellen.
+        file (file): Datei oder anderes Objekt mit einer write Methode.
+        chunk_size (int): ungefähre Größe eines Blocks in Zeichen.
+
+    Returns:
+        int: Anzahl geschriebener Zeichen.
+    """
+    return write_lines(ascii_lines(rows, grid_width), file, chunk_size)
+
+def write_grid(rows, grid_width, file, chunk_size=CHUNK_SIZE) -> int:
+    """
+    write_grid schreibt das Labyrinth als Liste von Reihen mit Zahlen, wie Maze.__iter__.
+
+    Args:
+        rows (iterable(bytearray)): Wand-Masken jeder Reihe.
+        grid_width (int): länge des Labyrinths in Zellen.
+        file (file): Datei oder anderes Objekt mit einer write Methode.
+        chunk_size (int): ungefähre Größe eines Blocks in Zeichen.
+
+    Returns:
+        int: Anzahl geschriebener Zeichen.
+    """
+    lines = (f"[{', '.join(map(str, line))}]\n" for line in grid_lines(rows, grid_width))
+    return write_lines(lines, file, chunk_size)
+
+def write_csv(rows, grid_width, file, chunk_size=CHUNK_SIZE) -> int:
+    """
+    write_csv schreibt das Labyrinth als CSV, eine Reihe von Zahlen pro Zeile.
+
+    Args:
+        rows (iterable(bytearray)): Wand-Masken jeder Reihe.
+        grid_width (int): länge des Labyrinths in Zellen.
+        file (file): Datei oder anderes Objekt mit einer write Methode.
+        chunk_size (int): ungefähre Größe eines Blocks in Zeichen.
+
+    Returns:
+        int: Anzahl geschriebener Zeichen.
+    """
+    lines = (",".join(map(str, line)) + "\n" for line in grid_lines(rows, grid_width))
+    return write_lines(lines, file, chunk_size)
+
+# Dateiendung -> Export Funktion
+WRITERS = {
+        ".txt": write_ascii,
+        ".csv": write_csv,
+        ".grid": write_grid,
+}
+
+def export_maze(maze, path) -> int:
+    """
+    export_maze schreibt ein Labyrinth in eine Datei, das Format ergibt sich aus der Dateiendung.
+
+    Args:
+        maze (Maze): Das Labyrinth.
+        path (str): Pfad der Datei, endet auf .txt, .csv, .grid oder .tkmz.
+
+    Returns:
+        int: Anzahl geschriebener Zeichen, 0 für das binäre .tkmz Format.
+    """
+    if path.endswith(".tkmz"):
+        storage.save(maze, path)
+        return 0
+    for suffix, writer in WRITERS.items():
+        if path.endswith(suffix):
+            break
+    else:
+        raise ValueError(f"Unbekanntes Dateiformat: {path}")
+    with open(path, "w", encoding="utf-8") as file:
+        return writer(maze.iter_rows(), maze.grid_width, file)
@@ -0,0 +1,149 @@
+"""src/framebuffer.py
+
+Enthält die Framebuffer Class, ein RGB Bild im Speicher, in das Spalten gezeichnet werden.
+
+Wird vom PhotoImage-Backend und vom Headless-Renderer benutzt und braucht kein tkinter.
+"""
+
+import struct
+import zlib
+
+class Framebuffer:
+    """
+    Class, die ein RGB Bild mit 3 Bytes pro Pixel, Reihe für Reihe, darstellt.
+
+    Attributes:
+        width (int): Länge des Bildes in Pixeln.
+        height (int): Höhe des Bildes in Pixeln.
+        background (tuple(int, int, int)): Farbe von Decke und Boden.
+        blank (bytes): leeres Bild in der Hintergrundfarbe.
+        pixels (bytearray): die Pixel des Bildes.
+    """
+    def __init__(self, width, height, background=(0, 0, 0), pixels=None):
+        """
+        __init__ wird aufgerufen, wenn ein Framebuffer Initialisiert wird.
+
+        Args:
+            width (int): Länge des Bildes in Pixeln.
+            height (int): Höhe des Bildes in Pixeln.
+            background (tuple(int, int, int)): Farbe von Decke und Boden.
+            pixels (memoryview): vorhandener Speicher für die Pixel, z.B. Shared Memory,
+                standardmäßig ein neues bytearray.
+        """
+        self.width = width
+        self.height = height
+        self.background = background
+        self.blank = bytes(background) * (width * height)
+        if pixels is None:
+            self.pixels = bytearray(self.blank)
+        else:
+            self.pixels = pixels[:len(self.blank)]
+
+    def clear(self):
+        """
+        clear füllt das ganze Bild mit der Hintergrundfarbe.
+        """
+        self.pixels[:] = self.blank
+
+    def draw_column(self, x, draw_start, draw_end, rgb):
+        """
+        draw_column zeichnet eine vertikale Linie, ein Farbkanal nach dem anderen.
+
+        Args:
+            x (int): Spalte der Linie.
+            draw_start (int): erster Pixel der Linie.
+            draw_end (int): Pixel nach dem letzten Pixel der Linie.
+            rgb (tuple(int, int, int)): Farbe der Linie.
+        """
+        count = draw_end - draw_start
+        if count <= 0:
+            return
+        # schreibt die Spalte mit Schrittweite einer Reihe
+        stride = self.width * 3
+        offset = draw_start * stride + x * 3
+        end = offset + count * stride
+        for channel, value in enumerate(rgb):
+            self.pixels[offset + channel:end:stride] = bytes((value,)) * count
+
+    def fill_column(self, x, draw_start, draw_end, rgb):
+        """
+        fill_column zeichnet eine ganze Spalte, die Wand und darüber und darunter den Hintergrund.
+
+        Wird benutzt, wenn mehrere Prozesse in ein Bild zeichnen und es nicht vorher gelöscht wird.
+
+        Args:
+            x (int): Spalte der Linie.
+            draw_start (int): erster Pixel der Wand.
+            draw_end (int): Pixel nach dem letzten Pixel der Wand.
+            rgb (tuple(int, int, int)): Farbe der Wand.
+        """
+        self.draw_column(x, 0, draw_start, self.background)
+        self.draw_column(x, draw_start, draw_end, rgb)
+        self.draw_column(x, max(draw_start, draw_end), self.height, self.background)
+
+    def draw_rays(self, rays, caster):
+        """
+        draw_rays löscht das Bild und zeichnet eine Spalte pro Strahl.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+            caster (Caster): liefert Position und Farbe jeder Linie.
+        """
+        self.clear()
+        for x, (line_height, side, map_pos) in enumerate(rays):
+            draw_start, draw_end = caster.column_span(line_height)
+            self.draw_column(x, draw_start, draw_end, caster.wall_rgb(side, map_pos, line_height))
+
+    def ppm(self) -> bytes:
+        """
+        ppm gibt das Bild im binären PPM (P6) Format wieder.
+
+        Returns:
+            bytes: Kopf und Pixel des Bildes.
+        """
+        return f"P6 {self.width} {self.height} 255\n".encode() + self.pixels
+
+    def png(self) -> bytes:
+        """
+        png gibt das Bild im PNG Format wieder, ohne zusätzliche Bibliotheken.
+
+        Returns:
+            bytes: die PNG Datei.
+        """
+        def chunk(kind, data):
+            return (struct.pack(">I", len(data)) + kind + data
+                    + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+        stride = self.width * 3
+        # jede Reihe beginnt mit Filter-Typ 0 (keiner)
+        raw = b"".join(b"\x00" + self.pixels[y * stride:(y + 1) * stride]
+                       for y in range(self.height))
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+                + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+    def save(self, path):
+        """
+        save speichert das Bild als .ppm oder .png, je nach Dateiendung.
+
+        Args:
+            path (str): Pfad der Datei.
+        """
+        if path.endswith(".png"):
+            data = self.png()
+        elif path.endswith(".ppm"):
+            data = self.ppm()
+        else:
+            raise ValueError(f"Unbekanntes Bildformat: {path}")
+        with open(path, "wb") as file:
+            file.write(data)
+
+    def as_array(self):
+        """
+        as_array gibt die Pixel ohne Kopie als NumPy Array der Form (height, width, 3) wieder.
+
+        Returns:
+            ndarray: die Pixel des Bildes.
+        """
+        import numpy as np # wird nur hier gebraucht
+        return np.frombuffer(self.pixels, dtype=np.uint8).reshape(self.height, self.width, 3)
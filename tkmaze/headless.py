@@ -0,0 +1,146 @@
+"""src/headless.py
+
+Enthält den HeadlessRenderer, der Bilder ohne tkinter und ohne Bildschirm berechnet.
+
+Die Bilder landen in einem RGB Framebuffer und können als PPM oder PNG gespeichert
+oder als Array weiterverarbeitet werden.
+`python3 -m tkmaze.headless --load labyrinth.tkmz --size 320 240 --out bild.png`
+"""
+
+import argparse
+import json
+import math
+from .caster import Caster
+from .framebuffer import Framebuffer
+from .maze import Maze, GENERATORS
+from . import storage
+
+class HeadlessRenderer(Caster):
+    """
+    Class, die Bilder eines Labyrinths in einer festen Auflösung ohne Fenster berechnet.
+
+    Attributes:
+        frame (Framebuffer): das zuletzt berechnete Bild.
+    """
+    def __init__(self, cell_data, width, height, engine="python", background=(0, 0, 0),
+                 skip=False, max_distance=None, workers=None):
+        """
+        __init__ wird aufgerufen, wenn ein HeadlessRenderer Initialisiert wird.
+
+        Args:
+            cell_data (Maze): Das Labyrinth.
+            width (int): Länge der Bilder in Pixeln.
+            height (int): Höhe der Bilder in Pixeln.
+            engine (str): "python", "numpy" oder "parallel", siehe Caster.
+            background (tuple(int, int, int)): Farbe von Decke und Boden, auch Farbe des Nebels.
+            skip (bool): überspringt leere Bereiche mit einer SkipMap, siehe Caster.
+            max_distance (float): größte Sichtweite, None für unbegrenzt.
+            workers (int): Anzahl der Prozesse für die Engine "parallel".
+        """
+        super().__init__(cell_data, width, height, engine, skip, max_distance, background, workers,
+                         background)
+        self.frame = Framebuffer(width, height, background)
+        if hasattr(self.engine, "frame_height"):
+            self.engine.frame_height = height
+
+    def set_camera(self, pos, direction, plane=None, fov=0.66):
+        """
+        set_camera setzt Position und Ausrichtung der Kamera.
+
+        Args:
+            pos ([float]): x und y Position der Kamera in map_data.
+            direction ([float]): x und y Ausrichtung der Kamera, wird normalisiert.
+            plane ([float]): x und y Ausrichtung der Kamera-Ebene, standardmäßig
+                senkrecht zur Ausrichtung.
+            fov (float): Länge der Kamera-Ebene, wenn plane nicht angegeben ist.
+        """
+        length = math.hypot(direction[0], direction[1])
+        if length == 0:
+            raise ValueError("Die Ausrichtung der Kamera darf nicht (0, 0) sein")
+        self.pos = [float(pos[0]), float(pos[1])]
+        self.dir = [direction[0] / length, direction[1] / length]
+        if plane is None:
+            plane = [-self.dir[1] * fov, self.dir[0] * fov]
+        self.plane = [float(plane[0]), float(plane[1])]
+
+    def render(self) -> Framebuffer:
+        """
+        render berechnet ein Bild aus der aktuellen Kamera-Position.
+
+        Returns:
+            Framebuffer: das Bild, wird beim nächsten render überschrieben.
+        """
+        rays = self.cast()
+        engine_frame = getattr(self.engine, "frame", None)
+        if engine_frame is not None:
+            # die Worker haben das Bild schon gezeichnet
+            self.frame.pixels[:] = engine_frame.pixels
+        else:
+            self.frame.draw_rays(rays, self)
+        return self.frame
+
+    def render_path(self, poses, pattern):
+        """
+        render_path berechnet ein Bild pro Kamera-Position und speichert es.
+
+        Args:
+            poses ([[[float]]]): pos, dir und plane für jedes Bild, wie bench.camera_path.
+            pattern (str): Pfad mit Platzhalter für die Bildnummer, z.B. "bild_{:05d}.png".
+
+        Returns:
+            int: Anzahl gespeicherter Bilder.
+        """
+        for number, (pos, direction, plane) in enumerate(poses):
+            self.set_camera(pos, direction, plane)
+            self.render().save(pattern.format(number))
+        return len(poses)
+
+def main(argv=None):
+    """
+    main berechnet ein oder mehrere Bilder eines Labyrinths und speichert sie.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.headless",
+                                     description="Berechnet Bilder ohne Fenster.")
+    parser.add_argument("--load", metavar="DATEI", help="gespeichertes .tkmz Labyrinth")
+    parser.add_argument("--maze", type=int, nargs=2, default=(5, 6), metavar=("X", "Y"),
+                        help="Größe eines neu generierten Labyrinths")
+    parser.add_argument("--algorithm", choices=GENERATORS, default="dfs")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--size", type=int, nargs=2, default=(640, 480), metavar=("W", "H"),
+                        help="Auflösung der Bilder")
+    parser.add_argument("--engine", choices=("python", "numpy", "parallel"), default="python")
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse für --engine parallel")
+    parser.add_argument("--skip", action="store_true", help="überspringt leere Bereiche")
+    parser.add_argument("--max-distance", type=float, default=None, help="Sichtweite mit Nebel")
+    parser.add_argument("--pos", type=float, nargs=2, metavar=("X", "Y"))
+    parser.add_argument("--dir", type=float, nargs=2, default=(1.0, 0.0), metavar=("X", "Y"))
+    parser.add_argument("--camera", metavar="DATEI", help="JSON Kamera-Weg, ein Bild pro Eintrag")
+    parser.add_argument("--out", default="bild.png",
+                        help="Ausgabe .png oder .ppm, mit --camera z.B. bild_{:05d}.png")
+    args = parser.parse_args(argv)
+    if args.skip and args.engine != "python":
+        parser.error("--skip gibt es nur mit --engine python")
+
+    if args.load:
+        maze = storage.load(args.load)
+    else:
+        maze = Maze(*args.maze)
+        maze.generate(args.algorithm, args.seed)
+
+    renderer = HeadlessRenderer(maze, *args.size, engine=args.engine, skip=args.skip,
+                                max_distance=args.max_distance, workers=args.workers)
+    if args.camera:
+        with open(args.camera, encoding="utf-8") as file:
+            poses = json.load(file)
+        count = renderer.render_path(poses, args.out)
+        print(f"{count} Bilder gespeichert")
+    else:
+        renderer.set_camera(args.pos or renderer.pos, args.dir)
+        renderer.render().save(args.out)
+    renderer.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""src/kernels.py
+
+Enthält schnelle Generierungs-Algorithmen, die direkt auf den Wand-Masken arbeiten.
+
+Alle Funktionen bekommen das flache bytearray maze.walls mit dem Index y * width + x und
+entfernen Wände, ohne Cell Objekte oder Nachbar-Listen zu erzeugen. Die Nachbarn einer
+Zelle ergeben sich aus festen Index-Verschiebungen (-width, +width, +1, -1).
+"""
+
+import random
+from .cell import NORTH, SOUTH, EAST, WEST
+
+def carve(walls, index, bit, neighbor, opposite):
+    """
+    carve entfernt die Wand zwischen einer Zelle und ihrem Nachbarn.
+
+    Args:
+        walls (bytearray): Wand-Masken aller Zellen.
+        index (int): Index der Zelle.
+        bit (int): Bit der Wand der Zelle.
+        neighbor (int): Index des Nachbarn.
+        opposite (int): Bit der Wand des Nachbarn.
+    """
+    walls[index] &= ~bit
+    walls[neighbor] &= ~opposite
+
+def kruskal(walls, width, height, rng=random):
+    """
+    kruskal generiert ein Labyrinth mit Kruskals Algorithmus und einem Union-Find.
+
+    Alle inneren Wände werden gemischt und der Reihe nach entfernt, wenn sie zwei Zellen
+    trennen, die noch nicht verbunden sind.
+
+    Args:
+        walls (bytearray): Wand-Masken aller Zellen, alle Wände an.
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+    """
+    count = width * height
+    # eine Wand als 2 * index für die Ost-Wand und 2 * index + 1 für die Süd-Wand
+    edges = [2 * i for i in range(count) if i % width != width - 1]
+    edges += [2 * i + 1 for i in range(count - width)]
+    rng.shuffle(edges)
+
+    parent = list(range(count))
+    remaining = count - 1
+    for edge in edges:
+        index = edge >> 1
+        if edge & 1:
+            neighbor = index + width
+        else:
+            neighbor = index + 1
+
+        # Wurzel beider Zellen, jeder Schritt halbiert den Weg (path halving)
+        a = index
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        b = neighbor
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a == b:
+            continue
+
+        parent[a] = b
+        if edge & 1:
+            carve(walls, index, SOUTH, neighbor, NORTH)
+        else:
+            carve(walls, index, EAST, neighbor, WEST)
+        remaining -= 1
+        if not remaining:
+            break
+
+def neighbor_moves(width, height) -> list[tuple]:
+    """
+    neighbor_moves bestimmt für jede Zelle die Richtungen zu Nachbarn innerhalb des Labyrinths.
+
+    Zellen mit gleichen Richtungen teilen sich ein Tupel, damit auch große Labyrinthe
+    wenig Speicher brauchen.
+
+    Args:
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+
+    Returns:
+        [tuple(tuple(int, int, int))]: Bit, Index-Verschiebung und Gegen-Bit jeder Richtung.
+    """
+    north = (NORTH, -width, SOUTH)
+    south = (SOUTH, width, NORTH)
+    east = (EAST, 1, WEST)
+    west = (WEST, -1, EAST)
+    shared = {}
+    moves = []
+    for y in range(height):
+        for x in range(width):
+            key = (y > 0, y < height - 1, x < width - 1, x > 0)
+            options = shared.get(key)
+            if options is None:
+                options = tuple(move for move, ok in zip((north, south, east, west), key) if ok)
+                shared[key] = options
+            moves.append(options)
+    return moves
+
+def wilson(walls, width, height, rng=random):
+    """
+    wilson generiert ein gleichverteiltes Labyrinth mit Wilsons Algorithmus.
+
+    Von jeder Zelle außerhalb des Baums läuft ein zufälliger Weg, bis er den Baum trifft.
+    Für jede Zelle wird nur die letzte Richtung gemerkt, dadurch fallen Schleifen heraus,
+    und der Weg ohne Schleifen wird an den Baum angehängt.
+
+    Args:
+        walls (bytearray): Wand-Masken aller Zellen, alle Wände an.
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+    """
+    count = width * height
+    moves = neighbor_moves(width, height)
+    in_tree = bytearray(count)
+    in_tree[rng.randrange(count)] = 1
+    # letzte Richtung des Weges in jeder Zelle, als (bit, offset, opposite)
+    exit_move = [None] * count
+    choice = rng.choice
+
+    for start in range(count):
+        if in_tree[start]:
+            continue
+        # zufälliger Weg bis zum Baum
+        current = start
+        while not in_tree[current]:
+            move = choice(moves[current])
+            exit_move[current] = move
+            current += move[1]
+        # den Weg ohne Schleifen in den Baum übernehmen
+        current = start
+        while not in_tree[current]:
+            bit, offset, opposite = exit_move[current]
+            in_tree[current] = 1
+            carve(walls, current, bit, current + offset, opposite)
+            current += offset
+
+def sidewinder(walls, width, height, rng=random):
+    """
+    sidewinder generiert ein Labyrinth Reihe für Reihe mit dem Sidewinder Algorithmus.
+
+    Die oberste Reihe ist ein langer Gang. In jeder weiteren Reihe werden Zellen zu Gängen
+    nach Osten zusammengefasst, von jedem Gang führt ein zufälliger Durchgang nach Norden.
+
+    Args:
+        walls (bytearray): Wand-Masken aller Zellen, alle Wände an.
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+    """
+    for x in range(width - 1):
+        carve(walls, x, EAST, x + 1, WEST)
+    random_value = rng.random
+    for y in range(1, height):
+        row = y * width
+        run_start = row
+        for index in range(row, row + width):
+            if index == row + width - 1 or random_value() < 0.5:
+                # der Gang endet, eine seiner Zellen bekommt einen Durchgang nach Norden
+                cell = run_start + int(random_value() * (index - run_start + 1))
+                carve(walls, cell, NORTH, cell - width, SOUTH)
+                run_start = index + 1
+            else:
+                carve(walls, index, EAST, index + 1, WEST)
+
+def binary_tree(walls, width, height, rng=random):
+    """
+    binary_tree generiert ein Labyrinth, in dem jede Zelle einen Durchgang nach Norden
+    oder Osten bekommt.
+
+    Args:
+        walls (bytearray): Wand-Masken aller Zellen, alle Wände an.
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+    """
+    random_value = rng.random
+    last_x = width - 1
+    for y in range(height):
+        row = y * width
+        for x in range(width):
+            index = row + x
+            # oben geht es nur nach Osten, am Ost-Rand nur nach Norden
+            if y and (x == last_x or random_value() < 0.5):
+                carve(walls, index, NORTH, index - width, SOUTH)
+            elif x != last_x:
+                carve(walls, index, EAST, index + 1, WEST)
+
+# Name eines Algorithmus -> Funktion, die maze.walls direkt verändert
+KERNELS = {
+        "kruskal": kruskal,
+        "wilson": wilson,
+        "sidewinder": sidewinder,
+        "binary-tree": binary_tree,
+}
@@ -5,11 +5,71 @@ Enthält Die Maze class, die das Labyrinth darstellt.
 
 import random
 import sys
-from .cell import Cell
+from collections import OrderedDict
+from .cell import Cell, NORTH, SOUTH, EAST, WEST, ALL_WALLS, OPPOSITE
+from .stream import generate_eller, ascii_lines, grid_lines
+from .kernels import KERNELS
 
 sys.setrecursionlimit(100000)  # Sollte Sehr Hoch sein
 #random.seed(1) # für debugging: macht random nicht mehr zufällig
 
+class Column:
+    """
+    Class, die eine Spalte von Zellen im Labyrinth darstellt, ohne Zellen zu speichern.
+
+    Attributes:
+        maze (Maze): Das Labyrinth.
+        pos_x (int): x-Position der Spalte.
+    """
+    __slots__ = ("maze", "pos_x")
+
+    def __init__(self, maze, pos_x):
+        self.maze = maze
+        self.pos_x = pos_x
+
+    def __len__(self) -> int:
+        return self.maze.grid_height
+
+    def __getitem__(self, pos_y) -> Cell:
+        if pos_y < 0:
+            pos_y += self.maze.grid_height
+        if not 0 <= pos_y < self.maze.grid_height:
+            raise IndexError("Zelle außerhalb des Labyrinths")
+        return Cell(self.maze, self.pos_x, pos_y)
+
+    def __iter__(self):
+        for pos_y in range(self.maze.grid_height):
+            yield Cell(self.maze, self.pos_x, pos_y)
+
+class Grid:
+    """
+    Class, die das Labyrinth wie eine Liste von Spalten aus Zellen darstellt.
+
+    Die Zellen werden erst beim Zugriff als leichte Sicht auf maze.walls erzeugt,
+    damit grid[x][y] wie bisher funktioniert.
+
+    Attributes:
+        maze (Maze): Das Labyrinth.
+    """
+    __slots__ = ("maze",)
+
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __len__(self) -> int:
+        return self.maze.grid_width
+
+    def __getitem__(self, pos_x) -> Column:
+        if pos_x < 0:
+            pos_x += self.maze.grid_width
+        if not 0 <= pos_x < self.maze.grid_width:
+            raise IndexError("Spalte außerhalb des Labyrinths")
+        return Column(self.maze, pos_x)
+
+    def __iter__(self):
+        for pos_x in range(self.maze.grid_width):
+            yield Column(self.maze, pos_x)
+
 class Maze:
     """
     Class, die ein Labyrinth aus Zellen darstellt.
@@ -17,22 +77,145 @@ class Maze:
     Attributes:
         grid_width (int): länge des Labyrinths in Zellen.
         grid_height (int): höhe des Labyrinths in Zellen.
-        grid ([[Cells]]): Labyrinth bestehend aus Reihen von Zellen.
+        walls (bytearray): 4-Bit Wand-Maske jeder Zelle, Index ist y * grid_width + x.
+        visited (bytearray): 1, wenn die Zelle besucht wurde, sonst 0, wird erst beim ersten
+            Zugriff angelegt.
+        grid (Grid): Labyrinth bestehend aus Reihen von Zellen.
+        seed (int): Seed, mit dem das Labyrinth generiert wurde, None wenn unbekannt.
+        algorithm (str): Name des Algorithmus aus GENERATORS, None wenn unbekannt.
+        revision (int): wird bei jeder Änderung der Wände erhöht, damit Caches veralten.
     """
-    def __init__(self, grid_width, grid_height):
+    def __init__(self, grid_width, grid_height, walls=None, visited=False):
         """
         __init__ wird aufgerufen, wenn ein Labyrinth Initialisiert wird.
 
         Args:
             grid_width (int): länge des Labyrinths in Zellen.
             grid_height (int): höhe des Labyrinths in Zellen.
+            walls (bytearray): vorhandene Wand-Masken, z.B. eine storage.NibbleArray
+                einer gespeicherten Datei, sonst sind alle Wände an.
+            visited (bool): True, wenn alle Zellen schon besucht sind, z.B. in einer
+                gespeicherten Datei.
         """
         self.grid_width = grid_width
         self.grid_height = grid_height
-        # generiert eine Array wie folgt: [[Cellx0y0, Cellx1y0,...], [Cellx0y1, Cellx1y1,...], ...]
-        self.grid = [[Cell(x, y)
-                      for y in range(grid_height)]
-                      for x in range(grid_width)]
+        # alle Wände sind am Anfang an, keine Zelle ist besucht
+        if walls is None:
+            walls = bytearray([ALL_WALLS]) * (grid_width * grid_height)
+        self.walls = walls
+        # ein gespeichertes Labyrinth braucht visited meistens nie, deshalb erst bei Bedarf
+        self._visited = None
+        self._visited_fill = 1 if visited else 0
+        # grid[x][y] gibt wie früher die Zelle an x, y wieder
+        self.grid = Grid(self)
+        self.seed = None
+        self.algorithm = None
+        self.revision = 0
+        # list(maze) als ein zusammenhängender Speicher, wird erst bei Bedarf gebaut
+        self._raster = None
+        self._raster_revision = -1
+
+    @property
+    def visited(self) -> bytearray:
+        """
+        visited gibt für jede Zelle an, ob sie besucht wurde, und legt die Liste beim ersten Zugriff an.
+
+        Returns:
+            bytearray: 1, wenn die Zelle besucht wurde, sonst 0.
+        """
+        if self._visited is None:
+            self._visited = bytearray([self._visited_fill]) * (self.grid_width * self.grid_height)
+        return self._visited
+
+    @visited.setter
+    def visited(self, value):
+        self._visited = value
+
+    @property
+    def mapped(self) -> bool:
+        """
+        mapped gibt an, ob die Wände nicht als bytearray im Speicher liegen, z.B. aus einer mmap.
+
+        Returns:
+            bool: True, wenn die Wände nicht in einem bytearray liegen, sonst False.
+        """
+        return not isinstance(self.walls, bytearray)
+
+    def closed_walls(self) -> bytearray:
+        """
+        closed_walls gibt die Wand-Masken als bytearray wieder, in dem alle Außenwände gesetzt sind.
+
+        Walls.__setitem__ kann Außenwände entfernen, ein Schritt durch sie würde in der Reihe
+        daneben oder außerhalb von maze.walls landen. Ist der Rand geschlossen und liegen die
+        Wände in einem bytearray, wird maze.walls selbst wiedergegeben, sonst eine Kopie.
+
+        Returns:
+            bytearray: 4-Bit Wand-Maske jeder Zelle mit geschlossenem Rand.
+        """
+        # gespeicherte Labyrinthe aus einer mmap werden einmal komplett entpackt
+        walls = self.walls[:] if self.mapped else self.walls
+        width, height = self.grid_width, self.grid_height
+        border = ((walls[:width], NORTH), (walls[-width:], SOUTH),
+                  (walls[width - 1::width], EAST), (walls[::width], WEST))
+        if all(mask & bit for row, bit in border for mask in row):
+            return walls
+        walls = bytearray(walls)
+        for x in range(width):
+            walls[x] |= NORTH
+            walls[(height - 1) * width + x] |= SOUTH
+        for y in range(height):
+            walls[y * width] |= WEST
+            walls[y * width + width - 1] |= EAST
+        return walls
+
+    def cell(self, pos_x, pos_y) -> Cell:
+        """
+        cell gibt die Zelle an einer Position wieder.
+
+        Args:
+            pos_x (int): x-Position der Zelle.
+            pos_y (int): y-Position der Zelle.
+
+        Returns:
+            Cell: die Zelle.
+        """
+        return Cell(self, pos_x, pos_y)
+
+    def neighbor_index(self, index, bit) -> int:
+        """
+        neighbor_index gibt den Index des Nachbarn hinter einer Wand wieder.
+
+        Args:
+            index (int): Index der Zelle.
+            bit (int): Bit der Wand (NORTH, SOUTH, EAST oder WEST).
+
+        Returns:
+            int: Index des Nachbarn, -1 wenn er außerhalb des Labyrinths liegt.
+        """
+        width = self.grid_width
+        if bit == NORTH:
+            return index - width if index >= width else -1
+        if bit == SOUTH:
+            return index + width if index + width < len(self.walls) else -1
+        if bit == EAST:
+            return index + 1 if index % width != width - 1 else -1
+        return index - 1 if index % width else -1
+
+    def remove_wall(self, index, bit):
+        """
+        remove_wall entfernt eine Wand einer Zelle und die passende Wand des Nachbarn.
+        Wände am Rand des Labyrinths werden nicht entfernt.
+
+        Args:
+            index (int): Index der Zelle.
+            bit (int): Bit der Wand (NORTH, SOUTH, EAST oder WEST).
+        """
+        nb_index = self.neighbor_index(index, bit)
+        if nb_index < 0:
+            return # Außenwände bleiben immer stehen
+        self.walls[index] &= ~bit
+        self.walls[nb_index] &= ~OPPOSITE[bit]
+        self.revision += 1
 
     def __iter__(self):
         """
@@ -41,45 +224,8 @@ class Maze:
         Yields:
             [int]: Labyrinth als Liste von Reihen mit Zahlen.
         """
-        maze_iter = []
-        for y in range(self.grid_height):
-            # obere Wände
-            top_line = []
-            # Zellen-Reihe
-            mid_line = []
-            for x in range(self.grid_width):
-                cell = self.grid[x][y]
-
-                # Nördliche Wand
-                top_line.append(1) # Ecken sind immer 1
-                if cell.walls["north"]:
-                    top_line.append(1)
-                else:
-                    top_line.append(0)
-
-                # Linke Wand und Zelle selbst
-                if cell.walls["west"]:
-                    mid_line.append(1)
-                else:
-                    mid_line.append(0)
-                mid_line.append(0)
-
-            # Wand Ganz Rechts
-            top_line.append(1)
-            mid_line.append(1)
-            maze_iter.append(top_line)
-            maze_iter.append(mid_line)
-
-        # untere Wand für die Letzte Reihe
-        bottom_line = []
-        bottom_line.extend([1] * (2 * self.grid_width + 1))
-        maze_iter.append(bottom_line)
-
         # startzelle = 2 oben links, endzelle = 3 unten rechts
-        maze_iter[1][1] = 2
-        maze_iter[-2][-2] = 3
-
-        yield from maze_iter
+        yield from grid_lines(self.iter_rows(), self.grid_width)
 
     def __str__(self) -> str:
         """
@@ -88,35 +234,114 @@ class Maze:
         Returns:
             str: Labyrinth als ASCII-Bild.
         """
-        maze_str = ""
+        return "".join(ascii_lines(self.iter_rows(), self.grid_width))
+
+    def iter_rows(self):
+        """
+        iter_rows gibt die Wand-Masken des Labyrinths Reihe für Reihe wieder.
+
+        Yields:
+            memoryview: 4-Bit Wand-Masken der Zellen einer Reihe, von oben nach unten.
+        """
+        walls = self.walls if self.mapped else memoryview(self.walls)
         for y in range(self.grid_height):
-            # obere Wände
-            top_line = ""
-            # Zellen-Reihe
-            mid_line = ""
-            for x in range(self.grid_width):
-                cell = self.grid[x][y]
-
-                # Nördliche Wand
-                top_line += "+"  # Ecken sind +
-                top_line += "---" if cell.walls["north"] else "   "
-
-                # Linke Wand und Zelle selbst
-                mid_line += "|" if cell.walls["west"] else " "
-                mid_line += "   "
-
-            # Wand Ganz Rechts
-            mid_line += "|"
-            maze_str += top_line + "+\n" + mid_line + "\n"
-
-        # untere Wand für die Letzte Reihe
-        bottom_line = ""
-        for x in range(self.grid_width):
-            bottom_line += "+---"
-        bottom_line += "+\n"
-        maze_str += bottom_line
-
-        return maze_str
+            yield walls[y * self.grid_width:(y + 1) * self.grid_width]
+
+    def raster_row(self, row_index) -> list[int]:
+        """
+        raster_row gibt eine einzelne Reihe von list(maze) wieder, ohne die anderen zu erzeugen.
+
+        Args:
+            row_index (int): Index der Reihe, 0 bis 2 * grid_height.
+
+        Returns:
+            [int]: Reihe des Labyrinths als Zahlen.
+        """
+        width = self.grid_width
+        if row_index == 2 * self.grid_height:
+            # untere Wand für die Letzte Reihe
+            return [1] * (2 * width + 1)
+        y = row_index // 2
+        row = self.walls[y * width:(y + 1) * width]
+        line = [1] * (2 * width + 1)
+        if row_index % 2 == 0:
+            # obere Wände, Ecken sind immer 1
+            for x, walls in enumerate(row):
+                if not walls & NORTH:
+                    line[2 * x + 1] = 0
+        else:
+            # linke Wand und Zelle selbst
+            for x, walls in enumerate(row):
+                if not walls & WEST:
+                    line[2 * x] = 0
+                line[2 * x + 1] = 0
+            if y == 0:
+                line[1] = 2
+            if y == self.grid_height - 1:
+                line[-2] = 3
+        return line
+
+    def raster(self) -> bytearray:
+        """
+        raster gibt list(maze) als ein zusammenhängendes bytearray wieder, Reihe für Reihe.
+
+        Das bytearray wird beim ersten Aufruf gebaut und wiederverwendet, bis sich die Wände
+        ändern. Es unterstützt das Buffer-Protokoll, numpy.frombuffer kopiert es nicht.
+
+        Returns:
+            bytearray: (2 * grid_height + 1) Reihen mit (2 * grid_width + 1) Feldern.
+        """
+        if self._raster is None or self._raster_revision != self.revision:
+            # ein neues bytearray, alte Sichten zeigen weiter auf das alte
+            self._raster = bytearray(b"".join(bytes(line) for line in self))
+            self._raster_revision = self.revision
+        return self._raster
+
+    def raster_view(self) -> memoryview:
+        """
+        raster_view gibt raster() als zweidimensionale Sicht wieder, raster_view()[row, col].
+
+        Returns:
+            memoryview: Sicht mit der Form (2 * grid_height + 1, 2 * grid_width + 1).
+        """
+        return memoryview(self.raster()).cast("B", (2 * self.grid_height + 1,
+                                                    2 * self.grid_width + 1))
+
+    def raster_rows(self, top=0, left=0, height=None, width=None) -> list[memoryview]:
+        """
+        raster_rows gibt einen rechteckigen Ausschnitt von raster() als Sichten auf die Reihen
+        wieder, ohne etwas zu kopieren. Ohne Argumente ist es das ganze Labyrinth wie list(maze).
+
+        Args:
+            top (int): erste Reihe des Ausschnitts.
+            left (int): erste Spalte des Ausschnitts.
+            height (int): Anzahl der Reihen, standardmäßig bis zum Ende.
+            width (int): Anzahl der Spalten, standardmäßig bis zum Ende.
+
+        Returns:
+            [memoryview]: eine Sicht pro Reihe, row[col] ist eine Zahl wie in list(maze).
+        """
+        stride = 2 * self.grid_width + 1
+        rows = 2 * self.grid_height + 1
+        height = rows - top if height is None else height
+        width = stride - left if width is None else width
+        if top < 0 or left < 0 or top + height > rows or left + width > stride:
+            raise IndexError("Ausschnitt außerhalb des Labyrinths")
+        raster = memoryview(self.raster())
+        return [raster[r * stride + left:r * stride + left + width]
+                for r in range(top, top + height)]
+
+    def lazy_raster(self, cache_size=256):
+        """
+        lazy_raster gibt eine Sicht auf list(maze) wieder, deren Reihen erst beim Zugriff entstehen.
+
+        Args:
+            cache_size (int): Anzahl der Reihen, die zwischengespeichert werden.
+
+        Returns:
+            LazyRaster: Reihen des Labyrinths als Zahlen.
+        """
+        return LazyRaster(self, cache_size)
 
     def get_neighbors(self, cell_index) -> list[Cell]:
         """
@@ -139,7 +364,7 @@ class Maze:
         for dx, dy in directions:
             nx, ny = x + dx, y + dy # Koordinaten der Nachbar-Zelle
             if 0 <= nx < self.grid_width and 0 <= ny < self.grid_height:
-                nb_cells.append(self.grid[nx][ny])
+                nb_cells.append(Cell(self, nx, ny))
         return nb_cells
 
     def get_unvisited_neighbors(self, cell_index) -> list[Cell]:
@@ -152,8 +377,9 @@ class Maze:
         Returns:
             [Cell]: alle unbesuchten Nachbaren einer Zelle.
         """
+        visited = self.visited
         nb_cells = self.get_neighbors(cell_index)
-        return [nb for nb in nb_cells if not nb.visited]
+        return [nb for nb in nb_cells if not visited[nb.index]]
 
     def get_connected_neighbors(self, cell_index) -> list[Cell]:
         """
@@ -165,7 +391,7 @@ class Maze:
         Returns:
             [Cell]: alle unbesuchten Nachbaren einer Zelle.
         """
-        current_cell = self.grid[cell_index[0]][cell_index[1]]
+        current_cell = Cell(self, cell_index[0], cell_index[1])
         nb_cells = self.get_neighbors(cell_index)
         return [nb for nb in nb_cells if not current_cell.is_wall_between(nb)]
 
@@ -183,12 +409,49 @@ class Maze:
             return True
         return False
 
-    def generate_dfs_recursive(self, current_cell):
+    def generate(self, algorithm="dfs", seed=None):
+        """
+        generate generiert das Labyrinth mit einem Algorithmus aus GENERATORS und einem Seed.
+
+        Args:
+            algorithm (str): Name des Algorithmus.
+            seed (int): Seed für den Zufallsgenerator, None für einen zufälligen Seed.
+        """
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unbekannter Algorithmus: {algorithm}")
+        if seed is None:
+            seed = random.getrandbits(63)
+        GENERATORS[algorithm](self, random.Random(seed))
+        self.seed = seed
+        self.algorithm = algorithm
+
+    def generate_steps(self, algorithm="dfs", seed=None):
+        """
+        generate_steps generiert das Labyrinth Schritt für Schritt mit einem Algorithmus aus
+        STEP_GENERATORS, z.B. um die Generierung anzuzeigen.
+
+        Args:
+            algorithm (str): Name des Algorithmus.
+            seed (int): Seed für den Zufallsgenerator, None für einen zufälligen Seed.
+
+        Returns:
+            generator: liefert pro Schritt die entfernten Wände als [(index, bit)].
+        """
+        if algorithm not in STEP_GENERATORS:
+            raise ValueError(f"Algorithmus {algorithm} kann nicht Schritt für Schritt generieren")
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.seed = seed
+        self.algorithm = algorithm
+        return STEP_GENERATORS[algorithm](self, random.Random(seed))
+
+    def generate_dfs_recursive(self, current_cell, rng=random):
         """
         generate_dfs_recursive generiert ein (zufälliges) Labyrinth mit depth-fist-search rekursiv.
 
         Args:
             current_cell (Cell): Die momentan besuchte Zelle.
+            rng (Random): Zufallsgenerator, standardmäßig das random Modul.
         """
         # Rekursive Version
         # "Base-Case" Szenario: alle Zellen sind besucht
@@ -197,22 +460,37 @@ class Maze:
 
         # wählt einen unbesuchten Nachbarn aus
         unvisited_nb_cells = self.get_unvisited_neighbors(current_index)
-        random.shuffle(unvisited_nb_cells)
+        rng.shuffle(unvisited_nb_cells)
         for nb in unvisited_nb_cells:
             if not nb.visited:
                 # entfernt die Wand zwischen der Zelle und dem Nachbarn
                 current_cell.remove_wall_between(nb)
                 # ruft die Routine rekursiv mit dem Nachbarn als neue Zelle auf
-                self.generate_dfs_recursive(nb)
+                self.generate_dfs_recursive(nb, rng)
 
-    def generate_dfs_iterative(self, start_cell):
+    def generate_dfs_iterative(self, start_cell, rng=random):
         """
         generate_dfs_iterative generiert ein (zufälliges) Labyrinth mit depth-fist-search iterativ.
 
         Args:
             start_cell (Cell): Die als erstes zu besuchende Zelle.
+            rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+        """
+        # Iterative Version, alle Schritte ohne Pause
+        for _ in self.iter_dfs(start_cell, rng):
+            pass
+
+    def iter_dfs(self, start_cell, rng=random):
+        """
+        iter_dfs generiert ein (zufälliges) Labyrinth mit depth-fist-search iterativ, Schritt für Schritt.
+
+        Args:
+            start_cell (Cell): Die als erstes zu besuchende Zelle.
+            rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+
+        Yields:
+            [tuple(int, int)]: Index der Zelle und Bit der entfernten Wand, eine pro Schritt.
         """
-        # Iterative Version
         # initialisiert einen Stack
         stack = []
         start_cell.visited = True
@@ -228,12 +506,114 @@ class Maze:
             unvisited_nb_cells = self.get_unvisited_neighbors(current_index)
             if unvisited_nb_cells:
                 # wählt einen unbesuchten Nachbarn aus
-                chosen_cell = random.choice(unvisited_nb_cells)
+                chosen_cell = rng.choice(unvisited_nb_cells)
                 # entfernt die Wand zwischen der Zelle und dem Nachbarn
-                current_cell.remove_wall_between(chosen_cell)
+                bit = current_cell.wall_bit(chosen_cell)
+                self.remove_wall(current_cell.index, bit)
                 current_cell.visited = True
                 # fügt den Nachbarn dem Stack hinzu
                 stack.append(chosen_cell)
+                yield [(current_cell.index, bit)]
             else:
                 # Backtrack
                 stack.pop()
+
+    def generate_eller(self, rng=random):
+        """
+        generate_eller generiert ein (zufälliges) Labyrinth Reihe für Reihe mit Ellers Algorithmus.
+
+        Args:
+            rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+        """
+        width = self.grid_width
+        for y, row in enumerate(generate_eller(width, self.grid_height, rng)):
+            self.walls[y * width:(y + 1) * width] = row
+        self.visited[:] = b"\x01" * len(self.visited)
+        self.revision += 1
+
+    def generate_kernel(self, kernel, rng=random):
+        """
+        generate_kernel generiert das Labyrinth mit einer Funktion aus kernels.KERNELS,
+        die direkt auf den Wand-Masken arbeitet.
+
+        Args:
+            kernel (callable): Funktion, die walls, Länge, Höhe und rng bekommt.
+            rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+        """
+        kernel(self.walls, self.grid_width, self.grid_height, rng)
+        self.visited[:] = b"\x01" * len(self.visited)
+        self.revision += 1
+
+    def iter_eller(self, rng=random):
+        """
+        iter_eller generiert ein (zufälliges) Labyrinth mit Ellers Algorithmus, eine Reihe pro Schritt.
+
+        Args:
+            rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+
+        Yields:
+            [tuple(int, int)]: Index der Zelle und Bit jeder entfernten Wand einer Reihe.
+        """
+        width = self.grid_width
+        for y, row in enumerate(generate_eller(width, self.grid_height, rng)):
+            start = y * width
+            self.walls[start:start + width] = row
+            self.visited[start:start + width] = b"\x01" * width
+            self.revision += 1
+            # jede Wand wird nur einmal gemeldet, über die Ost- und Süd-Wand ihrer Zelle
+            yield [(start + x, bit) for x, walls in enumerate(row)
+                   for bit in (EAST, SOUTH) if not walls & bit]
+
+class LazyRaster:
+    """
+    Class, die list(maze) nachbildet, aber jede Reihe erst beim Zugriff erzeugt.
+
+    Wird vom Raycaster für gespeicherte Labyrinthe benutzt, damit ein großes Labyrinth
+    aus einer mmap nicht komplett umgewandelt werden muss.
+
+    Attributes:
+        maze (Maze): Das Labyrinth.
+        cache_size (int): Anzahl der Reihen, die zwischengespeichert werden.
+        rows (OrderedDict): zuletzt benutzte Reihen, nach Index.
+    """
+    def __init__(self, maze, cache_size=256):
+        self.maze = maze
+        self.cache_size = cache_size
+        self.rows = OrderedDict()
+
+    def __len__(self) -> int:
+        return 2 * self.maze.grid_height + 1
+
+    def __getitem__(self, row_index) -> list[int]:
+        if row_index < 0:
+            row_index += len(self)
+        if not 0 <= row_index < len(self):
+            raise IndexError("Reihe außerhalb des Labyrinths")
+        row = self.rows.get(row_index)
+        if row is None:
+            row = self.maze.raster_row(row_index)
+            self.rows[row_index] = row
+            if len(self.rows) > self.cache_size:
+                self.rows.popitem(last=False)
+        else:
+            self.rows.move_to_end(row_index)
+        return row
+
+    def __iter__(self):
+        for row_index in range(len(self)):
+            yield self[row_index]
+
+# Name eines Algorithmus -> Funktion, die ein Labyrinth mit einem Zufallsgenerator generiert
+GENERATORS = {
+        "dfs": lambda maze, rng: maze.generate_dfs_iterative(maze.grid[0][0], rng),
+        "dfs-recursive": lambda maze, rng: maze.generate_dfs_recursive(maze.grid[0][0], rng),
+        "eller": lambda maze, rng: maze.generate_eller(rng),
+        **{name: (lambda maze, rng, kernel=kernel: maze.generate_kernel(kernel, rng))
+           for name, kernel in KERNELS.items()},
+}
+
+# Name eines Algorithmus -> Funktion, die einen Generator der einzelnen Schritte wiedergibt
+STEP_GENERATORS = {
+        "dfs": lambda maze, rng: maze.iter_dfs(maze.grid[0][0], rng),
+        "eller": lambda maze, rng: maze.iter_eller(rng),
+}
@@ -0,0 +1,194 @@
+"""src/minimap.py
+
+Enthält die Minimap Class, eine Übersichtskarte oben rechts über dem Bild des Raycasters.
+
+Die Karte wird einmal aus map_data als PhotoImage gebaut und danach nur noch verändert:
+pro Bild werden Spieler und Sichtkegel verschoben und nur die Felder, die der Spieler
+neu gesehen hat, aus dem Nebel geholt. Ist das Labyrinth größer als die Karte, zeigt sie
+einen Ausschnitt um den Spieler, den tk selbst aus dem großen Bild kopiert.
+"""
+
+import math
+import tkinter as tk
+from .framebuffer import Framebuffer
+
+# Farbe je nach Zahl in map_data: Gang, Wand, Start und Ende
+MAP_RGB = [(40, 40, 40), (170, 170, 170), (50, 150, 50), (0, 0, 150)]
+MAP_HEX = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in MAP_RGB]
+
+# Farbe der Felder, die der Spieler noch nicht gesehen hat
+FOG_RGB = (0, 0, 0)
+
+# Abstand der Karte zum Rand des Fensters in Pixeln
+MARGIN = 10
+
+# Anzahl der Felder um den Spieler, die beim Betreten eines Feldes aufgedeckt werden
+REVEAL_RADIUS = 2
+
+# nur jeder n-te Strahl deckt sein getroffenes Feld auf, das reicht für die Wände
+REVEAL_RAY_STEP = 4
+
+class Minimap:
+    """
+    Class, die eine zwischengespeicherte Karte mit Spieler, Sichtkegel und Nebel zeichnet.
+
+    Attributes:
+        caster (Caster): Der Caster, dessen Spieler und map_data angezeigt werden.
+        canvas (Canvas): Der Canvas, auf dem die Karte liegt.
+        size (int): größte Länge und Höhe der Karte in Pixeln.
+        scale (int): Pixel pro Feld von map_data.
+        rows (int): Anzahl der Reihen von map_data.
+        cols (int): Anzahl der Spalten von map_data.
+        view_rows (int): Anzahl der sichtbaren Reihen.
+        view_cols (int): Anzahl der sichtbaren Spalten.
+        fog_of_war (bool): zeigt nur Felder, die der Spieler schon gesehen hat.
+        explored (bytearray): 1 für jedes aufgedeckte Feld, Reihe für Reihe.
+        image (PhotoImage): die ganze Karte, ein Pixel pro Feld.
+        display (PhotoImage): die angezeigte Karte, Ausschnitt von image um scale vergrößert.
+        origin (tuple(int, int)): Reihe und Spalte der linken oberen Ecke des Ausschnitts.
+        left (int): linker Rand der Karte auf dem Canvas in Pixeln.
+        item (int): Canvas-ID der Karte.
+        cone (int): Canvas-ID des Sichtkegels.
+        marker (int): Canvas-ID des Spielers.
+    """
+    def __init__(self, caster, canvas, size=200, fog_of_war=True):
+        """
+        __init__ wird aufgerufen, wenn eine Minimap Initialisiert wird.
+
+        Args:
+            caster (Caster): Der Caster, dessen Spieler und map_data angezeigt werden.
+            canvas (Canvas): Der Canvas, auf dem die Karte liegt.
+            size (int): größte Länge und Höhe der Karte in Pixeln.
+            fog_of_war (bool): zeigt nur Felder, die der Spieler schon gesehen hat.
+        """
+        if caster.world is not None:
+            raise ValueError("Die Minimap braucht ein endliches Labyrinth")
+        self.caster = caster
+        self.canvas = canvas
+        self.size = size
+        self.rows = len(caster.map_data)
+        self.cols = len(caster.map_data[0]) if self.rows else 0
+        self.scale = max(1, size // max(self.rows, self.cols, 1))
+        self.view_rows = min(self.rows, size // self.scale)
+        self.view_cols = min(self.cols, size // self.scale)
+        self.fog_of_war = fog_of_war
+        self.explored = bytearray(self.rows * self.cols)
+        self.origin = None
+        self._dirty = True
+        self._last_field = None
+
+        self.image = tk.PhotoImage(width=self.cols, height=self.rows)
+        self.image.configure(data=self.build().ppm(), format="PPM")
+        whole = (self.view_rows, self.view_cols) == (self.rows, self.cols)
+        # passt die ganze Karte ohne Vergrößerung, wird image direkt angezeigt
+        if whole and self.scale == 1:
+            self.display = self.image
+        else:
+            self.display = tk.PhotoImage(width=self.view_cols * self.scale,
+                                         height=self.view_rows * self.scale)
+
+        # die Canvas-Elemente werden einmal erzeugt und danach nur noch verschoben
+        self.left = None
+        self.item = canvas.create_image(0, MARGIN, image=self.display, anchor="nw",
+                                        tags="minimap")
+        self.cone = canvas.create_polygon(0, 0, 0, 0, 0, 0, fill="", outline="yellow",
+                                          tags="minimap")
+        self.marker = canvas.create_oval(0, 0, 0, 0, fill="red", outline="", tags="minimap")
+
+    def build(self) -> Framebuffer:
+        """
+        build zeichnet die Karte einmal mit einem Pixel pro Feld, mit Nebel über allen Feldern.
+
+        Returns:
+            Framebuffer: die Karte.
+        """
+        frame = Framebuffer(self.cols, self.rows, FOG_RGB)
+        if self.fog_of_war:
+            return frame
+        colors = [bytes(rgb) for rgb in MAP_RGB]
+        stride = 3 * self.cols
+        for r, row in enumerate(self.caster.map_data):
+            frame.pixels[r * stride:(r + 1) * stride] = b"".join(colors[v] for v in row)
+        self.explored[:] = b"\x01" * len(self.explored)
+        return frame
+
+    def reveal(self, row, col):
+        """
+        reveal holt ein Feld aus dem Nebel, wenn es noch nicht aufgedeckt ist.
+
+        Args:
+            row (int): Reihe in map_data.
+            col (int): Spalte in map_data.
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return
+        index = row * self.cols + col
+        if self.explored[index]:
+            return
+        self.explored[index] = 1
+        self.image.put(MAP_HEX[self.caster.map_data[row][col]], to=(col, row))
+        self._dirty = True
+
+    def patch(self, fields):
+        """
+        patch zeichnet geänderte Felder neu, die schon aufgedeckt sind, z.B. während einer
+        angezeigten Generierung. Felder im Nebel bekommen ihre Farbe erst beim Aufdecken.
+
+        Args:
+            fields ([tuple(int, int)]): Reihe und Spalte jedes geänderten Feldes in map_data.
+        """
+        for row, col in fields:
+            if self.explored[row * self.cols + col]:
+                self.image.put(MAP_HEX[self.caster.map_data[row][col]], to=(col, row))
+                self._dirty = True
+
+    def update(self, rays):
+        """
+        update deckt die neu gesehenen Felder auf und verschiebt Spieler und Sichtkegel.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Linienhöhe, Seite und map_pos jeder Spalte.
+        """
+        caster = self.caster
+        row, col = math.floor(caster.pos[0]), math.floor(caster.pos[1])
+        if self.fog_of_war:
+            if (row, col) != self._last_field:
+                # beim Betreten eines Feldes wird die Umgebung aufgedeckt
+                for r in range(row - REVEAL_RADIUS, row + REVEAL_RADIUS + 1):
+                    for c in range(col - REVEAL_RADIUS, col + REVEAL_RADIUS + 1):
+                        self.reveal(r, c)
+            for _, _, map_pos in rays[::REVEAL_RAY_STEP]:
+                self.reveal(map_pos[0], map_pos[1])
+        self._last_field = (row, col)
+
+        # der Ausschnitt folgt dem Spieler, bleibt aber innerhalb der Karte
+        origin = (max(0, min(row - self.view_rows // 2, self.rows - self.view_rows)),
+                  max(0, min(col - self.view_cols // 2, self.cols - self.view_cols)))
+        if self.display is not self.image and (self._dirty or origin != self.origin):
+            from_row, from_col = origin
+            self.display.tk.call(self.display, "copy", self.image, "-from", from_col, from_row,
+                                 from_col + self.view_cols, from_row + self.view_rows,
+                                 "-to", 0, 0, "-zoom", self.scale, self.scale)
+        self.origin = origin
+        self._dirty = False
+
+        # oben rechts, auch wenn sich die Breite des Fensters ändert
+        scale = self.scale
+        left = caster.width - self.view_cols * scale - MARGIN
+        if left != self.left:
+            self.canvas.coords(self.item, left, MARGIN)
+            self.left = left
+
+        # Spieler und Sichtkegel in Pixeln auf dem Canvas
+        x = left + (caster.pos[1] - origin[1]) * scale
+        y = MARGIN + (caster.pos[0] - origin[0]) * scale
+        reach = 3 * scale
+        dx, dy = caster.dir[1], caster.dir[0]
+        px, py = caster.plane[1], caster.plane[0]
+        self.canvas.coords(self.cone, x, y,
+                           x + (dx - px) * reach, y + (dy - py) * reach,
+                           x + (dx + px) * reach, y + (dy + py) * reach)
+        radius = max(2, scale // 2)
+        self.canvas.coords(self.marker, x - radius, y - radius, x + radius, y + radius)
+        # Backends erzeugen neue Canvas-Elemente über der Karte
+        self.canvas.tag_raise("minimap")
@@ -0,0 +1,300 @@
+"""src/parallel.py
+
+Enthält die StripEngine, die die Strahlen eines Bildes in Streifen auf mehrere Prozesse verteilt.
+
+Das Belegungs-Gitter (map_data) liegt einmal im Shared Memory und wird von allen Prozessen
+gelesen. Jeder Prozess berechnet die Strahlen eines Streifens von Spalten und schreibt
+Distanz, Seite und getroffenes Feld in ein gemeinsames Ergebnis. Auf Wunsch zeichnet er
+die Spalten auch gleich in einen gemeinsamen Framebuffer, dann muss der tkinter Thread
+das Bild nur noch anzeigen.
+"""
+
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+from .caster import Caster, fog_tables
+from .framebuffer import Framebuffer
+
+# Bytes pro Strahl im Ergebnis: Distanz (double), Seite, map_x und map_y (je int32)
+RAY_BYTES = 8 + 3 * 4
+
+# Zustand eines Worker-Prozesses: angehängter Shared Memory und Caster
+_worker = {}
+
+class StripCaster(Caster):
+    """
+    Class, die im Worker-Prozess Strahlen durch das Gitter im Shared Memory schickt.
+
+    Erbt die Strahlen-Berechnung vom Caster, hat aber kein Labyrinth, nur das Gitter.
+
+    Attributes:
+        map_data ([memoryview]): Reihen des Gitters im Shared Memory.
+    """
+    def __init__(self, grid, rows, cols, max_distance=None, fog=(0, 0, 0)):
+        """
+        __init__ wird aufgerufen, wenn ein StripCaster Initialisiert wird.
+
+        Args:
+            grid (memoryview): das Gitter, Reihe für Reihe, ein Byte pro Feld.
+            rows (int): Anzahl der Reihen.
+            cols (int): Anzahl der Spalten.
+            max_distance (float): größte Sichtweite, None für unbegrenzt.
+            fog (tuple(int, int, int)): Farbe des Nebels.
+        """
+        # kein super().__init__, weil es kein Labyrinth gibt, aus dem map_data entsteht
+        self.cell_data = None
+        self.world = None
+        self.map_data = [grid[r * cols:(r + 1) * cols] for r in range(rows)]
+        self.width = 0
+        self.height = 0
+        self.ray_step = 1
+        self.pos = [0.0, 0.0]
+        self.dir = [1.0, 0.0]
+        self.plane = [0.0, 0.66]
+        self.engine = None
+        self.skip_map = None
+        self.max_distance = max_distance
+        self.fog_rgb, self.fog_hex = fog_tables(fog) if max_distance is not None else (None, None)
+
+def _attach(role, name) -> memoryview:
+    """
+    _attach hängt einen Shared Memory Block im Worker-Prozess an, alte Blöcke werden geschlossen.
+
+    Args:
+        role (str): "grid", "rays" oder "frame".
+        name (str): Name des Shared Memory Blocks.
+
+    Returns:
+        memoryview: der Speicher des Blocks.
+    """
+    current = _worker.get(role)
+    if current is not None and current[0] == name:
+        return current[1].buf
+    if current is not None:
+        if role == "grid":
+            # der Caster hat noch Sichten auf die Reihen des alten Gitters
+            _worker.pop("caster", None)
+        current[1].close()
+    memory = shared_memory.SharedMemory(name=name)
+    _worker[role] = (name, memory)
+    return memory.buf
+
+def _render_strip(task):
+    """
+    _render_strip berechnet die Strahlen eines Streifens im Worker-Prozess.
+
+    Args:
+        task (tuple): Namen der Shared Memory Blöcke, Größen, Kamera und Bereich der Strahlen.
+    """
+    (grid_name, rows, cols, rays_name, capacity, frame_name, frame_height, background,
+     max_distance, fog, camera, first, last) = task
+    pos, direction, plane, width, height, step = camera
+
+    grid = _attach("grid", grid_name)
+    key = (grid_name, max_distance, fog)
+    caster = _worker.get("caster")
+    if caster is None or _worker.get("caster_key") != key:
+        caster = StripCaster(grid, rows, cols, max_distance, fog)
+        _worker["caster"] = caster
+        _worker["caster_key"] = key
+    caster.pos, caster.dir, caster.plane = list(pos), list(direction), list(plane)
+    caster.width, caster.height, caster.ray_step = width, height, step
+
+    rays = _attach("rays", rays_name)
+    dists = rays[:8 * capacity].cast("d")
+    sides = rays[8 * capacity:12 * capacity].cast("i")
+    hits_x = rays[12 * capacity:16 * capacity].cast("i")
+    hits_y = rays[16 * capacity:20 * capacity].cast("i")
+    frame = None
+    if frame_name is not None:
+        pixels = _attach("frame", frame_name)
+        frame = Framebuffer(len(range(0, width, step)), frame_height, background, pixels)
+        caster.height = frame_height
+
+    for i in range(first, last):
+        side, perp_wall_dist, map_pos = caster.cast_ray(i * step)
+        dists[i] = perp_wall_dist
+        sides[i] = side
+        hits_x[i], hits_y[i] = map_pos
+        if frame is not None:
+            line_height = int(frame_height / perp_wall_dist) if perp_wall_dist > 0 else frame_height
+            draw_start, draw_end = caster.column_span(line_height)
+            rgb = caster.wall_rgb(side, map_pos, line_height)
+            frame.fill_column(i, draw_start, draw_end, rgb)
+
+    # Sichten freigeben, damit der Block später geschlossen werden kann
+    for view in (dists, sides, hits_x, hits_y):
+        view.release()
+    if frame is not None:
+        frame.pixels.release()
+
+class StripEngine:
+    """
+    Class, die den DDA-Algorithmus in Streifen von Spalten auf mehrere Prozesse verteilt.
+
+    Hat dieselbe cast Methode wie NumpyEngine und kann deshalb vom Caster als Engine benutzt werden.
+
+    Attributes:
+        workers (int): Anzahl der Worker-Prozesse.
+        rows (int): Anzahl der Reihen des Gitters.
+        cols (int): Anzahl der Spalten des Gitters.
+        fog (tuple(int, int, int)): Farbe des Nebels.
+        background (tuple(int, int, int)): Farbe von Decke und Boden im Framebuffer.
+        frame_height (int): Höhe des Bildes, das die Worker zeichnen, None für kein Bild.
+        frame (Framebuffer): das zuletzt von den Workern gezeichnete Bild, None ohne Bild.
+    """
+    def __init__(self, map_data, workers=None, fog=(0, 0, 0), background=(0, 0, 0)):
+        """
+        __init__ wird aufgerufen, wenn eine StripEngine Initialisiert wird.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen.
+            workers (int): Anzahl der Worker-Prozesse, standardmäßig alle Kerne.
+            fog (tuple(int, int, int)): Farbe des Nebels.
+            background (tuple(int, int, int)): Farbe von Decke und Boden im Framebuffer.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.rows = 0
+        self.cols = 0
+        self.fog = tuple(fog)
+        self.background = tuple(background)
+        self.frame_height = None
+        self.frame = None
+        self._grid_memory = None
+        self._rays_memory = None
+        self._capacity = 0
+        self._frame_memory = None
+        self.update(map_data)
+        # spawn statt fork, weil der Haupt-Prozess tkinter und mehrere Threads laufen hat
+        self._pool = multiprocessing.get_context("spawn").Pool(self.workers)
+
+    def update(self, map_data):
+        """
+        update kopiert map_data in das Gitter im Shared Memory.
+
+        Hat map_data eine andere Größe, entsteht ein neuer Block unter neuem Namen, den die
+        Worker beim nächsten Bild anhängen.
+
+        Args:
+            map_data ([[int]]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen
+                oder eine zweidimensionale memoryview, die am Stück kopiert wird.
+        """
+        if isinstance(map_data, memoryview):
+            rows, cols = map_data.shape
+        else:
+            rows = len(map_data)
+            cols = len(map_data[0]) if rows else 0
+        if self._grid_memory is None or (rows, cols) != (self.rows, self.cols):
+            old = self._grid_memory
+            self._grid_memory = shared_memory.SharedMemory(create=True, size=max(1, rows * cols))
+            self.rows, self.cols = rows, cols
+            if old is not None:
+                old.close()
+                old.unlink()
+        if isinstance(map_data, memoryview):
+            self._grid_memory.buf[:rows * cols] = map_data.cast("B")
+            return
+        for r, row in enumerate(map_data):
+            self._grid_memory.buf[r * cols:(r + 1) * cols] = bytes(row)
+
+    def patch(self, row, col, value):
+        """
+        patch ändert ein einzelnes Feld des Gitters, die Worker sehen es sofort.
+
+        Args:
+            row (int): Reihe in map_data.
+            col (int): Spalte in map_data.
+            value (int): neuer Wert, > 0 ist eine Wand.
+        """
+        self._grid_memory.buf[row * self.cols + col] = value
+
+    def _reserve(self, count, frame_height):
+        """
+        _reserve legt die Shared Memory Blöcke für Ergebnis und Bild an, wenn sie zu klein sind.
+
+        Args:
+            count (int): Anzahl der Strahlen.
+            frame_height (int): Höhe des Bildes, None für kein Bild.
+        """
+        if count > self._capacity:
+            self._release_rays()
+            # etwas Reserve, damit nicht jede Größenänderung des Fensters neuen Speicher braucht
+            self._capacity = max(count, 2 * self._capacity)
+            self._rays_memory = shared_memory.SharedMemory(create=True,
+                                                           size=RAY_BYTES * self._capacity)
+        if frame_height is None:
+            self.frame = None
+            return
+        size = 3 * count * frame_height
+        if self._frame_memory is None or self._frame_memory.size < size:
+            self._release_frame()
+            self._frame_memory = shared_memory.SharedMemory(create=True, size=max(1, size))
+        if self.frame is None or (self.frame.width, self.frame.height) != (count, frame_height):
+            if self.frame is not None:
+                self.frame.pixels.release()
+            self.frame = Framebuffer(count, frame_height, self.background,
+                                     self._frame_memory.buf)
+
+    def cast(self, pos, direction, plane, width, step=1, max_distance=None) -> tuple:
+        """
+        cast verteilt die Strahlen in Streifen auf die Worker und wartet, bis alle fertig sind.
+
+        Args:
+            pos ([float]): x und y Position der Kamera.
+            direction ([float]): x und y Ausrichtung der Kamera.
+            plane ([float]): x und y Ausrichtung der Kamera-Ebene.
+            width (int): Anzahl der Spalten.
+            step (int): Anzahl der Spalten pro Strahl, ein Strahl an jeder step-ten Spalte.
+            max_distance (float): größte Sichtweite, Strahlen dahinter haben die Distanz inf.
+
+        Returns:
+            tuple(array, array, array, array): Distanz, getroffene Seite
+            und x und y Index der getroffenen Zelle für jede Spalte.
+        """
+        count = len(range(0, width, step))
+        self._reserve(count, self.frame_height)
+        capacity = self._capacity
+        frame_name = self._frame_memory.name if self.frame is not None else None
+        camera = (tuple(pos), tuple(direction), tuple(plane), width, self.frame_height or 0, step)
+
+        # doppelt so viele Streifen wie Worker, damit langsame Streifen sich ausgleichen
+        strips = min(count, 2 * self.workers) or 1
+        bounds = [count * i // strips for i in range(strips + 1)]
+        tasks = [(self._grid_memory.name, self.rows, self.cols, self._rays_memory.name, capacity,
+                  frame_name, self.frame_height, self.background, max_distance, self.fog, camera,
+                  first, last) for first, last in zip(bounds, bounds[1:])]
+        self._pool.map(_render_strip, tasks, chunksize=1)
+
+        # Kopien, damit keine Sicht den Shared Memory offen hält
+        rays = self._rays_memory.buf
+        return (array("d", bytes(rays[:8 * count])),
+                array("i", bytes(rays[8 * capacity:8 * capacity + 4 * count])),
+                array("i", bytes(rays[12 * capacity:12 * capacity + 4 * count])),
+                array("i", bytes(rays[16 * capacity:16 * capacity + 4 * count])))
+
+    def _release_rays(self):
+        if self._rays_memory is not None:
+            self._rays_memory.close()
+            self._rays_memory.unlink()
+            self._rays_memory = None
+
+    def _release_frame(self):
+        if self.frame is not None:
+            self.frame.pixels.release()
+            self.frame = None
+        if self._frame_memory is not None:
+            self._frame_memory.close()
+            self._frame_memory.unlink()
+            self._frame_memory = None
+
+    def close(self):
+        """
+        close beendet die Worker und gibt den Shared Memory frei.
+        """
+        self._pool.terminate()
+        self._pool.join()
+        self._release_rays()
+        self._release_frame()
+        self._grid_memory.close()
+        self._grid_memory.unlink()
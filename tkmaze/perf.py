@@ -0,0 +1,148 @@
+"""src/perf.py
+
+Enthält die FrameStats Class, die die Zeit jeder Phase eines Bildes misst.
+
+Der Raycaster erzeugt FrameStats nur, wenn die Messung eingeschaltet ist,
+sonst kostet sie nichts außer einer Abfrage pro Bild.
+"""
+
+import json
+import time
+from collections import deque
+
+# Phasen eines Bildes in der Reihenfolge, in der sie gemessen werden
+PHASES = ("cast", "draw", "update")
+
+def percentile(values, fraction) -> float:
+    """
+    percentile gibt einen Perzentil-Wert einer Liste von Zahlen wieder.
+
+    Args:
+        values ([float]): Werte, müssen nicht sortiert sein.
+        fraction (float): Perzentil zwischen 0 und 1, z.B. 0.95.
+
+    Returns:
+        float: der Wert, unter dem der Anteil fraction aller Werte liegt, 0 ohne Werte.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+class FrameStats:
+    """
+    Class, die Zeiten und Zähler der letzten Bilder sammelt.
+
+    Attributes:
+        window (int): Anzahl der letzten Bilder, über die Perzentile berechnet werden.
+        phases (dict): Name einer Phase -> Zeiten der letzten Bilder in Sekunden.
+        frames (deque): Gesamtzeit der letzten Bilder in Sekunden.
+        dda_steps (deque): mittlere DDA-Schritte pro Spalte der letzten Bilder.
+        items (deque): Anzahl der Canvas-Elemente der letzten Bilder.
+        frame_count (int): Anzahl aller gemessenen Bilder.
+        current (dict): Zeiten der Phasen des aktuellen Bildes.
+    """
+    def __init__(self, window=600):
+        """
+        __init__ wird aufgerufen, wenn FrameStats Initialisiert wird.
+
+        Args:
+            window (int): Anzahl der letzten Bilder, über die Perzentile berechnet werden.
+        """
+        self.window = window
+        self.phases = {name: deque(maxlen=window) for name in PHASES}
+        self.frames = deque(maxlen=window)
+        self.dda_steps = deque(maxlen=window)
+        self.items = deque(maxlen=window)
+        self.frame_count = 0
+        self.current = {}
+        self._start = 0.0
+        self._mark = 0.0
+
+    def begin(self):
+        """
+        begin startet die Messung eines neuen Bildes.
+        """
+        self.current = {}
+        self._start = self._mark = time.perf_counter()
+
+    def lap(self, name):
+        """
+        lap beendet eine Phase und misst die Zeit seit der letzten Phase.
+
+        Args:
+            name (str): Name der Phase aus PHASES.
+        """
+        now = time.perf_counter()
+        self.current[name] = now - self._mark
+        self._mark = now
+
+    def end(self, rays, pos, items):
+        """
+        end beendet die Messung des Bildes und speichert alle Werte.
+
+        Args:
+            rays ([tuple(int, int, [int])]): Strahlen des Bildes, wie von Caster.cast.
+            pos ([float]): Position der Kamera, von der die Strahlen gestartet sind.
+            items (int): Anzahl der Canvas-Elemente nach dem Zeichnen.
+        """
+        self.frames.append(time.perf_counter() - self._start)
+        for name in PHASES:
+            self.phases[name].append(self.current.get(name, 0.0))
+        # jeder DDA-Schritt geht genau eine Zelle in x oder y weiter
+        start_x, start_y = int(pos[0]), int(pos[1])
+        steps = sum(abs(map_pos[0] - start_x) + abs(map_pos[1] - start_y)
+                    for _, _, map_pos in rays)
+        self.dda_steps.append(steps / len(rays) if rays else 0.0)
+        self.items.append(items)
+        self.frame_count += 1
+
+    def summary(self) -> dict:
+        """
+        summary berechnet p50, p95 und p99 der Bildzeiten und Phasen in Millisekunden.
+
+        Returns:
+            dict: Perzentile jeder Phase und des ganzen Bildes, DDA-Schritte und Elemente.
+        """
+        def percentiles(values):
+            return {f"p{int(p * 100)}": percentile(values, p) * 1000 for p in (0.5, 0.95, 0.99)}
+
+        return {
+            "frames": self.frame_count,
+            "frame_ms": percentiles(self.frames),
+            "phases_ms": {name: percentiles(values) for name, values in self.phases.items()},
+            "dda_steps_per_column": sum(self.dda_steps) / len(self.dda_steps) if self.dda_steps else 0.0,
+            "canvas_items": self.items[-1] if self.items else 0,
+        }
+
+    def text(self) -> str:
+        """
+        text gibt eine kurze Zusammenfassung für die Anzeige im Fenster wieder.
+
+        Returns:
+            str: mehrzeilige Zusammenfassung.
+        """
+        summary = self.summary()
+        frame = summary["frame_ms"]
+        lines = [f"Bild   p50 {frame['p50']:6.1f}  p95 {frame['p95']:6.1f}  p99 {frame['p99']:6.1f} ms"]
+        for name, values in summary["phases_ms"].items():
+            lines.append(f"{name:<7}p50 {values['p50']:6.1f}  p95 {values['p95']:6.1f} ms")
+        lines.append(f"DDA-Schritte/Spalte {summary['dda_steps_per_column']:.1f}  "
+                     f"Elemente {summary['canvas_items']}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """
+        dump speichert die Zusammenfassung und die Zeiten der letzten Bilder als JSON.
+
+        Args:
+            path (str): Pfad der Datei.
+        """
+        data = {
+            "summary": self.summary(),
+            "frames_ms": [value * 1000 for value in self.frames],
+            "phases_ms": {name: [value * 1000 for value in values]
+                          for name, values in self.phases.items()},
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
@@ -0,0 +1,127 @@
+"""src/regenerate.py
+
+Enthält den Regenerator, der ein neues Labyrinth in einem Worker-Prozess generiert.
+
+Der Worker baut das Labyrinth, sein Raster und auf Wunsch die SkipMap und schickt alles
+zusammen zurück. Der tkinter Thread fragt in jedem tick mit poll nach, ob das Ergebnis
+fertig ist, und tauscht es zwischen zwei Bildern aus. Kein Bild wartet auf die Generierung
+und kein Bild sieht ein halb generiertes Labyrinth.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from .accel import SkipMap
+from .maze import Maze, GENERATORS
+
+def build(width, height, algorithm, seed, skip) -> tuple:
+    """
+    build generiert ein Labyrinth im Worker-Prozess mit allem, was der Raycaster braucht.
+
+    Args:
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        algorithm (str): Name des Algorithmus aus GENERATORS.
+        seed (int): Seed für den Zufallsgenerator, None für einen zufälligen Seed.
+        skip (bool): berechnet auch die SkipMap.
+
+    Returns:
+        tuple(Maze, SkipMap): das Labyrinth mit fertigem Raster und die SkipMap oder None.
+    """
+    maze = Maze(width, height)
+    maze.generate(algorithm, seed)
+    # das Raster wird hier gebaut und mit dem Labyrinth übertragen
+    maze.raster()
+    skip_map = SkipMap(maze.raster_view()) if skip else None
+    return maze, skip_map
+
+class Regenerator:
+    """
+    Class, die neue Labyrinthe im Hintergrund generiert und das aktuelle Labyrinth kennt.
+
+    request kann aus jedem Thread aufgerufen werden, z.B. aus der Konsole, poll nur aus
+    dem tkinter Thread.
+
+    Attributes:
+        maze (Maze): das aktuell angezeigte Labyrinth.
+        width (int): länge des nächsten Labyrinths in Zellen.
+        height (int): höhe des nächsten Labyrinths in Zellen.
+        algorithm (str): Name des Algorithmus für das nächste Labyrinth.
+        skip (bool): berechnet die SkipMap im Worker mit.
+        executor (ProcessPoolExecutor): der Worker-Prozess, None vor der ersten Anfrage.
+        future (Future): die laufende Generierung, None wenn keine läuft.
+    """
+    def __init__(self, maze, algorithm="dfs", skip=False):
+        """
+        __init__ wird aufgerufen, wenn ein Regenerator Initialisiert wird.
+
+        Args:
+            maze (Maze): das aktuell angezeigte Labyrinth.
+            algorithm (str): Name des Algorithmus für neue Labyrinthe.
+            skip (bool): berechnet die SkipMap im Worker mit.
+        """
+        self.maze = maze
+        self.width = maze.grid_width
+        self.height = maze.grid_height
+        self.algorithm = maze.algorithm or algorithm
+        self.skip = skip
+        self.executor = None
+        self.future = None
+        self._lock = threading.Lock()
+
+    def request(self, width=None, height=None, algorithm=None, seed=None):
+        """
+        request startet die Generierung eines neuen Labyrinths, eine laufende wird verworfen.
+
+        Args:
+            width (int): länge in Zellen, standardmäßig wie das letzte Labyrinth.
+            height (int): höhe in Zellen, standardmäßig wie das letzte Labyrinth.
+            algorithm (str): Name des Algorithmus, standardmäßig wie beim letzten Labyrinth.
+            seed (int): Seed für den Zufallsgenerator, None für einen zufälligen Seed.
+        """
+        algorithm = algorithm or self.algorithm
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unbekannter Algorithmus: {algorithm}")
+        width = width or self.width
+        height = height or self.height
+        if width < 1 or height < 1:
+            raise ValueError("Das Labyrinth braucht mindestens eine Zelle")
+        with self._lock:
+            if self.executor is None:
+                # spawn statt fork, weil der Haupt-Prozess tkinter und mehrere Threads laufen hat
+                self.executor = ProcessPoolExecutor(1, multiprocessing.get_context("spawn"))
+            if self.future is not None:
+                self.future.cancel()
+            self.width, self.height, self.algorithm = width, height, algorithm
+            self.future = self.executor.submit(build, width, height, algorithm, seed, self.skip)
+
+    def poll(self) -> tuple:
+        """
+        poll gibt das neue Labyrinth wieder, wenn seine Generierung fertig ist.
+
+        Returns:
+            tuple(Maze, SkipMap): das neue Labyrinth und die SkipMap oder None,
+            None solange nichts fertig ist.
+        """
+        with self._lock:
+            future = self.future
+            if future is None or not future.done():
+                return None
+            self.future = None
+        try:
+            maze, skip_map = future.result()
+        except Exception as error: # auch Fehler aus dem Worker, z.B. RecursionError
+            print(f"Generierung fehlgeschlagen: {error}")
+            return None
+        self.maze = maze
+        return maze, skip_map
+
+    def close(self):
+        """
+        close beendet den Worker-Prozess und verwirft eine laufende Generierung.
+        """
+        with self._lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+            self.future = None
@@ -4,56 +4,124 @@ Enthält die Raycaster Class für die Graphische darstellung des Labyrinthes
 """
 
 import math
+import time
 import tkinter as tk
+from .backend import BACKENDS
+from .caster import Caster
+from .controls import Controls
+from .minimap import Minimap
+from .perf import FrameStats
 
-class Raycaster:
+class Raycaster(Caster):
     """
     Class, die einen Raycaster darstellt, welcher ein 2d Labyrinth ins 3-Dimensionale projeziert.
 
+    Erweitert Caster um das tkinter Fenster, in das die Strahlen gezeichnet werden.
+
     Attributes:
-        cell_data (Maze): Das Labyrinth bestehend aus Reihen von Zellen. 
         root (Tk): Das tkinter Fenster.
-        map_data ([Maze]): Das Labyrinth als Liste bestehend aus Reihen von Zahlen.
         width (int): Länge des Fensters, am Anfang Länge des Monitors.
         height (int): Höhe des Fensters, am Anfang Höhe des Monitors.
         canvas (Canvas): Bereich des Fensters, in dem der Raycaster zeichnet.
         quit (bool): Signalisiert, ob das Fenster geschlossen wird.
-        mov_speed (float): Geschwindigkeit des Spielers.
-        rot_speed (float): Rotationsgeschwindigkeit des Spielers.
-        pos ([float]): initiale x und y position des Spielers.
-        dir ([float]): initiale x und y ausrichtung des Spielers
-        plane ([float]): x und y ausrichtung der Kamera
-        tgm (tuple(float, float)): cos und sin Werte einer Rotation.
-        itgm (tuple(float, float)): Umgekehrte cos und sin Werte einer Rotation.
+        backend (LineBackend): zeichnet die berechneten Spalten auf den Canvas.
+        fps (int): maximale Anzahl an Bildern pro Sekunde.
+        frames_rendered (int): Anzahl gezeichneter Bilder.
+        frames_skipped (int): Anzahl übersprungener Bilder, weil sich nichts geändert hat.
+        stats (FrameStats): misst die Phasen jedes Bildes, None wenn die Messung aus ist.
+        hud (bool): zeigt die Messwerte oben links im Fenster an.
+        stats_file (str): Datei, in die die Messwerte beim Schließen geschrieben werden.
+        adaptive (bool): passt ray_step an, damit ein Bild in die Bildzeit von fps passt.
+        max_step (int): größte Anzahl an Spalten pro Strahl, aus der minimalen Auflösung.
+        frame_time (float): geglättete Zeit eines Bildes in Sekunden, None vor dem ersten Bild.
+        steps (generator): Schritte einer laufenden Generierung, None wenn keine läuft.
+        steps_per_frame (int): Anzahl der Generierungs-Schritte pro Bild.
+        controls (Controls): gehaltene Tasten, bewegen den Spieler einmal pro tick.
+        minimap (Minimap): Übersichtskarte oben rechts, None ohne Karte.
+        regenerator (Regenerator): generiert neue Labyrinthe im Hintergrund, None ohne.
+        prefetch_radius (int): Kacheln der Welt, die in jede Richtung bereit gehalten werden.
     """
-    def __init__(self, cell_data, root):
+    def __init__(self, cell_data, root, engine="python", backend="line", fps=60,
+                 instrument=False, hud=False, stats_file=None, adaptive=False, min_scale=0.25,
+                 skip=False, max_distance=None, workers=None, minimap=False, regenerator=None):
         """
         __init__ wird aufgerufen, wenn ein Raycaster Initialisiert wird.
 
         Attributes:
             cell_data ([[Cell]]): das Labyrinth bestehend aus Reihen von Zellen. 
             root (Tk): das tkinter Fenster.
+            engine (str): "python" für die Schleife über alle Spalten, "numpy" für NumpyEngine,
+                "parallel" für StripEngine.
+            backend (str): "line", "pool", "span" oder "photo", siehe backend.py.
+            fps (int): maximale Anzahl an Bildern pro Sekunde.
+            instrument (bool): misst die Phasen jedes Bildes.
+            hud (bool): zeigt die Messwerte im Fenster an, schaltet die Messung ein.
+            stats_file (str): Datei für die Messwerte beim Schließen, schaltet die Messung ein.
+            adaptive (bool): berechnet weniger Strahlen, wenn die Bilder zu lange dauern.
+            min_scale (float): kleinster Anteil der Spalten, für die ein Strahl berechnet wird.
+            skip (bool): überspringt leere Bereiche mit einer SkipMap, siehe Caster.
+            max_distance (float): größte Sichtweite, dahinter liegt schwarzer Nebel.
+            workers (int): Anzahl der Prozesse für die Engine "parallel".
+            minimap (bool): zeigt eine Übersichtskarte mit Nebel über unbekannten Feldern.
+            regenerator (Regenerator): generiert mit der Taste "n" oder aus der Konsole
+                ein neues Labyrinth, das zwischen zwei Bildern ausgetauscht wird.
         """
-        # Standardt Variablen
-        self.cell_data = cell_data
-        self.map_data = list(cell_data)
+        super().__init__(cell_data, root.winfo_screenwidth(), root.winfo_screenheight(), engine,
+                         skip, max_distance, workers=workers)
         self.root = root
-        self.width = self.root.winfo_screenwidth()
-        self.height = self.root.winfo_screenheight()
         self.canvas = tk.Canvas(self.root, width=self.width, height=self.height)
+        if max_distance is not None:
+            # die Wände verschwinden im Nebel, also hat der Hintergrund die Nebelfarbe
+            self.canvas.configure(background="black")
         self.canvas.pack()
         self._quit = False
 
-        # Kamera Variablen
-        self.mov_speed = 0.2
-        self.rot_speed = 0.06
-        self.pos = self.find_start()
-        self.dir = [1.0, 0.0]
-        self.plane = [0.0, 0.66]
-
-        # Trigonometrie Variablen
-        self.tgm = (math.cos(self.rot_speed), math.sin(self.rot_speed))
-        self.itgm = (math.cos(-self.rot_speed), math.sin(-self.rot_speed))
+        # Bild-Takt Variablen
+        self.fps = fps
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self._last_view = None
+        self._after_id = None
+        self._last_tick = None
+
+        # Steuerung
+        self.controls = Controls(self)
+
+        # Mess-Variablen
+        self.stats = FrameStats() if instrument or hud or stats_file else None
+        self.hud = hud
+        self.stats_file = stats_file
+        self._hud_text = ""
+
+        # Variablen der dynamischen Auflösung
+        if not 0 < min_scale <= 1:
+            raise ValueError("min_scale muss zwischen 0 und 1 liegen")
+        self.adaptive = adaptive
+        self.max_step = max(1, round(1 / min_scale))
+        self.frame_time = None
+
+        # Variablen der angezeigten Generierung
+        self.steps = None
+        self.steps_per_frame = 1
+
+        # Zeichen-Backend
+        if backend not in BACKENDS:
+            raise ValueError(f"Unbekanntes Backend: {backend}")
+        self.backend = BACKENDS[backend](self)
+
+        # Übersichtskarte, nach dem Backend, damit sie über dem Bild liegt
+        self.minimap = Minimap(self, self.canvas) if minimap else None
+
+        # neue Labyrinthe aus dem Worker-Prozess
+        self.regenerator = regenerator
+
+        # alle Kacheln, die ein Strahl erreichen kann, liegen schon vor dem ersten Bild bereit
+        self.prefetch_radius = 1
+        if self.world is not None:
+            self.prefetch_radius = self.world.view_radius(max_distance)
+            # sonst verdrängen sich die Kacheln im Radius gegenseitig aus dem Zwischenspeicher
+            self.world.cache_size = max(self.world.cache_size, (2 * self.prefetch_radius + 1) ** 2)
+            self.world.prefetch(self.pos, self.prefetch_radius, math.inf)
 
     def run(self):
         """
@@ -61,128 +129,233 @@ class Raycaster:
         """
         self.root.protocol("WM_DELETE_WINDOW", self.destroy_window)
 
-        self.root.bind('w', self.up_press)
-        self.root.bind('a', self.left_press)
-        self.root.bind('s', self.down_press)
-        self.root.bind('d', self.right_press)
+        self.controls.bind(self.root)
+        if self.regenerator is not None:
+            self.root.bind("<Key-n>", self.regenerate_press)
 
-        while not self._quit:
-            self.width = self.root.winfo_width()
-            self.height = self.root.winfo_height()
-            self.canvas.delete('all')
-            self.render()
-            self.root.update()
+        self._after_id = self.root.after(0, self.tick)
+        self.root.mainloop()
 
-    def destroy_window(self):
+    def tick(self):
         """
-        destroy_window setzt das quit signal zu True und zerstört das Fenster.
+        tick zeichnet ein Bild, wenn sich Kamera oder Fenstergröße geändert haben,
+        und plant sich selbst für das nächste Bild mit root.after ein.
         """
-        self._quit = True
-        self.root.destroy()
+        if self._quit:
+            return
+        frame_start = time.perf_counter()
+
+        # die Bewegung hängt von der vergangenen Zeit ab, nicht von der Anzahl der Bilder
+        if self._last_tick is not None:
+            self.controls.update(frame_start - self._last_tick)
+        self._last_tick = frame_start
+
+        if self.steps is not None:
+            self.advance_generation()
+
+        # ein fertiges Labyrinth wird vor dem Bild ausgetauscht, nie während eines Bildes
+        if self.regenerator is not None:
+            result = self.regenerator.poll()
+            if result is not None:
+                self.set_maze(*result)
+
+        self.width = self.root.winfo_width()
+        self.height = self.root.winfo_height()
+        view = (*self.pos, *self.dir, *self.plane, self.width, self.height)
+        if view != self._last_view:
+            self.render()
+            if self.adaptive:
+                self.adapt_resolution(time.perf_counter() - frame_start)
+            self._last_view = view
+            self.frames_rendered += 1
+        else:
+            self.frames_skipped += 1
 
-    def render(self):
+        # erzeugt Kacheln der Welt zwischen den Bildern, nicht während eines Bildes
+        if self.world is not None:
+            missing = bool(self.world.missing)
+            if self.world.prefetch(self.pos, self.prefetch_radius) and missing:
+                # im letzten Bild standen Wände für fehlende Kacheln, also wird neu gezeichnet
+                self._last_view = None
+
+        # wartet den Rest der Bildzeit ab
+        elapsed = time.perf_counter() - frame_start
+        delay = max(1, int((1.0 / self.fps - elapsed) * 1000))
+        self._after_id = self.root.after(delay, self.tick)
+
+    def animate(self, steps, steps_per_frame=1):
         """
-        render führt den DDA-Algorithmus aus und zeichnet ein Bild auf den Canvas.
+        animate zeigt eine laufende Generierung an, pro Bild werden steps_per_frame Schritte gemacht.
+
+        Args:
+            steps (generator): Schritte von Maze.generate_steps für das Labyrinth des Raycasters.
+            steps_per_frame (int): Anzahl der Schritte pro Bild.
         """
-        for x in range(self.width):
-            # Kamera x-Position
-            cam_x = 2 * x / self.width - 1
-            # x und y Richtung des Strahls
-            ray_dir = self.calculate_ray_direction(cam_x)
-            # Position als Index in Map-data
-            map_pos = [int(self.pos[0]), int(self.pos[1])]
-            side_dist, delta_dist = self.calculate_delta_distances(ray_dir, map_pos)
-            step = self.calculate_step(ray_dir)
-            side, perp_wall_dist = self.perform_dda(map_pos, side_dist, delta_dist, step)
-            line_height = int(self.height / perp_wall_dist) if perp_wall_dist != 0 else int('inf')
-            self.draw_line(line_height, side, map_pos, x)
-
-    def calculate_ray_direction(self, camera_x) -> list[float]:
+        self.steps = steps
+        self.steps_per_frame = steps_per_frame
+
+    def regenerate_press(self, event):
         """
-        calculate_ray_direction Berechnet die Richtung des Strahls basierend auf der Kameraposition.
+        regenerate_press startet die Generierung eines neuen Labyrinths im Hintergrund.
 
         Args:
-            camera_x (float): x-Koordinate in Kamera-Raum.
+            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
+        """
+        self.regenerator.request()
 
-        Returns:
-            [float]: x und y Richtung des Strahls.
+    def set_maze(self, cell_data, skip_map=None):
         """
-        ray_dir_x = self.dir[0] + self.plane[0] * camera_x
-        ray_dir_y = self.dir[1] + self.plane[1] * camera_x
-        return [ray_dir_x, ray_dir_y]
+        set_maze tauscht das Labyrinth aus, siehe Caster, und baut die Übersichtskarte neu.
 
-    def calculate_delta_distances(self, ray_dir, map_pos) -> tuple[list[float], list[float]]:
+        Args:
+            cell_data (Maze): das neue Labyrinth, sein Raster ist am besten schon gebaut.
+            skip_map (SkipMap): fertige SkipMap des neuen Labyrinths, wird sonst berechnet.
+        """
+        # eine angezeigte Generierung gehört zum alten Labyrinth
+        self.steps = None
+        super().set_maze(cell_data, skip_map)
+        if self.minimap is not None:
+            self.canvas.delete("minimap")
+            self.minimap = Minimap(self, self.canvas, self.minimap.size, self.minimap.fog_of_war)
+        self.invalidate()
+
+    def patch_walls(self, changes) -> list[tuple[int, int]]:
         """
-        calculate_delta_distances Berechnet die Seiten- und Delta-Distanzen für den DDA-Algorithmus.
+        patch_walls überträgt entfernte Wände in map_data, siehe Caster, und in die Übersichtskarte.
 
         Args:
-            ray_dir ([float]): x und y Richtung des Strahls.
-            map_pos ([int]): Position der Kamera als x und y Index in map_data.
+            changes ([tuple(int, int)]): Index der Zelle und Bit der entfernten Wand.
 
         Returns:
-            tuple([float], [float]): Seiten-Distanzen und Delta-Distanzen 
+            [tuple(int, int)]: Reihe und Spalte jedes geänderten Feldes in map_data.
+        """
+        fields = super().patch_walls(changes)
+        if self.minimap is not None:
+            self.minimap.patch(fields)
+        return fields
+
+    def advance_generation(self):
+        """
+        advance_generation macht die nächsten Schritte der Generierung und überträgt nur
+        die entfernten Wände in map_data.
+        """
+        changed = False
+        for _ in range(self.steps_per_frame):
+            changes = next(self.steps, None)
+            if changes is None:
+                # Generierung ist fertig
+                self.steps = None
+                break
+            self.patch_walls(changes)
+            changed = changed or bool(changes)
+        if changed:
+            self.invalidate()
+
+    def adapt_resolution(self, frame_time):
+        """
+        adapt_resolution passt nach jedem Bild an, für wie viele Spalten ein Strahl gilt.
+
+        Dauern die Bilder länger als die Bildzeit von fps, wird ein Strahl über eine Spalte
+        mehr gezogen, bis max_step erreicht ist. Wäre ein Bild mit einer Spalte weniger
+        pro Strahl noch deutlich schneller als die Bildzeit, wird die Auflösung wieder erhöht.
+
+        Args:
+            frame_time (float): gemessene Zeit des letzten Bildes in Sekunden.
         """
-        delta_dist_x = abs(1 / ray_dir[0]) if ray_dir[0] != 0 else float('inf')
-        delta_dist_y = abs(1 / ray_dir[1]) if ray_dir[1] != 0 else float('inf')
-        if ray_dir[0] < 0:
-            side_dist_x = (self.pos[0] - map_pos[0]) * delta_dist_x
+        budget = 1.0 / self.fps
+        if self.frame_time is None:
+            self.frame_time = frame_time
         else:
-            side_dist_x = (map_pos[0] + 1.0 - self.pos[0]) * delta_dist_x
-        if ray_dir[1] < 0:
-            side_dist_y = (self.pos[1] - map_pos[1]) * delta_dist_y
+            # geglättet, damit einzelne langsame Bilder die Auflösung nicht springen lassen
+            self.frame_time = 0.8 * self.frame_time + 0.2 * frame_time
+
+        step = self.ray_step
+        if self.frame_time > budget and step < self.max_step:
+            new_step = step + 1
+        elif step > 1 and self.frame_time * step / (step - 1) < 0.8 * budget:
+            new_step = step - 1
         else:
-            side_dist_y = (map_pos[1] + 1.0 - self.pos[1]) * delta_dist_y
-        return [side_dist_x, side_dist_y], [delta_dist_x, delta_dist_y]
+            return
+        # die Zeit eines Bildes wächst mit der Anzahl der Strahlen
+        self.frame_time *= step / new_step
+        self.ray_step = new_step
 
-    def calculate_step(self, ray_dir) -> list[int]:
+    def invalidate(self):
         """
-        calculate_step Bestimmt die Schrittwerte für den DDA-Algorithmus.
+        invalidate erzwingt, dass beim nächsten tick ein neues Bild gezeichnet wird.
+        """
+        self._last_view = None
 
-        Args:
-            ray_dir ([float]): x und y Richtung des Strahls.
+    def report(self) -> str:
+        """
+        report gibt an, wie viele Bilder gezeichnet und übersprungen wurden.
 
         Returns:
-            [int]: x und y Schrittwerte
+            str: gezeichnete und übersprungene Bilder.
         """
-        # negativ, wenn x/y kleiner 0, sonst positiv
-        step_x = -1 if ray_dir[0] < 0 else 1
-        step_y = -1 if ray_dir[1] < 0 else 1
-        return [step_x, step_y]
+        text = f"Bilder gezeichnet: {self.frames_rendered}, übersprungen: {self.frames_skipped}"
+        if getattr(self.engine, "frame_height", None) is not None:
+            text += f", von den Workern gezeichnet: {self.backend.worker_frames}"
+        if self.adaptive:
+            text += f", Spalten pro Strahl: {self.ray_step}"
+        return text
 
-    def perform_dda(self, map_pos, side_dist, delta_dist, step) -> tuple[int, float]:
+    def destroy_window(self):
         """
-        Führt den DDA-Algorithmus aus, um die Wand zu finden.
-
-        Args:
-            map_pos ([int]): Position der Kamera als x und y Index in map_data.
-            side_dist ([float]): Länge des Strahls, um die 1. x/y Seite tu treffen.
-            delta_dist ([float]): Länge des Strahls, um von einer x/y-Seite die nächste zu treffen.
-            step (int): Inkrement-Wert um map_pos auf den Strahl zu Richten.
+        destroy_window setzt das quit signal zu True und zerstört das Fenster.
+        """
+        self._quit = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        print(self.report())
+        if self.stats is not None and self.stats_file:
+            self.stats.dump(self.stats_file)
+        self.close()
+        if self.regenerator is not None:
+            self.regenerator.close()
+        self.root.destroy()
 
-        Returns:
-            tuple(int, float): die Getroffene Seite (x oder y zugewendet) und Distanz zu dieser.
+    def render(self):
+        """
+        render führt den DDA-Algorithmus aus und zeichnet ein Bild auf den Canvas.
         """
-        hit = False
-        side = 0
-        # während noch keine Seite getroffen wurde
-        while not hit: # Seite noch nicht getroffen, gehe zur nächsten Seite
-            if side_dist[0] < side_dist[1]: # X-Seite, nicht getroffen
-                side_dist[0] += delta_dist[0]
-                map_pos[0] += step[0]
-                side = 0
-            else:                           # Y-Seite, nicht getroffen
-                side_dist[1] += delta_dist[1]
-                map_pos[1] += step[1]
-                side = 1
-            if self.map_data[map_pos[0]][map_pos[1]] > 0: # Seite getroffen
-                hit = True
-        if side == 0: # X-Seite
-            perp_wall_dist = side_dist[0] - delta_dist[0]
-        else:         # Y-Seite
-            perp_wall_dist = side_dist[1] - delta_dist[1]
-        return side, perp_wall_dist
-
-    def draw_line(self, line_height, side, map_pos, x):
+        if getattr(self.engine, "frame_height", None) is not None:
+            # die Worker zeichnen in der aktuellen Höhe des Fensters, nicht in der vom Start
+            self.engine.frame_height = self.height
+        stats = self.stats
+        if stats is None:
+            rays = self.cast()
+            self.backend.draw(rays)
+            if self.minimap is not None:
+                self.minimap.update(rays)
+            return
+
+        stats.begin()
+        rays = self.cast()
+        stats.lap("cast")
+        self.backend.draw(rays)
+        if self.minimap is not None:
+            self.minimap.update(rays)
+        stats.lap("draw")
+        # lässt tkinter den Canvas jetzt neu zeichnen, damit die Zeit dafür messbar ist
+        self.root.update_idletasks()
+        stats.lap("update")
+        stats.end(rays, self.pos, len(self.canvas.find_all()))
+        if self.hud:
+            self.draw_hud()
+
+    def draw_hud(self):
+        """
+        draw_hud zeigt die Messwerte oben links über dem Bild an.
+        """
+        # die Zusammenfassung wird nur alle 30 Bilder neu berechnet
+        if self.stats.frame_count % 30 == 1 or not self._hud_text:
+            self._hud_text = self.stats.text()
+        self.canvas.delete("hud")
+        self.canvas.create_text(10, 10, anchor="nw", text=self._hud_text, fill="white",
+                                font=("Courier", 10), tags="hud")
+
+    def draw_line(self, line_height, side, map_pos, x, line_width=1):
         """
         draw_line zeichnet eine vertikale Linie auf dem Canvas, um die Wand darzustellen.
 
@@ -191,90 +364,33 @@ class Raycaster:
             side (int): Gibt an, ob die zu zeichende Seite nach x oder y ausgerichtet ist.
             map_pos ([int]): Position der Wand als x und y Index in map_data.
             x (int): Pixelwert, auf welcher Länge die Linie gezeichnet werden soll.
+            line_width (int): Breite der Linie in Pixeln, ab x nach rechts.
         """
         draw_start = -line_height // 2 + self.height // 2
         draw_end = line_height // 2 + self.height // 2
         draw_start = max(draw_start, 0) # negative pixel existieren nicht
         draw_end = min(draw_end, self.height) # pixel über dem fenster existieren nicht
 
-        # wählt Farbe je nach Zahl in map_data an der Position der Wand
-        wallcolors = [[150,150,150], [50,50,50], [50,150,50], [0,0,150]]
-        color = wallcolors[self.map_data[map_pos[0]][map_pos[1]]]
+        if self.fog_hex is not None:
+            # mit Sichtweite wird die Farbe mit dem Nebel gemischt
+            hex_color = self.wall_color(side, map_pos, line_height)
+        else:
+            # wählt Farbe je nach Zahl in map_data an der Position der Wand
+            wallcolors = [[150,150,150], [50,50,50], [50,150,50], [0,0,150]]
+            color = wallcolors[self.map_data[map_pos[0]][map_pos[1]]]
 
-        if side:
-            for k, v in enumerate(color):
-                # verdunkelt pixel, je nach Seite
-                color[k] = int(v / 1.2)
+            if side:
+                for k, v in enumerate(color):
+                    # verdunkelt pixel, je nach Seite
+                    color[k] = int(v / 1.2)
 
-        # wandelt RGB Werte für tkinter in Hex um
-        hex_color = f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
+            # wandelt RGB Werte für tkinter in Hex um
+            hex_color = f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
         # zeichet vertikale Linie auf Canvas
-        self.canvas.create_line(x, draw_start, x, draw_end, fill=hex_color)
-
-    def left_press(self, event):
-        """
-        left_press wird aufgerufen, wenn 'a' gedrückt wird, Spieler dreht sich nach links.
-
-        Args:
-            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
-        """
-        self.dir[1] = self.dir[0] * self.itgm[1] + self.dir[1] * self.itgm[0]
-        self.dir[0] = self.dir[0] * self.itgm[0] - self.dir[1] * self.itgm[1]
-        self.plane[1] = self.plane[0] * self.itgm[1] + self.plane[1] * self.itgm[0]
-        self.plane[0] = self.plane[0] * self.itgm[0] - self.plane[1] * self.itgm[1]
-
-    def right_press(self, event):
-        """
-        right_press wird aufgerufen, wenn 'd' gedrückt wird, Spieler dreht sich nach rechts.
-
-        Args:
-            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
-        """
-        self.dir[1] = self.dir[0] * self.tgm[1] + self.dir[1] * self.tgm[0]
-        self.dir[0] = self.dir[0] * self.tgm[0] - self.dir[1] * self.tgm[1]
-        self.plane[1] = self.plane[0] * self.tgm[1] + self.plane[1] * self.tgm[0]
-        self.plane[0] = self.plane[0] * self.tgm[0] - self.plane[1] * self.tgm[1]
-
-    def up_press(self, event):
-        """
-        up_press wird aufgerufen, wenn 's' gedrückt wird, Spieler läuft nach vorne.
-
-        Args:
-            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
-        """
-        if not self.map_data[int(self.pos[0] + self.dir[0] * self.mov_speed)][int(self.pos[1])]:
-            self.pos[0] += self.dir[0] * self.mov_speed
-        if not self.map_data[int(self.pos[0])][int(self.pos[1] + self.dir[1] * self.mov_speed)]:
-            self.pos[1] += self.dir[1] * self.mov_speed
-
-    def down_press(self, event):
-        """
-        down_press wird aufgerufen, wenn 's' gedrückt wird, Spieler läuft nach hinten.
-
-        Args:
-            event (event): von tkinter genutzt, um einen Tastendruck mit der Funktion zu verbinden.
-        """
-        if not self.map_data[int(self.pos[0] - self.dir[0] * self.mov_speed)][int(self.pos[1])]:
-            self.pos[0] -= self.dir[0] * self.mov_speed
-        if not self.map_data[int(self.pos[0])][int(self.pos[1] - self.dir[1] * self.mov_speed)]:
-            self.pos[1] -= self.dir[1] * self.mov_speed
-
-    def find_start(self) -> list[float]:
-        """
-        Findet den Start des Labyrinths, damit der Spieler nicht in eine Wand platziert wird.
-
-        Returns:
-                [float]: x und y Start-Werte
-        """
-        start_x = 2.5
-        start_y = 1.5
-        for x, row in enumerate(self.cell_data):
-            for y, cell in enumerate(row):
-                if cell == 2:
-                    nb_cells = self.cell_data.get_connected_neighbors((x-1,y-1))
-                    start_y = float(x / 2.0 + nb_cells[0].pos_x + 1.0) # wtf
-                    start_x = float(y / 2.0 + nb_cells[0].pos_y + 1.0)
-                    break
-
-        start = [ start_x, start_y ]
-        return start
+        if line_width > 1:
+            # tkinter zentriert breite Linien um x
+            x += line_width / 2
+            self.canvas.create_line(x, draw_start, x, draw_end, fill=hex_color, width=line_width,
+                                    tags="wall")
+        else:
+            self.canvas.create_line(x, draw_start, x, draw_end, fill=hex_color, tags="wall")
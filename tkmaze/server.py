@@ -0,0 +1,319 @@
+"""src/server.py
+
+Enthält den MazeServer, der Labyrinthe über ein einfaches Zeilen-Protokoll ausliefert.
+
+Jede Anfrage ist eine Zeile, z.B. `EXPORT dfs 20 30 7 txt`, die Antwort beginnt mit
+`OK <Bytes>` und den Daten oder mit `ERR <Meldung>`. Generieren, Lösen und Exportieren
+laufen in einem Prozess-Pool, damit die Event-Loop nie blockiert. Ergebnisse werden nach
+(Befehl, Algorithmus, Größe, Seed, Format) zwischengespeichert, gleiche Anfragen, die
+gleichzeitig ankommen, warten auf dieselbe Berechnung. Eine Antwort wird im Pool komplett
+gebaut und liegt ganz im Speicher, bevor sie in Blöcken an den Socket geht, deshalb begrenzt
+max_cells auch ihre Größe. Eine Anfrage-Zeile darf höchstens LINE_LIMIT Bytes lang sein.
+`python3 -m tkmaze.server --port 8765`
+
+Befehle:
+    GENERATE <algorithmus> <x> <y> <seed>           Labyrinth als .tkmz Daten
+    EXPORT <algorithmus> <x> <y> <seed> <format>    txt, csv, grid oder tkmz
+    SOLVE <algorithmus> <x> <y> <seed>              Lösungsweg, eine Zelle "x y" pro Zeile
+    QUIT                                            beendet die Verbindung
+"""
+
+import argparse
+import asyncio
+import io
+import multiprocessing
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .maze import Maze, GENERATORS
+from .export import WRITERS, CHUNK_SIZE
+from .solve import Solver
+from . import storage
+
+# längste Anfrage-Zeile in Bytes, das Limit des StreamReader
+LINE_LIMIT = 1 << 16
+
+# Format einer Antwort -> Export Funktion, "tkmz" ist binär
+FORMATS = {suffix.lstrip("."): writer for suffix, writer in WRITERS.items()}
+
+def produce(command, algorithm, width, height, seed, fmt) -> bytes:
+    """
+    produce generiert ein Labyrinth im Prozess-Pool und gibt die Antwort als Bytes wieder.
+
+    Die ganze Antwort wird gepuffert, nur das Schreiben an den Socket geschieht in Blöcken.
+
+    Args:
+        command (str): "GENERATE", "EXPORT" oder "SOLVE".
+        algorithm (str): Name des Algorithmus aus GENERATORS.
+        width (int): länge des Labyrinths in Zellen.
+        height (int): höhe des Labyrinths in Zellen.
+        seed (int): Seed für den Zufallsgenerator.
+        fmt (str): Format für EXPORT, "tkmz" oder ein Schlüssel aus FORMATS.
+
+    Returns:
+        bytes: Daten der Antwort.
+    """
+    maze = Maze(width, height)
+    maze.generate(algorithm, seed)
+    if command == "SOLVE":
+        path = Solver(maze).path()
+        return "".join(f"{x} {y}\n" for x, y in path).encode()
+    if fmt == "tkmz":
+        data = io.BytesIO()
+        storage.write(maze, data)
+        return data.getvalue()
+    text = io.StringIO()
+    FORMATS[fmt](maze.iter_rows(), width, text)
+    return text.getvalue().encode()
+
+class MazeServer:
+    """
+    Class, die Anfragen vieler Verbindungen annimmt und die Arbeit an einen Prozess-Pool gibt.
+
+    Attributes:
+        host (str): Adresse, an der der Server lauscht.
+        port (int): Port, an dem der Server lauscht, 0 für einen freien Port.
+        max_cells (int): größte Anzahl an Zellen eines Labyrinths.
+        cache_bytes (int): größte Summe der zwischengespeicherten Antworten in Bytes.
+        cache (OrderedDict): zuletzt benutzte Antworten nach Schlüssel der Anfrage.
+        cached_bytes (int): aktuelle Summe der zwischengespeicherten Antworten in Bytes.
+        pending (dict): laufende Berechnungen nach Schlüssel der Anfrage.
+        hits (int): Anzahl der Antworten aus dem Zwischenspeicher.
+        misses (int): Anzahl der berechneten Antworten.
+        executor (ProcessPoolExecutor): Prozess-Pool für Generieren, Lösen und Exportieren.
+        server (Server): der asyncio Server, None bevor start aufgerufen wurde.
+        clients (dict): StreamWriter -> Task jeder offenen Verbindung.
+    """
+    def __init__(self, host="127.0.0.1", port=8765, workers=None, cache_bytes=64 << 20,
+                 max_cells=1_000_000):
+        """
+        __init__ wird aufgerufen, wenn ein MazeServer Initialisiert wird.
+
+        Args:
+            host (str): Adresse, an der der Server lauscht.
+            port (int): Port, an dem der Server lauscht, 0 für einen freien Port.
+            workers (int): Anzahl der Prozesse, standardmäßig alle Kerne.
+            cache_bytes (int): größte Summe der zwischengespeicherten Antworten in Bytes.
+            max_cells (int): größte Anzahl an Zellen eines Labyrinths.
+        """
+        self.host = host
+        self.port = port
+        self.max_cells = max_cells
+        self.cache_bytes = cache_bytes
+        self.cache = OrderedDict()
+        self.cached_bytes = 0
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+        # spawn statt fork, sonst erben die Worker offene Verbindungen und diese bekommen
+        # nach writer.close() kein EOF, solange ein Worker läuft
+        self.executor = ProcessPoolExecutor(workers or os.cpu_count() or 1,
+                                            multiprocessing.get_context("spawn"))
+        self.server = None
+        self.clients = {}
+
+    def parse(self, line) -> tuple:
+        """
+        parse prüft eine Anfrage und wandelt sie in den Schlüssel für den Zwischenspeicher um.
+
+        Args:
+            line (str): die Anfrage ohne Zeilenumbruch.
+
+        Returns:
+            tuple(str, str, int, int, int, str): Befehl, Algorithmus, Länge, Höhe, Seed und Format.
+        """
+        parts = line.split()
+        if not parts:
+            raise ValueError("Leere Anfrage")
+        command = parts[0].upper()
+        match command, len(parts):
+            case "GENERATE", 5:
+                fmt = "tkmz"
+            case "SOLVE", 5:
+                fmt = "path"
+            case "EXPORT", 6:
+                fmt = parts[5].lower()
+                if fmt != "tkmz" and fmt not in FORMATS:
+                    raise ValueError(f"Unbekanntes Format: {fmt}")
+            case ("GENERATE" | "SOLVE" | "EXPORT"), _:
+                raise ValueError(f"Falsche Anzahl an Argumenten für {command}")
+            case _:
+                raise ValueError(f"Unbekannter Befehl: {command}")
+        algorithm = parts[1]
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unbekannter Algorithmus: {algorithm}")
+        try:
+            width, height, seed = int(parts[2]), int(parts[3]), int(parts[4])
+        except ValueError:
+            raise ValueError("Größe und Seed müssen ganze Zahlen sein") from None
+        if width < 1 or height < 1 or width * height > self.max_cells:
+            raise ValueError(f"Größe muss zwischen 1 und {self.max_cells} Zellen liegen")
+        if fmt == "tkmz":
+            # vor der Generierung, damit ein zu großer Seed nicht erst im Pool auffällt
+            storage.check_seed(seed)
+        return command, algorithm, width, height, seed, fmt
+
+    async def result(self, key) -> bytes:
+        """
+        result gibt die Antwort aus dem Zwischenspeicher wieder oder berechnet sie im Pool.
+
+        Args:
+            key (tuple): Schlüssel der Anfrage, wie von parse geliefert.
+
+        Returns:
+            bytes: Daten der Antwort.
+        """
+        data = self.cache.get(key)
+        if data is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return data
+        # eine gleiche Anfrage läuft schon, dann wird auf deren Ergebnis gewartet
+        future = self.pending.get(key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.get_running_loop().run_in_executor(self.executor, produce, *key)
+            self.pending[key] = future
+            future.add_done_callback(lambda done: self.finish(key, done))
+        # shield, damit ein abgebrochener Client die Berechnung der anderen nicht abbricht
+        return await asyncio.shield(future)
+
+    def finish(self, key, future):
+        """
+        finish wird aufgerufen, wenn eine Berechnung fertig ist, und speichert ihr Ergebnis.
+
+        Args:
+            key (tuple): Schlüssel der Anfrage.
+            future (Future): die fertige Berechnung.
+        """
+        del self.pending[key]
+        if not future.cancelled() and future.exception() is None:
+            self.store(key, future.result())
+
+    def store(self, key, data):
+        """
+        store legt eine Antwort im Zwischenspeicher ab und entfernt die ältesten, bis sie passt.
+
+        Args:
+            key (tuple): Schlüssel der Anfrage.
+            data (bytes): Daten der Antwort.
+        """
+        if len(data) > self.cache_bytes:
+            return
+        self.cache[key] = data
+        self.cached_bytes += len(data)
+        while self.cached_bytes > self.cache_bytes:
+            _, old = self.cache.popitem(last=False)
+            self.cached_bytes -= len(old)
+
+    async def handle(self, reader, writer):
+        """
+        handle beantwortet alle Anfragen einer Verbindung, bis sie geschlossen wird.
+
+        Args:
+            reader (StreamReader): liest die Anfragen.
+            writer (StreamWriter): schreibt die Antworten.
+        """
+        self.clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # die Zeile ist länger als LINE_LIMIT, ihr Rest ist nicht mehr zuzuordnen
+                    writer.write(f"ERR Anfrage ist länger als {LINE_LIMIT} Bytes\n".encode())
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                line = line.decode("utf-8", "replace").strip()
+                if line.upper() == "QUIT":
+                    break
+                try:
+                    data = await self.result(self.parse(line))
+                except Exception as error: # auch Fehler aus dem Prozess-Pool, z.B. RecursionError
+                    writer.write(f"ERR {error}\n".encode())
+                    await writer.drain()
+                    continue
+                writer.write(f"OK {len(data)}\n".encode())
+                # in Blöcken, damit ein langsamer Client den Speicher nicht füllt
+                view = memoryview(data)
+                for offset in range(0, len(data), CHUNK_SIZE):
+                    writer.write(view[offset:offset + CHUNK_SIZE])
+                    await writer.drain()
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # CancelledError kommt von close, die Verbindung endet dann wie bei EOF
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    async def start(self):
+        """
+        start öffnet den Server, danach nimmt er Verbindungen an.
+        """
+        self.server = await asyncio.start_server(self.handle, self.host, self.port,
+                                                 limit=LINE_LIMIT)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """
+        serve_forever startet den Server und beantwortet Anfragen, bis er abgebrochen wird.
+        """
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """
+        close schließt den Server, alle offenen Verbindungen und beendet den Prozess-Pool.
+        """
+        if self.server is not None:
+            self.server.close()
+        # ohne das warten die Verbindungen weiter auf ihre nächste Anfrage oder ihr Ergebnis
+        tasks = list(self.clients.values())
+        for writer, task in list(self.clients.items()):
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # eine laufende Berechnung läuft zu Ende, die Event-Loop soll darauf nicht blockieren
+        await asyncio.to_thread(self.executor.shutdown, cancel_futures=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+def main(argv=None):
+    """
+    main liest die Kommandozeilen-Argumente und startet den Server.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.server",
+                                     description="Liefert Labyrinthe über einen Socket aus.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="Anzahl der Prozesse")
+    parser.add_argument("--cache-mb", type=int, default=64,
+                        help="Größe des Zwischenspeichers in MB")
+    parser.add_argument("--max-cells", type=int, default=1_000_000,
+                        help="größte Anzahl an Zellen eines Labyrinths")
+    args = parser.parse_args(argv)
+
+    server = MazeServer(args.host, args.port, args.workers, args.cache_mb << 20, args.max_cells)
+
+    async def run():
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    print(f"tkmaze Server auf {args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+"""src/simulate.py
+
+Enthält die Simulation Class, die viele Agenten gleichzeitig mit NumPy durch ein Labyrinth bewegt.
+
+Die Agenten laufen von Zelle zu Zelle über das Raster von Maze.raster_view(), das ohne
+Kopie übernommen wird. Eine Position ist der flache Index einer Zelle im Raster, die Wand
+in Richtung d liegt bei Position + offsets[d] und die nächste Zelle bei Position + 2 * offsets[d].
+Die offenen Richtungen jeder Zelle werden einmal als 4-Bit Maske bestimmt, Zufall und
+rechte Hand wählen ihre Richtung aus festen Tabellen nach dieser Maske. Alle Agenten einer
+Strategie werden in jedem tick gemeinsam mit Array-Operationen bewegt.
+
+Nur an Kreuzungen (3 oder 4 offene Richtungen) gibt es eine Wahl. Jede Kreuzung bekommt eine
+fortlaufende Nummer, Trémaux-Markierungen und Wiederbesuche werden nur über diese Nummern
+gespeichert: ein Byte pro Kreuzung und Trémaux-Agent, ein Bit pro Kreuzung und Agent.
+
+NumPy wird nur von diesem Modul gebraucht, wie von engine.py.
+`python3 -m tkmaze.simulate --maze 500 500 --agents 10000 --policy random --ticks 1000`
+"""
+
+import argparse
+import time
+import numpy as np
+from .maze import Maze, GENERATORS
+
+# Richtungen im Uhrzeigersinn: Norden, Osten, Süden, Westen
+DIRECTIONS = np.arange(4)
+
+# Bit jeder Zelle innerhalb eines Bytes von visited
+BITS = np.array([1 << i for i in range(8)], dtype=np.uint8)
+
+# Anzahl offener Richtungen jeder 4-Bit Maske
+DEGREES = np.array([bin(mask).count("1") for mask in range(16)], dtype=np.uint8)
+
+def mark_table() -> np.ndarray:
+    """
+    mark_table bestimmt, wie sich die Trémaux-Markierungen einer Kreuzung ändern. Ein Byte
+    hält 2 Bit pro Richtung, weil ein Durchgang höchstens 2 Markierungen bekommt.
+
+    Returns:
+        ndarray: (256, 5) Byte nach einer Markierung mehr in Richtung d, Spalte d + 1.
+            Spalte 0 ist "keine Richtung" und lässt das Byte gleich.
+    """
+    table = np.zeros((256, 5), dtype=np.uint8)
+    for byte in range(256):
+        table[byte, 0] = byte
+        for direction in range(4):
+            marks = min((byte >> 2 * direction & 3) + 1, 2)
+            table[byte, direction + 1] = byte & ~(3 << 2 * direction) | marks << 2 * direction
+    return table
+
+def raster_offsets(stride) -> np.ndarray:
+    """
+    raster_offsets gibt die Verschiebung des flachen Raster-Index für jede Richtung wieder.
+
+    Args:
+        stride (int): Länge einer Reihe des Rasters (2 * grid_width + 1).
+
+    Returns:
+        ndarray: Verschiebung zur Wand in Richtung Norden, Osten, Süden und Westen.
+    """
+    return np.array([-stride, 1, stride, -1], dtype=np.int64)
+
+def random_table() -> np.ndarray:
+    """
+    random_table bestimmt für jede Maske offener Richtungen 12 gleich wahrscheinliche Wahlen.
+
+    12 ist durch 1, 2, 3 und 4 teilbar, deshalb kommt jede offene Richtung gleich oft vor.
+
+    Returns:
+        ndarray: (16, 12) Richtung für Maske und Zufallszahl von 0 bis 11.
+    """
+    table = np.zeros((16, 12), dtype=np.int8)
+    for mask in range(16):
+        options = [d for d in range(4) if mask >> d & 1]
+        if options:
+            table[mask] = [options[i % len(options)] for i in range(12)]
+    return table
+
+def wall_follower_table() -> np.ndarray:
+    """
+    wall_follower_table bestimmt für jede Richtung und Maske den nächsten Schritt mit der
+    rechten Hand an der Wand: rechts, geradeaus, links, sonst zurück.
+
+    Returns:
+        ndarray: (4, 16) Richtung für bisherige Richtung und Maske offener Richtungen.
+    """
+    table = np.zeros((4, 16), dtype=np.int8)
+    for heading in range(4):
+        for mask in range(16):
+            table[heading, mask] = heading
+            for turn in (1, 0, 3, 2):
+                direction = (heading + turn) % 4
+                if mask >> direction & 1:
+                    table[heading, mask] = direction
+                    break
+    return table
+
+def tremaux_table() -> np.ndarray:
+    """
+    tremaux_table bestimmt für jede Kreuzung die Wahl nach den Regeln von Trémaux, mit 12
+    gleich wahrscheinlichen Wahlen unter den Wegen mit den wenigsten Markierungen.
+
+    Returns:
+        ndarray: (5 * 256 * 16, 12) Richtung für den Index
+            (Rückweg + 1) * 4096 + Markierungen * 16 + Maske offener Richtungen,
+            Rückweg -1 vor dem ersten Schritt.
+    """
+    table = np.zeros((5 * 256 * 16, 12), dtype=np.int8)
+    for back in range(-1, 4):
+        for byte in range(256):
+            marks = [byte >> 2 * direction & 3 for direction in range(4)]
+            for mask in range(16):
+                ways = [d for d in range(4) if mask >> d & 1 and d != back]
+                others = [d for d in ways if marks[d] < 2]
+                known = any(marks[d] for d in ways)
+                if back >= 0 and (not others or (known and marks[back] == 1)):
+                    # über einen neuen Weg an eine bekannte Kreuzung, oder alles ist zu
+                    options = [back]
+                elif others:
+                    fewest = min(marks[d] for d in others)
+                    options = [d for d in others if marks[d] == fewest]
+                else:
+                    options = ways or [0]
+                table[(back + 1) * 4096 + byte * 16 + mask] = [options[i % len(options)]
+                                                               for i in range(12)]
+    return table
+
+RANDOM_TABLE = random_table()
+WALL_FOLLOWER_TABLE = wall_follower_table()
+MARK_TABLE = mark_table()
+TREMAUX_TABLE = tremaux_table()
+
+def random_walk(sim, agents, open_mask) -> np.ndarray:
+    """
+    random_walk wählt für jeden Agenten zufällig eine der offenen Richtungen.
+
+    Args:
+        sim (Simulation): Die Simulation.
+        agents (ndarray): Nummern der Agenten dieser Strategie.
+        open_mask (ndarray): offene Richtungen jedes Agenten als 4-Bit Maske.
+
+    Returns:
+        ndarray: gewählte Richtung jedes Agenten.
+    """
+    return RANDOM_TABLE[open_mask, sim.rng.integers(0, 12, len(agents), dtype=np.uint8)]
+
+def wall_follower(sim, agents, open_mask) -> np.ndarray:
+    """
+    wall_follower hält die rechte Hand an der Wand: rechts, geradeaus, links, sonst zurück.
+
+    Args:
+        sim (Simulation): Die Simulation.
+        agents (ndarray): Nummern der Agenten dieser Strategie.
+        open_mask (ndarray): offene Richtungen jedes Agenten als 4-Bit Maske.
+
+    Returns:
+        ndarray: gewählte Richtung jedes Agenten.
+    """
+    return WALL_FOLLOWER_TABLE[sim.heading[agents], open_mask]
+
+def tremaux(sim, agents, open_mask) -> np.ndarray:
+    """
+    tremaux markiert an jeder Kreuzung den Durchgang, über den ein Agent ankommt, und den, den
+    er nimmt, und folgt den Regeln von Trémaux: an einer neuen Kreuzung ein zufälliger freier
+    Weg, kommt er über einen neuen Weg an eine bekannte Kreuzung, kehrt er um, sonst nimmt er
+    den Weg mit den wenigsten Markierungen. In Gängen läuft er weiter, in Sackgassen zurück.
+
+    Args:
+        sim (Simulation): Die Simulation.
+        agents (ndarray): Nummern der Agenten dieser Strategie.
+        open_mask (ndarray): offene Richtungen jedes Agenten als 4-Bit Maske.
+
+    Returns:
+        ndarray: gewählte Richtung jedes Agenten.
+    """
+    heading = sim.heading[agents]
+    # außerhalb von Kreuzungen gibt es nur einen Weg nach vorne. Die Tabellen werden flach
+    # indiziert, das ist schneller als mit zwei Index-Arrays
+    choice = WALL_FOLLOWER_TABLE.ravel()[heading * 16 + open_mask]
+    first = sim.steps[agents] == 0
+    if first.any():
+        choice[first] = random_walk(sim, agents[first], open_mask[first])
+    junction = sim.junction[sim.pos[agents]]
+    at = np.flatnonzero(junction >= 0)
+    if not len(at):
+        return choice
+
+    # vor dem ersten Schritt gibt es keinen Weg, über den der Agent gekommen ist
+    back = np.where(first[at], -1, (heading[at].astype(np.int64) + 2) % 4)
+    # ein Byte pro Kreuzung und Agent, mit einem einzigen Index gelesen und geschrieben.
+    # Die Agenten einer Kreuzung liegen nebeneinander, Agenten an denselben Kreuzungen
+    # teilen sich die Speicherseiten
+    flat = sim.marks.reshape(-1)
+    byte = junction[at] * sim.marks.shape[1] + sim.mark_row[agents[at]]
+    marks = MARK_TABLE.ravel()[flat[byte].astype(np.int64) * 5 + back + 1].astype(np.int64)
+    key = (back + 1) * 4096 + marks * 16 + open_mask[at]
+    junction_choice = TREMAUX_TABLE.ravel()[key * 12 + sim.rng.integers(0, 12, len(at))]
+    # der gewählte Durchgang bekommt eine Markierung mehr, höchstens 2
+    flat[byte] = MARK_TABLE.ravel()[marks * 5 + junction_choice + 1]
+    choice[at] = junction_choice
+    return choice
+
+# Name einer Strategie -> Funktion, die für Agenten die nächste Richtung wählt
+POLICIES = {
+        "random": random_walk,
+        "wall-follower": wall_follower,
+        "tremaux": tremaux,
+}
+
+class Simulation:
+    """
+    Class, die Position, Richtung und Statistik vieler Agenten in Arrays hält.
+
+    Attributes:
+        maze (Maze): Das Labyrinth.
+        grid (ndarray): flaches Raster des Labyrinths, > 0 ist eine Wand.
+        stride (int): Länge einer Reihe des Rasters.
+        offsets (ndarray): Verschiebung zur Wand in jede Richtung.
+        open (ndarray): offene Richtungen jedes Raster-Index als 4-Bit Maske.
+        rng (Generator): Zufallsgenerator von NumPy.
+        policy (ndarray): Nummer der Strategie jedes Agenten in policy_names.
+        policy_names ([str]): Namen der benutzten Strategien.
+        pos (ndarray): flacher Raster-Index der Zelle jedes Agenten.
+        heading (ndarray): Richtung des letzten Schritts jedes Agenten.
+        goal (int): flacher Raster-Index der Zielzelle.
+        steps (ndarray): Anzahl der Schritte jedes Agenten.
+        exit_steps (ndarray): Schritte bis zum Ziel, -1 solange es nicht erreicht ist.
+        revisits (ndarray): Anzahl der Schritte in schon besuchte Kreuzungen, mit
+            track_visits in schon besuchte Zellen.
+        blocked (ndarray): Anzahl der Schritte, die an einer Wand gescheitert sind.
+        junction (ndarray): Nummer der Kreuzung jedes Raster-Index, -1 für alle anderen.
+        junctions (int): Anzahl der Kreuzungen.
+        visited (ndarray): ob ein Agent eine Kreuzung schon besucht hat als Bits, eine Reihe
+            pro Kreuzung, mit track_visits eine Reihe pro Zelle.
+        marks (ndarray): Markierungen der Durchgänge für Trémaux-Agenten, 2 Bit pro
+            Richtung, eine Reihe pro Kreuzung und ein Byte pro Agent.
+        mark_row (ndarray): Reihe in marks für jeden Agenten.
+        ticks (int): Anzahl der Schritte der ganzen Simulation.
+        walking (ndarray): Nummern der Agenten, die noch nicht am Ziel sind.
+    """
+    def __init__(self, maze, agents=1000, policy="random", start=(0, 0), goal=None, seed=None,
+                 track_visits=False):
+        """
+        __init__ wird aufgerufen, wenn eine Simulation Initialisiert wird.
+
+        Args:
+            maze (Maze): Das Labyrinth.
+            agents (int): Anzahl der Agenten.
+            policy (str | [str]): Name der Strategie aus POLICIES für alle Agenten
+                oder ein Name pro Agent.
+            start (tuple(int, int)): x und y koordinate der Startzelle aller Agenten.
+            goal (tuple(int, int)): x und y koordinate des Ziels, standardmäßig unten rechts.
+            seed (int): Seed für den Zufallsgenerator, None für einen zufälligen Seed.
+            track_visits (bool): zählt Wiederbesuche in allen Zellen statt nur an Kreuzungen,
+                braucht ein Bit pro Zelle und Agent, bei 10000 Agenten in 500x500 Zellen
+                etwa 312 MB.
+        """
+        names = [policy] * agents if isinstance(policy, str) else list(policy)
+        if len(names) != agents:
+            raise ValueError("Es muss eine Strategie pro Agent angegeben werden")
+        for name in names:
+            if name not in POLICIES:
+                raise ValueError(f"Unbekannte Strategie: {name}")
+
+        self.maze = maze
+        # das Raster wird ohne Kopie übernommen und nur gelesen
+        self.grid = np.asarray(maze.raster_view(), dtype=np.uint8).ravel()
+        self.stride = 2 * maze.grid_width + 1
+        self.offsets = raster_offsets(self.stride)
+        # die offenen Richtungen werden einmal bestimmt, ein Schritt liest nur noch ein Byte
+        self.open = np.zeros(len(self.grid), dtype=np.uint8)
+        inner = np.arange(self.stride, len(self.grid) - self.stride)
+        for direction, offset in enumerate(self.offsets):
+            self.open[inner] |= (self.grid[inner + offset] == 0).astype(np.uint8) << direction
+        self.rng = np.random.default_rng(seed)
+        # nur Zellen sind Kreuzungen, keine Wände oder Durchgänge des Rasters
+        is_junction = np.zeros((2 * maze.grid_height + 1, self.stride), dtype=bool)
+        is_junction[1::2, 1::2] = True
+        is_junction = is_junction.ravel() & (DEGREES[self.open] >= 3)
+        self.junctions = int(is_junction.sum())
+        self.junction = np.full(len(self.grid), -1, dtype=np.int32)
+        self.junction[is_junction] = np.arange(self.junctions, dtype=np.int32)
+
+        self.policy_names = sorted(set(names))
+        self.policy = np.array([self.policy_names.index(name) for name in names], dtype=np.int8)
+        self.pos = np.full(agents, self.cell_to_raster(*start), dtype=np.int64)
+        self.heading = np.zeros(agents, dtype=np.int8)
+        goal = (maze.grid_width - 1, maze.grid_height - 1) if goal is None else goal
+        self.goal = self.cell_to_raster(*goal)
+
+        # Statistik
+        self.steps = np.zeros(agents, dtype=np.int64)
+        self.exit_steps = np.full(agents, -1, dtype=np.int64)
+        self.revisits = np.zeros(agents, dtype=np.int64)
+        self.blocked = np.zeros(agents, dtype=np.int64)
+        self.ticks = 0
+        # Agenten, die schon im Ziel starten, brauchen 0 Schritte
+        self.exit_steps[self.pos == self.goal] = 0
+        self.walking = self.active()
+        self.track_visits = track_visits
+        places = maze.grid_width * maze.grid_height if track_visits else self.junctions
+        self.visited = np.zeros((places, (agents + 7) // 8), dtype=np.uint8)
+        self.mark_visited(np.arange(agents))
+
+        # Markierungen nur für Agenten, die Trémaux benutzen, und nur an Kreuzungen
+        tremaux_agents = np.array([name == "tremaux" for name in names], dtype=bool)
+        self.mark_row = np.cumsum(tremaux_agents) - 1
+        self.marks = np.zeros((self.junctions, int(tremaux_agents.sum())), dtype=np.uint8)
+
+    def cell_to_raster(self, x, y) -> int:
+        """
+        cell_to_raster wandelt x und y einer Zelle in den flachen Raster-Index um.
+
+        Args:
+            x (int): x koordinate der Zelle.
+            y (int): y koordinate der Zelle.
+
+        Returns:
+            int: Index der Zelle im flachen Raster.
+        """
+        if not (0 <= x < self.maze.grid_width and 0 <= y < self.maze.grid_height):
+            raise IndexError("Zelle außerhalb des Labyrinths")
+        return (2 * y + 1) * self.stride + 2 * x + 1
+
+    def cells(self, agents=None) -> np.ndarray:
+        """
+        cells gibt den Index der Zelle in maze.walls für Agenten wieder.
+
+        Args:
+            agents (ndarray): Nummern der Agenten, standardmäßig alle.
+
+        Returns:
+            ndarray: Index y * grid_width + x jeder Zelle.
+        """
+        pos = self.pos if agents is None else self.pos[agents]
+        row, col = np.divmod(pos, self.stride)
+        return (row // 2) * self.maze.grid_width + col // 2
+
+    def mark_visited(self, agents):
+        """
+        mark_visited setzt das Bit der aktuellen Kreuzung oder mit track_visits der aktuellen
+        Zelle von Agenten und zählt Wiederbesuche. Agenten in Gängen werden übersprungen.
+
+        Args:
+            agents (ndarray): Nummern der Agenten, jeder höchstens einmal.
+        """
+        if self.track_visits:
+            places = self.cells(agents)
+        else:
+            places = self.junction[self.pos[agents]]
+            inside = places >= 0
+            agents, places = agents[inside], places[inside]
+        # flacher Index in visited, spart die zweidimensionale Indizierung
+        byte = places * self.visited.shape[1] + (agents >> 3)
+        bit = BITS[agents & 7]
+        flat = self.visited.reshape(-1)
+        self.revisits[agents] += (flat[byte] & bit) > 0
+        # bis zu 8 Agenten teilen sich ein Byte, or.at verliert keine Bits bei gleichen Bytes
+        np.bitwise_or.at(flat, byte, bit)
+
+    def active(self) -> np.ndarray:
+        """
+        active gibt die Nummern der Agenten wieder, die das Ziel noch nicht erreicht haben.
+
+        Returns:
+            ndarray: Nummern der Agenten.
+        """
+        return np.flatnonzero(self.exit_steps < 0)
+
+    def step(self) -> int:
+        """
+        step bewegt alle Agenten, die noch nicht am Ziel sind, um eine Zelle.
+
+        Returns:
+            int: Anzahl der Agenten, die noch unterwegs sind.
+        """
+        agents = self.walking
+        if not len(agents):
+            return 0
+        pos = self.pos[agents]
+        open_mask = self.open[pos]
+
+        if len(self.policy_names) == 1:
+            choice = POLICIES[self.policy_names[0]](self, agents, open_mask)
+        else:
+            choice = np.empty(len(agents), dtype=np.int8)
+            policy = self.policy[agents]
+            for number, name in enumerate(self.policy_names):
+                group = policy == number
+                if group.any():
+                    choice[group] = POLICIES[name](self, agents[group], open_mask[group])
+
+        # Kollision mit den Wänden für alle Agenten auf einmal
+        free = (open_mask >> choice) & 1 == 1
+        moved = agents[free]
+        choice = choice[free]
+        self.pos[moved] += 2 * self.offsets[choice]
+        self.heading[moved] = choice
+        self.steps[moved] += 1
+        self.blocked[agents[~free]] += 1
+        self.mark_visited(moved)
+
+        self.ticks += 1
+        arrived = self.pos[moved] == self.goal
+        if arrived.any():
+            arrived = moved[arrived]
+            self.exit_steps[arrived] = self.steps[arrived]
+            self.walking = self.active()
+        return len(self.walking)
+
+    def run(self, ticks) -> int:
+        """
+        run macht höchstens ticks Schritte, oder weniger, wenn alle Agenten am Ziel sind.
+
+        Args:
+            ticks (int): größte Anzahl an Schritten.
+
+        Returns:
+            int: Anzahl der gemachten Schritte.
+        """
+        start = self.ticks
+        for _ in range(ticks):
+            if not self.step():
+                break
+        return self.ticks - start
+
+    def summary(self) -> dict:
+        """
+        summary fasst die Statistik der Agenten pro Strategie zusammen.
+
+        Returns:
+            dict: Name der Strategie -> Anzahl, am Ziel, mittlere Schritte bis zum Ziel,
+                mittlere Wiederbesuche und blockierte Schritte.
+        """
+        result = {}
+        for number, name in enumerate(self.policy_names):
+            group = self.policy == number
+            arrived = group & (self.exit_steps >= 0)
+            result[name] = {
+                "agents": int(group.sum()),
+                "arrived": int(arrived.sum()),
+                "mean_exit_steps": float(self.exit_steps[arrived].mean()) if arrived.any() else None,
+                "mean_revisits": float(self.revisits[group].mean()),
+                "mean_blocked": float(self.blocked[group].mean()),
+            }
+        return result
+
+def main(argv=None):
+    """
+    main simuliert Agenten in einem neu generierten Labyrinth und gibt die Statistik aus.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.simulate",
+                                     description="Simuliert viele Agenten ohne Fenster.")
+    parser.add_argument("--maze", type=int, nargs=2, default=(50, 50), metavar=("X", "Y"))
+    parser.add_argument("--algorithm", choices=GENERATORS, default="dfs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--policy", choices=POLICIES, nargs="+", default=["random"],
+                        help="mehrere Strategien werden gleichmäßig auf die Agenten verteilt")
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--visits", action="store_true",
+                        help="zählt Wiederbesuche in allen Zellen statt nur an Kreuzungen, "
+                             "braucht ein Bit pro Zelle und Agent")
+    args = parser.parse_args(argv)
+
+    maze = Maze(*args.maze)
+    maze.generate(args.algorithm, args.seed)
+    policies = [args.policy[i % len(args.policy)] for i in range(args.agents)]
+    sim = Simulation(maze, args.agents, policies, seed=args.seed,
+                     track_visits=args.visits)
+
+    start = time.perf_counter()
+    ticks = sim.run(args.ticks)
+    elapsed = time.perf_counter() - start
+    print(f"{ticks} Schritte mit {args.agents} Agenten in {elapsed:.2f} s "
+          f"({ticks / elapsed:.0f} Schritte/s)")
+    for name, stats in sim.summary().items():
+        print(f"{name:<14} {stats}")
+
+if __name__ == "__main__":
+    main()
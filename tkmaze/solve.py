@@ -0,0 +1,258 @@
+"""src/solve.py
+
+Enthält die Solver Class, die ein Labyrinth mit BFS, A* oder Sackgassen-Füllen löst.
+
+Alle Algorithmen arbeiten direkt auf den Wand-Masken in maze.walls mit dem Index
+y * grid_width + x, ohne Cell Objekte zu erzeugen.
+"""
+
+import heapq
+from array import array
+from collections import OrderedDict
+from .cell import NORTH, SOUTH, EAST, WEST
+
+# Wand-Maske -> Anzahl offener Seiten, als Tabelle für bytes.translate
+OPEN_SIDES = bytes(max(4 - bin(mask).count("1"), 0) for mask in range(256))
+
+class Solver:
+    """
+    Class, die Wege durch ein Labyrinth findet und Distanz-Felder zwischenspeichert.
+
+    Attributes:
+        maze (Maze): Das Labyrinth.
+        cache_size (int): Anzahl der Distanz-Felder, die zwischengespeichert werden.
+        fields (OrderedDict): Distanz-Felder nach Index der Quell-Zelle.
+        revision (int): maze.revision, zu der die Distanz-Felder berechnet wurden.
+    """
+    def __init__(self, maze, cache_size=8):
+        """
+        __init__ wird aufgerufen, wenn ein Solver Initialisiert wird.
+
+        Args:
+            maze (Maze): Das Labyrinth.
+            cache_size (int): Anzahl der Distanz-Felder, die zwischengespeichert werden.
+        """
+        self.maze = maze
+        self.cache_size = cache_size
+        self.fields = OrderedDict()
+        self.revision = maze.revision
+        # Wand-Masken mit geschlossenem Rand, einmal pro maze.revision gebaut
+        self._walls = None
+        self._walls_revision = -1
+
+    def index(self, cell_index) -> int:
+        """
+        index wandelt x und y einer Zelle in den Index in maze.walls um.
+
+        Args:
+            cell_index (tuple(int, int)): x und y koordinate einer Zelle im Labyrinth.
+
+        Returns:
+            int: Index der Zelle.
+        """
+        x, y = cell_index
+        if not (0 <= x < self.maze.grid_width and 0 <= y < self.maze.grid_height):
+            raise IndexError("Zelle außerhalb des Labyrinths")
+        return y * self.maze.grid_width + x
+
+    def position(self, index) -> tuple[int, int]:
+        """
+        position wandelt einen Index in maze.walls in x und y einer Zelle um.
+
+        Args:
+            index (int): Index der Zelle.
+
+        Returns:
+            tuple(int, int): x und y koordinate der Zelle.
+        """
+        return index % self.maze.grid_width, index // self.maze.grid_width
+
+    def walls(self):
+        """
+        walls gibt die Wand-Masken als schnell indizierbares bytearray wieder.
+
+        Die Außenwände sind immer gesetzt, damit kein Schritt das Labyrinth verlässt. Das
+        bytearray wird nur neu gebaut, wenn sich maze.revision ändert.
+
+        Returns:
+            bytearray: 4-Bit Wand-Maske jeder Zelle.
+        """
+        if self._walls is None or self._walls_revision != self.maze.revision:
+            self._walls = self.maze.closed_walls()
+            self._walls_revision = self.maze.revision
+        return self._walls
+
+    def distances(self, source=(0, 0)) -> array:
+        """
+        distances berechnet mit BFS die Distanz jeder Zelle zu einer Quell-Zelle.
+
+        Args:
+            source (tuple(int, int)): x und y koordinate der Quell-Zelle.
+
+        Returns:
+            array: Distanz jeder Zelle in Schritten, -1 für unerreichbare Zellen.
+        """
+        if self.revision != self.maze.revision:
+            # das Labyrinth hat sich geändert, alle Distanz-Felder sind veraltet
+            self.fields.clear()
+            self.revision = self.maze.revision
+        start = self.index(source)
+        field = self.fields.get(start)
+        if field is not None:
+            self.fields.move_to_end(start)
+            return field
+
+        width = self.maze.grid_width
+        walls = self.walls()
+        field = array("i", [-1]) * len(walls)
+        field[start] = 0
+        queue = [start]
+        # die Queue wird nur gelesen, nicht verkürzt, damit pop(0) nicht O(n) kostet
+        for current in queue:
+            mask = walls[current]
+            next_dist = field[current] + 1
+            if not mask & NORTH and field[current - width] < 0:
+                field[current - width] = next_dist
+                queue.append(current - width)
+            if not mask & SOUTH and field[current + width] < 0:
+                field[current + width] = next_dist
+                queue.append(current + width)
+            if not mask & EAST and field[current + 1] < 0:
+                field[current + 1] = next_dist
+                queue.append(current + 1)
+            if not mask & WEST and field[current - 1] < 0:
+                field[current - 1] = next_dist
+                queue.append(current - 1)
+
+        self.fields[start] = field
+        if len(self.fields) > self.cache_size:
+            self.fields.popitem(last=False)
+        return field
+
+    def exit(self) -> tuple[int, int]:
+        """
+        exit gibt die Endzelle unten rechts wieder, in list(maze) mit 3 markiert.
+
+        Returns:
+            tuple(int, int): x und y koordinate der Endzelle.
+        """
+        return self.maze.grid_width - 1, self.maze.grid_height - 1
+
+    def path(self, start=(0, 0), goal=None) -> list[tuple[int, int]]:
+        """
+        path findet mit dem Distanz-Feld der Startzelle den kürzesten Weg zum Ziel.
+
+        Passen die Wände zweier Zellen nicht zusammen, kann es auf dem Rückweg keinen näheren
+        Nachbarn geben, dann wird ein ValueError ausgelöst.
+
+        Args:
+            start (tuple(int, int)): x und y koordinate der Startzelle, in list(maze) mit 2 markiert.
+            goal (tuple(int, int)): x und y koordinate des Ziels, standardmäßig die Endzelle.
+
+        Returns:
+            [tuple(int, int)]: Zellen des Weges vom Start zum Ziel, leer wenn es keinen gibt.
+        """
+        goal = self.exit() if goal is None else goal
+        field = self.distances(start)
+        current = self.index(goal)
+        if field[current] < 0:
+            return []
+
+        width = self.maze.grid_width
+        walls = self.walls()
+        path = [current]
+        # läuft vom Ziel immer zu einem Nachbarn, der einen Schritt näher am Start ist
+        while field[current]:
+            mask = walls[current]
+            closer = field[current] - 1
+            for bit, offset in ((NORTH, -width), (SOUTH, width), (EAST, 1), (WEST, -1)):
+                if not mask & bit and field[current + offset] == closer:
+                    current += offset
+                    break
+            else:
+                raise ValueError("Kein Nachbar ist näher am Start, die Wände passen nicht zusammen")
+            path.append(current)
+        path.reverse()
+        return [self.position(index) for index in path]
+
+    def astar(self, start=(0, 0), goal=None) -> list[tuple[int, int]]:
+        """
+        astar findet mit A* und der Manhattan-Distanz den kürzesten Weg zum Ziel.
+
+        Args:
+            start (tuple(int, int)): x und y koordinate der Startzelle.
+            goal (tuple(int, int)): x und y koordinate des Ziels, standardmäßig die Endzelle.
+
+        Returns:
+            [tuple(int, int)]: Zellen des Weges vom Start zum Ziel, leer wenn es keinen gibt.
+        """
+        goal = self.exit() if goal is None else goal
+        width = self.maze.grid_width
+        walls = self.walls()
+        begin, end = self.index(start), self.index(goal)
+        goal_x, goal_y = goal
+
+        cost = array("i", [-1]) * len(walls)
+        came_from = array("i", [-1]) * len(walls)
+        cost[begin] = 0
+        heap = [(abs(goal_x - start[0]) + abs(goal_y - start[1]), 0, begin)]
+        while heap:
+            _, current_cost, current = heapq.heappop(heap)
+            if current == end:
+                break
+            if current_cost > cost[current]:
+                continue # veralteter Eintrag
+            mask = walls[current]
+            for bit, offset in ((NORTH, -width), (SOUTH, width), (EAST, 1), (WEST, -1)):
+                if mask & bit:
+                    continue
+                nb = current + offset
+                nb_cost = current_cost + 1
+                if 0 <= cost[nb] <= nb_cost:
+                    continue
+                cost[nb] = nb_cost
+                came_from[nb] = current
+                estimate = abs(goal_x - nb % width) + abs(goal_y - nb // width)
+                heapq.heappush(heap, (nb_cost + estimate, nb_cost, nb))
+        else:
+            return []
+
+        path = [end]
+        while path[-1] != begin:
+            path.append(came_from[path[-1]])
+        path.reverse()
+        return [self.position(index) for index in path]
+
+    def dead_end_fill(self, start=(0, 0), goal=None) -> bytearray:
+        """
+        dead_end_fill füllt alle Sackgassen auf, bis nur noch Wege zwischen Start und Ziel offen sind.
+
+        Args:
+            start (tuple(int, int)): x und y koordinate der Startzelle.
+            goal (tuple(int, int)): x und y koordinate des Ziels, standardmäßig die Endzelle.
+
+        Returns:
+            bytearray: 1 für jede Zelle, die nicht aufgefüllt wurde, sonst 0.
+        """
+        goal = self.exit() if goal is None else goal
+        width = self.maze.grid_width
+        walls = self.walls()
+        keep = (self.index(start), self.index(goal))
+        offsets = ((NORTH, -width), (SOUTH, width), (EAST, 1), (WEST, -1))
+
+        # Anzahl offener Wände jeder Zelle
+        degree = bytearray(walls).translate(OPEN_SIDES)
+        open_cells = bytearray(b"\x01") * len(walls)
+        stack = [index for index, count in enumerate(degree) if count <= 1 and index not in keep]
+        while stack:
+            current = stack.pop()
+            open_cells[current] = 0
+            mask = walls[current]
+            for bit, offset in offsets:
+                nb = current + offset
+                if mask & bit or not open_cells[nb]:
+                    continue
+                degree[nb] -= 1
+                if degree[nb] == 1 and nb not in keep:
+                    stack.append(nb)
+        return open_cells
@@ -0,0 +1,264 @@
+"""src/storage.py
+
+Enthält das binäre Dateiformat (.tkmz), mit dem ein Labyrinth gespeichert und geladen wird.
+
+Aufbau einer Datei:
+    Kopf (42 Bytes): b"TKMZ", Version, Länge des Kopfes, grid_width, grid_height, Flags,
+                     Seed (nur gültig mit FLAG_SEED) und Name des Algorithmus (16 Bytes).
+    Wände: 4-Bit Wand-Masken, 2 Zellen pro Byte, die Zelle mit geradem Index im unteren Nibble.
+"""
+
+import mmap
+import struct
+from .maze import Maze
+
+MAGIC = b"TKMZ"
+VERSION = 2
+PREFIX = struct.Struct("<4sHH")
+HEADER = struct.Struct("<4sHHIIHq16s")
+
+# Version -> Aufbau des Kopfes, Version 1 hatte keine Flags und -1 als unbekannten Seed
+HEADERS = {
+    1: struct.Struct("<4sHHIIq16s"),
+    2: HEADER,
+}
+
+# Flag im Kopf: der Seed ist bekannt
+FLAG_SEED = 1
+
+# der Seed wird als 64-Bit Zahl mit Vorzeichen gespeichert
+SEED_MIN = -(1 << 63)
+SEED_MAX = (1 << 63) - 1
+
+# Übersetzungs-Tabellen um Nibbles mit bytes.translate zu trennen und zu verschieben
+LOW_NIBBLE = bytes(b & 0x0F for b in range(256))
+HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+SHIFT_NIBBLE = bytes((b & 0x0F) << 4 for b in range(256))
+
+# Anzahl Zellen, die beim Speichern auf einmal gepackt werden (gerade Zahl)
+CHUNK_CELLS = 1 << 20
+
+def pack_nibbles(walls) -> bytes:
+    """
+    pack_nibbles packt je 2 Wand-Masken in ein Byte.
+
+    Args:
+        walls (bytes): eine Wand-Maske pro Byte.
+
+    Returns:
+        bytes: 2 Wand-Masken pro Byte.
+    """
+    low = bytes(walls[0::2])
+    high = bytes(walls[1::2]).translate(SHIFT_NIBBLE).ljust(len(low), b"\x00")
+    # die Nibbles überschneiden sich nicht, also reicht ein bitweises Oder der ganzen Folge
+    packed = int.from_bytes(low, "little") | int.from_bytes(high, "little")
+    return packed.to_bytes(len(low), "little")
+
+def unpack_nibbles(packed, count) -> bytearray:
+    """
+    unpack_nibbles entpackt 2 Wand-Masken pro Byte in eine Wand-Maske pro Byte.
+
+    Args:
+        packed (bytes): 2 Wand-Masken pro Byte.
+        count (int): Anzahl der Wand-Masken.
+
+    Returns:
+        bytearray: eine Wand-Maske pro Byte.
+    """
+    packed = bytes(packed)
+    walls = bytearray(2 * len(packed))
+    walls[0::2] = packed.translate(LOW_NIBBLE)
+    walls[1::2] = packed.translate(HIGH_NIBBLE)
+    del walls[count:]
+    return walls
+
+class NibbleArray:
+    """
+    Class, die gepackte Wand-Masken in einem Puffer (z.B. einer mmap) wie ein bytearray liest.
+
+    Attributes:
+        buffer (mmap): Puffer mit 2 Wand-Masken pro Byte.
+        offset (int): Position der ersten Wand-Maske im Puffer.
+        count (int): Anzahl der Wand-Masken.
+    """
+    def __init__(self, buffer, offset, count):
+        """
+        __init__ wird aufgerufen, wenn eine NibbleArray Initialisiert wird.
+
+        Args:
+            buffer (mmap): Puffer mit 2 Wand-Masken pro Byte.
+            offset (int): Position der ersten Wand-Maske im Puffer.
+            count (int): Anzahl der Wand-Masken.
+        """
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step != 1:
+                return bytearray(self[i] for i in range(start, stop, step))
+            if stop <= start:
+                return bytearray()
+            # entpackt nur die Bytes, in denen der Bereich liegt
+            first = start // 2
+            packed = self.buffer[self.offset + first:self.offset + (stop + 1) // 2]
+            walls = unpack_nibbles(packed, 2 * len(packed))
+            return walls[start - 2 * first:stop - 2 * first]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Zelle außerhalb des Labyrinths")
+        byte = self.buffer[self.offset + index // 2]
+        return byte >> 4 if index % 2 else byte & 0x0F
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            indices = range(start, stop, step)
+            if len(value) != len(indices):
+                raise ValueError("Die Anzahl der Wand-Masken einer NibbleArray ist fest")
+            if step != 1:
+                for i, mask in zip(indices, value):
+                    self[i] = mask
+                return
+            if stop <= start:
+                return
+            # halbe Bytes am Rand einzeln, dazwischen ganze Bytes gepackt
+            value = bytes(value).translate(LOW_NIBBLE)
+            if start % 2:
+                self[start] = value[0]
+                start += 1
+                value = value[1:]
+            if (stop - start) % 2:
+                self[stop - 1] = value[-1]
+                stop -= 1
+                value = value[:-1]
+            position = self.offset + start // 2
+            self.buffer[position:position + len(value) // 2] = pack_nibbles(value)
+            return
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Zelle außerhalb des Labyrinths")
+        position = self.offset + index // 2
+        byte = self.buffer[position]
+        if index % 2:
+            self.buffer[position] = (byte & 0x0F) | ((value & 0x0F) << 4)
+        else:
+            self.buffer[position] = (byte & 0xF0) | (value & 0x0F)
+
+    def __iter__(self):
+        for start in range(0, self.count, CHUNK_CELLS):
+            yield from self[start:start + CHUNK_CELLS]
+
+def check_seed(seed):
+    """
+    check_seed prüft, ob ein Seed in den Kopf einer .tkmz Datei passt.
+
+    Args:
+        seed (int): Seed oder None, wenn er unbekannt ist.
+    """
+    if seed is not None and not SEED_MIN <= seed <= SEED_MAX:
+        raise ValueError(f"Seed muss zwischen {SEED_MIN} und {SEED_MAX} liegen")
+
+def write(maze, file):
+    """
+    write schreibt ein Labyrinth im .tkmz Format in eine geöffnete Datei.
+
+    Args:
+        maze (Maze): Das Labyrinth.
+        file (file): im Binärmodus geöffnete Datei oder io.BytesIO.
+    """
+    check_seed(maze.seed)
+    algorithm = (maze.algorithm or "").encode("ascii")
+    flags = 0 if maze.seed is None else FLAG_SEED
+    header = HEADER.pack(MAGIC, VERSION, HEADER.size, maze.grid_width, maze.grid_height,
+                         flags, maze.seed or 0, algorithm)
+    count = maze.grid_width * maze.grid_height
+    file.write(header)
+    for start in range(0, count, CHUNK_CELLS):
+        file.write(pack_nibbles(maze.walls[start:start + CHUNK_CELLS]))
+
+def save(maze, path):
+    """
+    save speichert ein Labyrinth im .tkmz Format.
+
+    Args:
+        maze (Maze): Das Labyrinth.
+        path (str): Pfad der Datei.
+    """
+    with open(path, "wb") as file:
+        write(maze, file)
+
+def read_header(file) -> tuple[int, int, int, str, int]:
+    """
+    read_header liest den Kopf einer .tkmz Datei.
+
+    Args:
+        file (file): im Binärmodus geöffnete Datei.
+
+    Returns:
+        tuple(int, int, int, str, int): grid_width, grid_height, Seed, Algorithmus
+        und Position der ersten Wand-Maske.
+    """
+    data = file.read(PREFIX.size)
+    if len(data) < PREFIX.size:
+        raise ValueError("Datei ist zu kurz für ein .tkmz Labyrinth")
+    magic, version, header_size = PREFIX.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("Datei ist kein .tkmz Labyrinth")
+    if version not in HEADERS:
+        raise ValueError(f"Version {version} wird nicht unterstützt")
+    header = HEADERS[version]
+    data += file.read(header.size - PREFIX.size)
+    if len(data) < header.size:
+        raise ValueError("Datei ist zu kurz für ein .tkmz Labyrinth")
+    match version:
+        case 1:
+            _, _, _, width, height, seed, algorithm = header.unpack(data)
+            flags = 0 if seed < 0 else FLAG_SEED
+        case _:
+            _, _, _, width, height, flags, seed, algorithm = header.unpack(data)
+    algorithm = algorithm.rstrip(b"\x00").decode("ascii") or None
+    return width, height, seed if flags & FLAG_SEED else None, algorithm, header_size
+
+def load(path, use_mmap=True) -> Maze:
+    """
+    load lädt ein Labyrinth aus einer .tkmz Datei.
+
+    Mit use_mmap werden die Wände nicht eingelesen, sondern direkt aus der Datei gelesen,
+    wenn sie gebraucht werden. Änderungen am Labyrinth werden nicht in die Datei geschrieben.
+
+    Args:
+        path (str): Pfad der Datei.
+        use_mmap (bool): True, um die Datei mit mmap zu öffnen, sonst wird sie ganz eingelesen.
+
+    Returns:
+        Maze: Das Labyrinth.
+    """
+    with open(path, "rb") as file:
+        width, height, seed, algorithm, offset = read_header(file)
+        count = width * height
+        size = offset + (count + 1) // 2
+        if use_mmap and count:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+            if len(buffer) < size:
+                raise ValueError("Datei ist unvollständig")
+            walls = NibbleArray(buffer, offset, count)
+        else:
+            file.seek(offset)
+            packed = file.read(size - offset)
+            if len(packed) < size - offset:
+                raise ValueError("Datei ist unvollständig")
+            walls = unpack_nibbles(packed, count)
+
+    # gespeicherte Labyrinthe sind fertig generiert, alle Zellen gelten als besucht
+    maze = Maze(width, height, walls, visited=True)
+    maze.seed = seed
+    maze.algorithm = algorithm
+    return maze
@@ -0,0 +1,171 @@
+"""src/stream.py
+
+Enthält die Erzeugung von Labyrinthen Reihe für Reihe mit Ellers Algorithmus.
+
+Es wird immer nur die aktuelle Reihe im Speicher gehalten, deshalb können auch Labyrinthe
+mit Millionen von Reihen direkt in eine Datei oder Pipe geschrieben werden.
+`python3 -m tkmaze.stream 20 1000000 > labyrinth.txt`
+"""
+
+import argparse
+import random
+import sys
+from .cell import NORTH, SOUTH, EAST, WEST, ALL_WALLS
+
+def generate_eller(grid_width, grid_height, rng=random):
+    """
+    generate_eller generiert ein (zufälliges) Labyrinth Reihe für Reihe mit Ellers Algorithmus.
+
+    Args:
+        grid_width (int): länge des Labyrinths in Zellen.
+        grid_height (int): höhe des Labyrinths in Zellen.
+        rng (Random): Zufallsgenerator, standardmäßig das random Modul.
+
+    Yields:
+        bytearray: 4-Bit Wand-Masken der Zellen einer Reihe, von oben nach unten.
+    """
+    # Menge jeder Zelle der aktuellen Reihe und Zellen jeder Menge
+    sets = list(range(grid_width))
+    members = {x: [x] for x in range(grid_width)}
+    next_set = grid_width
+    # Zellen, deren Wand nach oben offen ist
+    open_north = [False] * grid_width
+
+    for y in range(grid_height):
+        last_row = y == grid_height - 1
+        row = bytearray([ALL_WALLS]) * grid_width
+        for x in range(grid_width):
+            if open_north[x]:
+                row[x] &= ~NORTH
+
+        # verbindet zufällig benachbarte Zellen aus verschiedenen Mengen,
+        # in der letzten Reihe müssen alle Mengen verbunden werden
+        for x in range(grid_width - 1):
+            left, right = sets[x], sets[x + 1]
+            if left == right or not (last_row or rng.random() < 0.5):
+                continue
+            row[x] &= ~EAST
+            row[x + 1] &= ~WEST
+            # die kleinere Menge geht in der größeren auf
+            if len(members[left]) < len(members[right]):
+                left, right = right, left
+            for member in members[right]:
+                sets[member] = left
+            members[left].extend(members.pop(right))
+
+        if last_row:
+            yield row
+            break
+
+        # jede Menge bekommt mindestens einen Durchgang nach unten
+        open_north = [False] * grid_width
+        for cells in members.values():
+            forced = rng.choice(cells)
+            for x in cells:
+                if x == forced or rng.random() < 0.5:
+                    open_north[x] = True
+                    row[x] &= ~SOUTH
+        yield row
+
+        # Zellen ohne Durchgang nach oben kommen in neue Mengen
+        members = {}
+        for x in range(grid_width):
+            if not open_north[x]:
+                sets[x] = next_set
+                next_set += 1
+            members.setdefault(sets[x], []).append(x)
+
+def ascii_lines(rows, grid_width):
+    """
+    ascii_lines wandelt Reihen von Wand-Masken in Zeilen des ASCII-Bildes um, wie Maze.__str__.
+
+    Args:
+        rows (iterable(bytearray)): Wand-Masken jeder Reihe.
+        grid_width (int): länge des Labyrinths in Zellen.
+
+    Yields:
+        str: eine Zeile des ASCII-Bildes, mit Zeilenumbruch.
+    """
+    for row in rows:
+        # obere Wände, Ecken sind +
+        yield "".join(["+---" if walls & NORTH else "+   " for walls in row]) + "+\n"
+        # linke Wand und Zelle selbst, Wand ganz rechts
+        yield "".join(["|   " if walls & WEST else "    " for walls in row]) + "|\n"
+    # untere Wand für die Letzte Reihe
+    yield "+---" * grid_width + "+\n"
+
+def grid_lines(rows, grid_width):
+    """
+    grid_lines wandelt Reihen von Wand-Masken in Reihen von Zahlen um, wie Maze.__iter__.
+
+    Args:
+        rows (iterable(bytearray)): Wand-Masken jeder Reihe.
+        grid_width (int): länge des Labyrinths in Zellen.
+
+    Yields:
+        [int]: eine Reihe des Labyrinths als Zahlen, 2 ist der Start und 3 das Ende.
+    """
+    previous = None
+    first = True
+    for row in rows:
+        if previous is not None:
+            yield from _grid_pair(previous, first, False)
+            first = False
+        previous = row
+    if previous is not None:
+        yield from _grid_pair(previous, first, True)
+    # untere Wand für die Letzte Reihe
+    yield [1] * (2 * grid_width + 1)
+
+def _grid_pair(row, first, last):
+    """
+    _grid_pair gibt die obere Wand-Reihe und die Zellen-Reihe einer Reihe von Wand-Masken wieder.
+
+    Args:
+        row (bytearray): Wand-Masken der Reihe.
+        first (bool): ob es die erste Reihe ist, dort liegt der Start.
+        last (bool): ob es die letzte Reihe ist, dort liegt das Ende.
+
+    Yields:
+        [int]: obere Wand-Reihe, dann Zellen-Reihe.
+    """
+    top_line = [1]
+    mid_line = []
+    for walls in row:
+        top_line.append(1 if walls & NORTH else 0)
+        top_line.append(1) # Ecken sind immer 1
+        mid_line.append(1 if walls & WEST else 0)
+        mid_line.append(0)
+    mid_line.append(1)
+    # startzelle = 2 oben links, endzelle = 3 unten rechts
+    if first:
+        mid_line[1] = 2
+    if last:
+        mid_line[-2] = 3
+    yield top_line
+    yield mid_line
+
+def main(argv=None):
+    """
+    main schreibt ein mit Ellers Algorithmus generiertes Labyrinth auf stdout.
+
+    Args:
+        argv ([str]): Kommandozeilen-Argumente, standardmäßig sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python3 -m tkmaze.stream",
+                                     description="Generiert ein Labyrinth Reihe für Reihe.")
+    parser.add_argument("width", type=int, help="länge des Labyrinths in Zellen")
+    parser.add_argument("height", type=int, help="höhe des Labyrinths in Zellen")
+    parser.add_argument("--format", choices=("ascii", "grid"), default="ascii")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    rows = generate_eller(args.width, args.height, random.Random(args.seed))
+    if args.format == "ascii":
+        sys.stdout.writelines(ascii_lines(rows, args.width))
+    else:
+        for line in grid_lines(rows, args.width):
+            sys.stdout.write(f"{line}\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""src/world.py
+
+Enthält die ChunkedWorld Class, eine unendliche Welt aus kleinen Labyrinth-Kacheln.
+
+Jede Kachel (Chunk) ist ein eigenes Labyrinth mit chunk_size * chunk_size Zellen und wird
+erst erzeugt, wenn sie gebraucht wird. Der Seed einer Kachel hängt nur vom Seed der Welt
+und ihrer Position ab, deshalb sieht eine Kachel immer gleich aus, auch wenn sie aus dem
+Zwischenspeicher entfernt und später neu erzeugt wurde.
+
+Eine Kachel besitzt ihre Nord- und West-Wand, in denen je eine Öffnung liegt. Dadurch ist
+jede Kachel mit ihren vier Nachbarn verbunden und die ganze Welt zusammenhängend.
+"""
+
+import math
+import random
+from collections import OrderedDict
+from .cell import SOUTH, EAST
+from .maze import Maze, GENERATORS
+
+class WorldRow:
+    """
+    Class, die eine Reihe der Welt darstellt, damit world[row][col] wie bei map_data funktioniert.
+
+    Attributes:
+        world (ChunkedWorld): Die Welt.
+        row (int): Index der Reihe, darf negativ sein.
+    """
+    __slots__ = ("world", "row")
+
+    def __init__(self, world, row):
+        self.world = world
+        self.row = row
+
+    def __getitem__(self, col) -> int:
+        return self.world.get(self.row, col)
+
+class ChunkedWorld:
+    """
+    Class, die eine unendliche Welt aus Labyrinth-Kacheln mit einem LRU Zwischenspeicher darstellt.
+
+    Die Welt wird wie map_data mit world[row][col] gelesen, Zelle x, y einer Kachel liegt
+    wie im Labyrinth bei Reihe 2y+1 und Spalte 2x+1 der Kachel. Reihe und Spalte dürfen
+    beliebig groß oder negativ sein.
+
+    Attributes:
+        chunk_size (int): Länge und Höhe einer Kachel in Zellen.
+        span (int): Länge und Höhe einer Kachel in map_data Feldern (2 * chunk_size).
+        seed (int): Seed der Welt.
+        algorithm (str): Name des Algorithmus aus GENERATORS für die Kacheln.
+        cache_size (int): Anzahl der Kacheln, die zwischengespeichert werden.
+        chunks (OrderedDict): zuletzt benutzte Kacheln, nach (cx, cy).
+        chunks_generated (int): Anzahl erzeugter Kacheln, auch wiederholt erzeugter.
+        blocking (bool): erzeugt fehlende Kacheln beim Lesen, sonst gelten sie als Wand.
+        missing (set): Kacheln, die ohne blocking gelesen wurden und noch fehlen.
+    """
+    def __init__(self, chunk_size=8, seed=0, cache_size=64, algorithm="dfs"):
+        """
+        __init__ wird aufgerufen, wenn eine ChunkedWorld Initialisiert wird.
+
+        Args:
+            chunk_size (int): Länge und Höhe einer Kachel in Zellen.
+            seed (int): Seed der Welt.
+            cache_size (int): Anzahl der Kacheln, die zwischengespeichert werden.
+            algorithm (str): Name des Algorithmus aus GENERATORS für die Kacheln.
+        """
+        if chunk_size < 1:
+            raise ValueError("Eine Kachel braucht mindestens eine Zelle")
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unbekannter Algorithmus: {algorithm}")
+        # ein Strahl braucht die Kachel, in der er startet und die, in die er schaut
+        if cache_size < 9:
+            raise ValueError("Der Zwischenspeicher braucht Platz für mindestens 9 Kacheln")
+        self.chunk_size = chunk_size
+        self.span = 2 * chunk_size
+        self.seed = seed
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self.chunks = OrderedDict()
+        self.chunks_generated = 0
+        self.blocking = True
+        self.missing = set()
+        self._last_key = None
+        self._last_chunk = None
+
+    def __getitem__(self, row) -> WorldRow:
+        return WorldRow(self, row)
+
+    def get(self, row, col) -> int:
+        """
+        get gibt den Wert von map_data an einer Position der Welt wieder.
+
+        Ohne blocking ist eine fehlende Kachel eine Wand und wird für prefetch vorgemerkt,
+        damit ein Bild nie auf das Erzeugen einer Kachel warten muss.
+
+        Args:
+            row (int): Reihe in der Welt.
+            col (int): Spalte in der Welt.
+
+        Returns:
+            int: 1 für eine Wand, 0 für einen Gang.
+        """
+        cy, r = divmod(row, self.span)
+        cx, c = divmod(col, self.span)
+        # Strahlen bleiben meistens in einer Kachel, deshalb wird die letzte gemerkt
+        if (cx, cy) == self._last_key:
+            return self._last_chunk[r][c]
+        if not self.blocking and (cx, cy) not in self.chunks:
+            self.missing.add((cx, cy))
+            return 1
+        return self.chunk(cx, cy)[r][c]
+
+    def chunk_seed(self, cx, cy) -> int:
+        """
+        chunk_seed bestimmt den Seed einer Kachel aus dem Seed der Welt und ihrer Position.
+
+        Args:
+            cx (int): x Position der Kachel.
+            cy (int): y Position der Kachel.
+
+        Returns:
+            int: Seed der Kachel.
+        """
+        # ein String-Seed ist in jeder Python Version und jedem Prozess gleich
+        return random.Random(f"{self.seed}:{cx}:{cy}").getrandbits(63)
+
+    def chunk(self, cx, cy) -> list[bytearray]:
+        """
+        chunk gibt eine Kachel aus dem Zwischenspeicher wieder und erzeugt sie, falls nötig.
+
+        Args:
+            cx (int): x Position der Kachel.
+            cy (int): y Position der Kachel.
+
+        Returns:
+            [bytearray]: span Reihen mit span Feldern, 1 für eine Wand, 0 für einen Gang.
+        """
+        key = (cx, cy)
+        tile = self.chunks.get(key)
+        if tile is None:
+            tile = self.build_chunk(cx, cy)
+            self.chunks[key] = tile
+            if len(self.chunks) > self.cache_size:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        self._last_key = key
+        self._last_chunk = tile
+        return tile
+
+    def build_chunk(self, cx, cy) -> list[bytearray]:
+        """
+        build_chunk generiert eine Kachel und wandelt sie in Reihen von map_data um.
+
+        Die Kachel enthält ihre Nord-Wand (Reihe 0) und West-Wand (Spalte 0) mit je einer
+        Öffnung, die Süd- und Ost-Wand gehören der nächsten Kachel.
+
+        Args:
+            cx (int): x Position der Kachel.
+            cy (int): y Position der Kachel.
+
+        Returns:
+            [bytearray]: span Reihen mit span Feldern, 1 für eine Wand, 0 für einen Gang.
+        """
+        size = self.chunk_size
+        rng = random.Random(self.chunk_seed(cx, cy))
+        maze = Maze(size, size)
+        GENERATORS[self.algorithm](maze, rng)
+        maze.seed = None
+        maze.algorithm = self.algorithm
+        self.chunks_generated += 1
+
+        north_opening = rng.randrange(size)
+        west_opening = rng.randrange(size)
+        walls = maze.walls
+
+        # Reihe 0: Nord-Wand mit einer Öffnung
+        tile = [bytearray(b"\x01" * self.span)]
+        tile[0][2 * north_opening + 1] = 0
+        for y in range(size):
+            # Reihe der Zellen: West-Wand, dann abwechselnd Zelle und Ost-Wand
+            cells = bytearray(b"\x01" * self.span)
+            cells[0] = 0 if y == west_opening else 1
+            # Reihe darunter: Säulen und Süd-Wände
+            south = bytearray(b"\x01" * self.span)
+            for x in range(size):
+                mask = walls[y * size + x]
+                cells[2 * x + 1] = 0
+                if x < size - 1 and not mask & EAST:
+                    cells[2 * x + 2] = 0
+                if not mask & SOUTH:
+                    south[2 * x + 1] = 0
+            tile.append(cells)
+            # die Süd-Wand der letzten Reihe ist die Nord-Wand der nächsten Kachel
+            if y < size - 1:
+                tile.append(south)
+        return tile
+
+    def prefetch(self, pos, radius=1, budget=2) -> int:
+        """
+        prefetch erzeugt fehlende Kacheln um eine Position, damit sie beim nächsten Bild bereit sind.
+
+        Wird zwischen zwei Bildern aufgerufen. Zuerst werden die Kacheln aus missing erzeugt,
+        die im letzten Bild gefehlt haben, dann die Kacheln im radius um die Position. Es werden
+        höchstens budget Kacheln erzeugt, damit ein einzelner Aufruf nie lange dauert, der Rest
+        folgt beim nächsten Aufruf.
+
+        Args:
+            pos ([float]): Reihe und Spalte der Position in der Welt.
+            radius (int): Anzahl der Kacheln in jede Richtung um die Kachel der Position,
+                siehe view_radius.
+            budget (int): Anzahl der Kacheln, die höchstens erzeugt werden.
+
+        Returns:
+            int: Anzahl der erzeugten Kacheln.
+        """
+        cy = math.floor(pos[0]) // self.span
+        cx = math.floor(pos[1]) // self.span
+        built = 0
+        # die im letzten Bild fehlenden Kacheln zuerst, die nächsten davon vorne
+        for key in sorted(self.missing, key=lambda key: abs(key[0] - cx) + abs(key[1] - cy)):
+            if built >= budget:
+                break
+            self.missing.discard(key)
+            if key not in self.chunks:
+                self.chunk(*key)
+                built += 1
+        # die eigene Kachel zuerst, dann nach Abstand sortiert
+        offsets = sorted(((dx, dy) for dx in range(-radius, radius + 1)
+                          for dy in range(-radius, radius + 1)),
+                         key=lambda offset: abs(offset[0]) + abs(offset[1]))
+        for dx, dy in offsets:
+            key = (cx + dx, cy + dy)
+            if key in self.chunks:
+                self.chunks.move_to_end(key)
+            elif built < budget:
+                self.chunk(*key)
+                built += 1
+        return built
+
+    def view_radius(self, max_distance) -> int:
+        """
+        view_radius gibt an, wie viele Kacheln ein Strahl in jede Richtung erreichen kann.
+
+        Args:
+            max_distance (float): größte Sichtweite in map_data Feldern, None für unbegrenzt.
+
+        Returns:
+            int: Radius für prefetch, mindestens 1 für die Bewegung. Ohne Sichtweite
+            können Strahlen beliebig weit reichen, dann füllt missing die Lücken.
+        """
+        if max_distance is None:
+            return 1
+        return max(1, math.ceil(max_distance / self.span))
+
+    def find_start(self) -> list[float]:
+        """
+        find_start gibt die Mitte der ersten Zelle der Kachel (0, 0) wieder.
+
+        Returns:
+            [float]: Reihe und Spalte der Start-Position.
+        """
+        return [1.5, 1.5]